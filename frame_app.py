@@ -1,9 +1,13 @@
 import sys
+from src import startup
+startup.install() # --startup-report: time imports from here on
+
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QColor, QPalette, QImageReader
 from PyQt6.QtCore import Qt
 
 from src.app import FrameApp
+startup.mark("imports done")
 
 if __name__ == "__main__":
     # Settings for high-res images
@@ -30,5 +34,7 @@ if __name__ == "__main__":
     app.setPalette(palette)
     
     window = FrameApp()
+    startup.mark("window constructed")
+    startup.watch_first_paint(window)
     window.showMaximized()
     sys.exit(app.exec())
\ No newline at end of file
@@ -1,9 +1,7 @@
 import os
-import ssl
 import math
-import json
+from contextlib import contextmanager
 from datetime import datetime
-from urllib.request import Request, urlopen
 
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QLabel, QPushButton, QFileDialog, QColorDialog,
@@ -11,30 +9,51 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QSizePolicy, QFormLayout, QButtonGroup, QStackedWidget, 
                              QScrollArea, QFrame, QMessageBox, QRadioButton, QInputDialog, QLineEdit,
                              QProgressBar, QApplication)
-from PyQt6.QtCore import Qt, QRectF, QPointF, QSize, QSettings, QTimer
+from PyQt6.QtCore import Qt, QRectF, QPointF, QSize, QSettings, QTimer, QUrl
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 from PyQt6.QtGui import (QPixmap, QPainter, QColor, QPen, QPdfWriter, QImage,
-                         QPolygonF, QFont, QImageReader, QPageSize, QAction, QKeySequence, QActionGroup)
+                         QPolygonF, QFont, QImageReader, QPageSize, QAction, QKeySequence, QActionGroup, QIcon)
 
 from .constants import (DEFAULT_MAT_COLOR, DEFAULT_FRAME_COLOR, DEFAULT_TEXTURE_PATH, 
-                        QUICK_MAT_COLORS, QUICK_FRAME_COLORS, RICK_ROLL_URL, RICK_ASCII)
+                        QUICK_MAT_COLORS, QUICK_FRAME_COLORS, RICK_ROLL_URL, RICK_ASCII,
+                        DEFAULT_IMAGE_PATH, APP_DATA_DIR)
 from .utils import UnitUtils, ColorUtils
 from .widgets import SourceCropper, InteractiveMatEditor, FramePreviewLabel, CollapsibleBox, MetricCard
-from .dialogs import (TextureSamplerDialog, TextureLibraryDialog, PresetManagerDialog, 
-                      GooglePhotosDialog, TutorialDialog, AboutDialog, PDFPreviewDialog)
+from .image_cache import image_cache, pixmap_key, load_budget_from_settings, load_source_pixmap
+from .export import crop_source, fit_to_print, set_dpi, plan_variants, export_variants, export_key_fields, output_key
+from .export_cache import export_cache, ExportCache, source_identity, image_digest, calc_fields
+
+def _dialogs():
+    """dialogs.py (and the Google Photos client behind it) is imported on first use, not at startup."""
+    from . import dialogs
+    return dialogs
 
 class FrameApp(QMainWindow):
+    # Parameter model for get_state/apply_state: state key -> widget attribute
+    STATE_SPINS = {'aperture_w': 'spin_iw', 'aperture_h': 'spin_ih', 'face': 'spin_face', 'rabbet': 'spin_rabbet',
+                   'p_border': 'spin_print_border', 'art_w': 'spin_art_w', 'art_h': 'spin_art_h',
+                   'mat_fixed_val': 'spin_fix_val', 'mat_gutter': 'spin_min_gutter', 'corner_radius': 'spin_radius'}
+    STATE_CHECKS = {'mat_match_opp': 'chk_link', 'link_all': 'chk_link_all', 'no_mat': 'chk_no_mat', 'rounded_corners': 'chk_radius'}
+    STATE_COMBOS = {'mat_fix_id': 'combo_fix', 'mat_align_id': 'combo_align', 'mat_ply_id': 'combo_mat_ply'}
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Pro Frame & Mat Studio v14.0")
         self.resize(1280, 800)
+        load_budget_from_settings()
         self.pixmap_full = None
         self.mat_color = QColor("#fbfbf9") # Cotton White Default
         self.frame_color = DEFAULT_FRAME_COLOR
-        self.frame_texture = QPixmap(DEFAULT_TEXTURE_PATH) if os.path.exists(DEFAULT_TEXTURE_PATH) else None
+        self.frame_texture = None # default walnut texture is loaded once the window is up (load_default_texture)
+        self.frame_texture_color = None # (average QColor, name) of frame_texture, worked out once per texture
+        self.frame_texture_levels = [] # pre-scaled copies from the texture catalog, largest first
+        self.frame_texture_tile = None # catalog's seamless tile for tiled rendering (built on demand otherwise)
+        self.frame_texture_path = None # library file the texture came from, if any (saved with projects)
         self.current_crop = QRectF(0,0,1,1)
         self.unit = "in"
         self.last_calc = {}
         self.updating_ui = False
+        self.batch_depth = 0 # > 0 inside batched_update(); recalc waits for the outermost batch to finish
         self.unit_inputs = [] 
         self.defaults_mode = False
         
@@ -42,48 +61,117 @@ class FrameApp(QMainWindow):
         self.defaults_mode = False
         self.current_project_path = None
         self.current_image_path = None
+        self.source_proxy = None # {'path', 'width', 'height'} of the original while pixmap_full is a project's embedded proxy
+        self.photo_fetch = None # background Google Photos download
+        self.photo_preview_key = None # cacheKey of the rendition shown while the original downloads
+        self.default_image_key = None # cacheKey of the startup placeholder art
+        self.palette_worker = None; self.palette_shown = None; self.palette_proxy = (None, None)
+        self.palette_timer = QTimer(self); self.palette_timer.setSingleShot(True); self.palette_timer.setInterval(300)
+        self.palette_timer.timeout.connect(self.update_palette)
         
         self.setup_menu()
         # Show tutorial if needed
-        TutorialDialog.show_if_needed(self)
+        if QSettings("MattG", "FrameTamer").value("startup/show_tutorial", True, type=bool):
+            _dialogs().TutorialDialog.show_if_needed(self)
         self.setup_ui()
         self.load_settings()
         self.load_rick_roll()
+        QTimer.singleShot(0, self.load_default_texture)
+
+    def load_default_texture(self):
+        """Decodes the default frame texture after first paint instead of before the window exists."""
+        if self.frame_texture is None and os.path.exists(DEFAULT_TEXTURE_PATH):
+            from .texture_library import load_texture
+            self.set_frame_texture(QPixmap.fromImage(load_texture(DEFAULT_TEXTURE_PATH)), self.catalog_record(DEFAULT_TEXTURE_PATH))
+            self.btn_extract_tex.setText("Update Frame Texture")
+            self.recalc()
 
     def load_settings(self):
         settings = QSettings("MattG", "FrameTamer")
-        self.updating_ui = True
-        
-        # Load numbers
-        self.spin_iw.setValue(float(settings.value("aperture_w", 16.0)))
-        self.spin_ih.setValue(float(settings.value("aperture_h", 20.0)))
-        self.spin_face.setValue(float(settings.value("face_w", 0.75)))
-        self.spin_rabbet.setValue(float(settings.value("rabbet_w", 0.25)))
-        self.spin_print_border.setValue(float(settings.value("print_border", 0.25)))
-        
-        # Load colors
         # Mat color always starts as Cotton White as per requirement
         self.mat_color = QColor("#fbfbf9") 
-        frame_col = settings.value("frame_color", DEFAULT_FRAME_COLOR.name())
-        self.frame_color = QColor(frame_col)
-        
-        # Load units
-        self.unit = settings.value("unit", "in")
+        self.apply_state({
+            'unit': settings.value("unit", "in"),
+            'aperture_w': settings.value("aperture_w", 16.0), 'aperture_h': settings.value("aperture_h", 20.0),
+            'face': settings.value("face_w", 0.75), 'rabbet': settings.value("rabbet_w", 0.25),
+            'p_border': settings.value("print_border", 0.25),
+            'colors': {'frame': settings.value("frame_color", DEFAULT_FRAME_COLOR.name())},
+            'mat_fix_id': settings.value("mat_fix_id", 0), 'mat_fixed_val': settings.value("mat_fixed_val", 2.0),
+            'mat_match_opp': settings.value("mat_match_opp", "true") == "true",
+            'mat_gutter': settings.value("mat_gutter", 0.125), 'mat_align_id': settings.value("mat_align_id", 0),
+            'rounded_corners': settings.value("rounded_corners", False, type=bool),
+            'corner_radius': settings.value("corner_radius", 0.25),
+            'texture_mode': settings.value("texture_mode", "tile"),
+        })
+
+    def state_widgets(self):
+        """Every widget whose signals feed recalc, i.e. the ones batched_update silences."""
+        return self.unit_inputs + [self.chk_link, self.chk_link_all, self.chk_no_mat, self.chk_radius, self.combo_fix,
+                                   self.combo_align, self.combo_mat_ply, self.combo_tex_mode, self.rb_driver_w, self.rb_driver_h]
+
+    @contextmanager
+    def batched_update(self):
+        """Groups parameter changes: widget signals are blocked and recalc (with its render) runs once at the end.
+
+        Nests; only the outermost batch syncs the dependent widgets and recalcs.
+        """
+        self.batch_depth += 1
+        blocked = [(w, w.blockSignals(True)) for w in self.state_widgets()] if self.batch_depth == 1 else []
+        try: yield
+        finally:
+            for w, was in blocked: w.blockSignals(was)
+            if self.batch_depth == 1: self.sync_dependent_ui()
+            self.batch_depth -= 1
+            if not self.batch_depth: self.recalc()
+
+    def sync_dependent_ui(self):
+        """Widget state that normally follows from the signals a batch blocks."""
+        self.spin_radius.setEnabled(self.chk_radius.isChecked())
+        no_mat = self.chk_no_mat.isChecked()
+        for s in [self.spin_mat_t, self.spin_mat_b, self.spin_mat_l, self.spin_mat_r, self.chk_link_all]: s.setEnabled(not no_mat)
         step_size = 2.0 if self.unit == "mm" else 0.125
         for s in self.unit_inputs: s.setSingleStep(step_size)
-        
-        # Load Mat Rules
-        self.combo_fix.setCurrentIndex(int(settings.value("mat_fix_id", 0)))
-        self.spin_fix_val.setValue(float(settings.value("mat_fixed_val", 2.0)))
-        self.chk_link.setChecked(settings.value("mat_match_opp", "true") == "true")
-        self.spin_min_gutter.setValue(float(settings.value("mat_gutter", 0.125)))
-        self.combo_align.setCurrentIndex(int(settings.value("mat_align_id", 0)))
-        
-        self.chk_radius.setChecked(settings.value("rounded_corners", False, type=bool))
-        self.spin_radius.setValue(float(settings.value("corner_radius", 0.25)))
-        
-        self.updating_ui = False
-        self.recalc()
+        self.update_ui_visibility() # its recalc is deferred to the end of the batch
+
+    def get_state(self):
+        """The whole parameter model as a plain dict, lengths in self.unit; apply_state takes it back."""
+        c = self.current_crop
+        state = {
+            'unit': self.unit, 'mode': "frame" if self.act_mode_frame.isChecked() else "art",
+            'mat': [self.spin_mat_t.value(), self.spin_mat_b.value(), self.spin_mat_l.value(), self.spin_mat_r.value()],
+            'colors': {'mat': self.mat_color.name(), 'frame': self.frame_color.name()},
+            'crop': [c.x(), c.y(), c.width(), c.height()],
+            'texture_mode': self.combo_tex_mode.currentData(), 'driver': "h" if self.rb_driver_h.isChecked() else "w",
+        }
+        state.update({k: getattr(self, a).value() for k, a in self.STATE_SPINS.items()})
+        state.update({k: getattr(self, a).isChecked() for k, a in self.STATE_CHECKS.items()})
+        state.update({k: getattr(self, a).currentIndex() for k, a in self.STATE_COMBOS.items()})
+        return state
+
+    def apply_state(self, state):
+        """Applies any subset of get_state() as one batch: a single recalc and render however many values change.
+
+        Values are taken as they are, in state['unit'] (or the current unit); nothing is converted.
+        """
+        with self.batched_update():
+            if 'unit' in state: self.unit = "mm" if state['unit'] == "mm" else "in"
+            if 'mode' in state: (self.act_mode_art if state['mode'] == "art" else self.act_mode_frame).setChecked(True)
+            for key, name in self.STATE_SPINS.items():
+                if key in state: getattr(self, name).setValue(float(state[key]))
+            for key, name in self.STATE_CHECKS.items():
+                if key in state: getattr(self, name).setChecked(bool(state[key]))
+            for key, name in self.STATE_COMBOS.items():
+                if key in state: getattr(self, name).setCurrentIndex(int(state[key]))
+            if 'mat' in state:
+                for s, v in zip([self.spin_mat_t, self.spin_mat_b, self.spin_mat_l, self.spin_mat_r], state['mat']): s.setValue(float(v))
+            if 'texture_mode' in state: self.combo_tex_mode.setCurrentIndex(max(0, self.combo_tex_mode.findData(state['texture_mode'])))
+            if 'driver' in state: (self.rb_driver_h if state['driver'] == "h" else self.rb_driver_w).setChecked(True)
+            cols = state.get('colors', {})
+            if cols.get('mat'): self.mat_color = QColor(cols['mat'])
+            if cols.get('frame'): self.frame_color = QColor(cols['frame'])
+            if 'crop' in state:
+                self.current_crop = QRectF(*state['crop'])
+                if self.pixmap_full: self.editor_cropper.crop_norm = QRectF(self.current_crop); self.editor_cropper.update()
 
     def closeEvent(self, event):
         settings = QSettings("MattG", "FrameTamer")
@@ -97,6 +185,9 @@ class FrameApp(QMainWindow):
         settings.setValue("unit", self.unit)
         settings.setValue("rounded_corners", self.chk_radius.isChecked())
         settings.setValue("corner_radius", self.spin_radius.value())
+        settings.setValue("texture_mode", self.combo_tex_mode.currentData())
+        self.cancel_photo_fetch()
+        if self.palette_worker: self.palette_worker.wait()
         super().closeEvent(event)
 
     def setup_menu(self):
@@ -160,21 +251,23 @@ class FrameApp(QMainWindow):
         # Help
         help_menu = menubar.addMenu("Help")
         act_tutorial = QAction("Show Tutorial", self)
-        act_tutorial.triggered.connect(lambda: TutorialDialog(self).exec())
+        act_tutorial.triggered.connect(lambda: _dialogs().TutorialDialog(self).exec())
         help_menu.addAction(act_tutorial)
+
+        act_cache = QAction("Image Cache...", self)
+        act_cache.triggered.connect(lambda: _dialogs().ImageCacheDialog(self).exec())
+        help_menu.addAction(act_cache)
         
         act_about = QAction("About", self)
-        act_about.triggered.connect(lambda: AboutDialog(self).exec())
+        act_about.triggered.connect(lambda: _dialogs().AboutDialog(self).exec())
         help_menu.addAction(act_about)
 
     def new_project(self):
         self.current_project_path = None
-        self.defaults_mode = True # Suppress updates
-        self.spin_iw.setValue(16.0); self.spin_ih.setValue(20.0)
-        self.spin_face.setValue(0.75); self.spin_rabbet.setValue(0.25); self.spin_print_border.setValue(0.25)
-        self.current_crop = QRectF(0,0,1,1); self.pixmap_full = None; self.frame_texture = None
-        self.editor_cropper.set_image(None); self.editor_mat.set_image(None); self.preview.setPixmap(QPixmap())
-        self.defaults_mode = False; self.recalc()
+        with self.batched_update():
+            self.apply_state({'aperture_w': 16.0, 'aperture_h': 20.0, 'face': 0.75, 'rabbet': 0.25, 'p_border': 0.25})
+            self.current_crop = QRectF(0,0,1,1); self.pixmap_full = None; self.source_proxy = None; self.set_frame_texture(None)
+            self.editor_cropper.set_image(None); self.editor_mat.set_image(None); self.preview.setPixmap(QPixmap())
         self.setWindowTitle("Pro Frame & Mat Studio v14.0 - New Project")
 
     def save_project(self):
@@ -190,22 +283,17 @@ class FrameApp(QMainWindow):
             self.setWindowTitle(f"Pro Frame & Mat Studio v14.0 - {os.path.basename(path)}")
 
     def _do_save(self, path):
-        data = {
-            "version": "14.0",
-            "unit": self.unit,
-            "mode": "frame" if self.act_mode_frame.isChecked() else "art",
-            "dimensions": {
-                "aperture_w": self.spin_iw.value(), "aperture_h": self.spin_ih.value(),
-                "face": self.spin_face.value(), "rabbet": self.spin_rabbet.value(), "p_border": self.spin_print_border.value(),
-                "mat": [self.spin_mat_t.value(), self.spin_mat_b.value(), self.spin_mat_l.value(), self.spin_mat_r.value()]
-            },
-            "colors": {"mat": self.mat_color.name(), "frame": self.frame_color.name()},
-            "image_path": self.editor_cropper.params.get('pixmap_source_path', "") # Need to store source path!
-        }
-        # Note: Storing full texture implies serializing pixmap or saving separate files.
-        # For MVP, we skip texture persistence or rely on re-loading image.
-        try:
-            with open(path, 'w') as f: json.dump(data, f, indent=2)
+        from . import project_file
+        data = {"app_version": "14.0", "state": self.get_state(), "source": None,
+                "texture": {"library": self.frame_texture_path} if self.frame_texture else None}
+        images = {'texture': self.frame_texture.toImage() if self.frame_texture else None}
+        if self.pixmap_full is not None and self.pixmap_full.cacheKey() != self.default_image_key:
+            data["source"] = self.source_proxy or {"path": self.current_image_path or "",
+                                                   "width": self.pixmap_full.width(), "height": self.pixmap_full.height()}
+            images['proxy'] = project_file.make_proxy(self.pixmap_full.toImage())
+        preview = self.preview.pixmap()
+        if preview is not None and not preview.isNull(): images['thumbnail'] = project_file.make_thumbnail(preview.toImage())
+        try: project_file.write(path, data, images)
         except Exception as e: QMessageBox.critical(self, "Save Error", str(e))
 
     def open_project(self):
@@ -213,40 +301,46 @@ class FrameApp(QMainWindow):
         if path: self.load_project(path)
 
     def load_project(self, path):
+        """Opens a v2 container (rendered from its embedded proxy; the original is read at export) or a v1 file."""
+        from . import project_file
         try:
-            with open(path, 'r') as f: data = json.load(f)
+            data, images = project_file.read(path)
+            source = data.get("source") or {}
+            with self.batched_update(): # one recalc and one render for the whole project
+                if images.get('proxy'):
+                    self.set_image(QPixmap.fromImage(images['proxy']), source.get("path", ""))
+                    self.source_proxy = source
+                elif source.get("path") and os.path.exists(source["path"]):
+                    pm = load_source_pixmap(source["path"])
+                    if not pm.isNull(): self.set_image(pm, source["path"])
+                if "texture" in data: # v1 files never stored one; keep whatever is loaded
+                    tex = images.get('texture')
+                    lib = (data["texture"] or {}).get("library")
+                    record = self.catalog_record(lib) if tex and lib and os.path.exists(lib) else None
+                    self.set_frame_texture(QPixmap.fromImage(tex) if tex else None, record)
+                    self.btn_extract_tex.setText("Texture Loaded" if tex else "Extract Frame Texture")
+                self.apply_state(data.get("state", {}))
             
-            self.defaults_mode = True
-            if data.get("unit") == "mm": 
-                self.unit = "mm"
-                for s in self.unit_inputs: s.setSingleStep(2.0)
-            else: 
-                self.unit = "in"
-                for s in self.unit_inputs: s.setSingleStep(0.125)
-            
-            if data.get("mode") == "art": self.act_mode_art.setChecked(True)
-            else: self.act_mode_frame.setChecked(True)
-            
-            dims = data.get("dimensions", {})
-            self.spin_iw.setValue(dims.get("aperture_w", 16))
-            self.spin_ih.setValue(dims.get("aperture_h", 20))
-            self.spin_face.setValue(dims.get("face", 0.75))
-            
-            cols = data.get("colors", {})
-            if cols.get("mat"): self.mat_color = QColor(cols["mat"])
-            if cols.get("frame"): self.frame_color = QColor(cols["frame"])
-            
-            img_path = data.get("image_path", "")
-            if img_path and os.path.exists(img_path):
-                pm = QPixmap(img_path)
-                if not pm.isNull(): self.set_image(pm, img_path)
-            
-            self.defaults_mode = False; self.recalc()
             self.current_project_path = path
             self.add_recent_project(path)
             self.setWindowTitle(f"Pro Frame & Mat Studio v14.0 - {os.path.basename(path)}")
         except Exception as e: QMessageBox.critical(self, "Load Error", str(e))
 
+    def ensure_original(self):
+        """Before an export, swaps a project's embedded proxy for the original file; False if the export should stop."""
+        if not self.source_proxy: return True
+        path = self.source_proxy.get("path")
+        self.lbl_status.setText("Loading original..."); QApplication.processEvents()
+        pm = load_source_pixmap(path) if path and os.path.exists(path) else QPixmap()
+        self.lbl_status.setText("Ready")
+        if pm.isNull():
+            ans = QMessageBox.question(self, "Original Not Found",
+                f"The original image could not be loaded:\n{path}\n\nExport from the preview-resolution copy saved in the project "
+                f"({self.pixmap_full.width()}x{self.pixmap_full.height()}) instead?")
+            return ans == QMessageBox.StandardButton.Yes
+        self.source_proxy = None; self.swap_source(pm, path)
+        return True
+
     def add_recent_project(self, path):
         settings = QSettings("MattG", "FrameTamer")
         recent = settings.value("recent_projects", [])
@@ -257,12 +351,15 @@ class FrameApp(QMainWindow):
         self.update_recent_menu()
 
     def update_recent_menu(self):
+        from . import project_file
         self.menu_recent.clear()
         settings = QSettings("MattG", "FrameTamer")
         recent = settings.value("recent_projects", [])
         for p in recent:
             if os.path.exists(p):
                 a = QAction(os.path.basename(p), self)
+                thumb = project_file.read_thumbnail(p)
+                if thumb: a.setIcon(QIcon(QPixmap.fromImage(thumb)))
                 a.triggered.connect(lambda checked, p=p: self.load_project(p))
                 self.menu_recent.addAction(a)
 
@@ -270,8 +367,8 @@ class FrameApp(QMainWindow):
         target = "mm" if self.unit == "in" else "in"
         self.convert_to_unit(target)
 
-    def open_tutorial(self): TutorialDialog(self).show()
-    def open_about(self): AboutDialog(self).show()
+    def open_tutorial(self): _dialogs().TutorialDialog(self).show()
+    def open_about(self): _dialogs().AboutDialog(self).show()
 
     def setup_ui(self):
         central = QWidget(); self.setCentralWidget(central)
@@ -329,6 +426,11 @@ class FrameApp(QMainWindow):
         btn_jpg.clicked.connect(self.export_jpg) # To be implemented
         layout.addWidget(btn_jpg)
 
+        btn_set = QPushButton("Export Set...")
+        btn_set.setStyleSheet("background-color: #0b5a0b; font-weight: bold; padding: 6px 12px; border-radius: 4px; color: white;")
+        btn_set.clicked.connect(self.export_set)
+        layout.addWidget(btn_set)
+
         parent_layout.addWidget(export_panel)
 
     def setup_status_bar(self, parent_layout):
@@ -361,6 +463,12 @@ class FrameApp(QMainWindow):
         self.progress_bar.hide()
         layout.addWidget(self.progress_bar)
 
+        self.btn_cancel_download = QPushButton("Cancel")
+        self.btn_cancel_download.setFixedHeight(18)
+        self.btn_cancel_download.clicked.connect(self.cancel_photo_fetch)
+        self.btn_cancel_download.hide()
+        layout.addWidget(self.btn_cancel_download)
+
         parent_layout.addWidget(self.status_panel)
 
     def setup_controls_content(self):
@@ -467,6 +575,9 @@ class FrameApp(QMainWindow):
         h_col = QHBoxLayout(); 
         v_mc = QVBoxLayout(); b_mc = QPushButton("Mat Color"); b_mc.clicked.connect(self.pick_mat)
         v_mc.addWidget(b_mc); self._add_quick_swatches(v_mc, QUICK_MAT_COLORS, True)
+        # Mats suggested from the artwork's dominant colors (filled in by update_palette)
+        self.suggest_row = QHBoxLayout(); self.suggest_row.setSpacing(2); self.suggest_row.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        v_mc.addLayout(self.suggest_row)
         
         v_fc = QVBoxLayout(); b_fc = QPushButton("Frame Color"); b_fc.clicked.connect(self.pick_frame)
         v_fc.addWidget(b_fc); self._add_quick_swatches(v_fc, QUICK_FRAME_COLORS, False)
@@ -479,6 +590,12 @@ class FrameApp(QMainWindow):
         self.btn_extract_tex = QPushButton(tex_label); self.btn_extract_tex.clicked.connect(self.load_frame_texture)
         self.btn_lib_tex = QPushButton("Frame Texture Library"); self.btn_lib_tex.clicked.connect(self.select_from_library)
         v_tex.addWidget(self.btn_extract_tex); v_tex.addWidget(self.btn_lib_tex)
+        h_tex_mode = QHBoxLayout(); h_tex_mode.addWidget(QLabel("Texture:"))
+        self.combo_tex_mode = QComboBox()
+        self.combo_tex_mode.addItem("Tile (true scale)", "tile"); self.combo_tex_mode.addItem("Stretch", "stretch")
+        self.combo_tex_mode.setToolTip("Tile repeats the sample along each side at its real size; Stretch spreads one sample over the whole side")
+        self.combo_tex_mode.currentIndexChanged.connect(self.recalc)
+        h_tex_mode.addWidget(self.combo_tex_mode, 1); v_tex.addLayout(h_tex_mode)
         l_app.addLayout(v_tex)
 
         l_mat_info = QFormLayout()
@@ -549,6 +666,7 @@ class FrameApp(QMainWindow):
         if not self.pixmap_full:
             QMessageBox.warning(self, "No Image", "Please load an image to export.")
             return
+        if not self.ensure_original(): return
 
         d = self.last_calc
         dpi = int(self.combo_dpi.currentText())
@@ -568,44 +686,70 @@ class FrameApp(QMainWindow):
         
         print(f"Exporting for print: {d['print_w']}\" x {d['print_h']}\" @ {dpi} DPI ({w_px}x{h_px} px)")
 
-        # Get the source image and crop it
-        # self.current_crop is a QRectF in normalized coordinates (0-1)
-        src_pixmap = self.pixmap_full
-        src_w, src_h = src_pixmap.width(), src_pixmap.height()
-        
-        crop_rect = d['crop_rect']
-        real_crop = QRectF(
-            crop_rect.x() * src_w,
-            crop_rect.y() * src_h,
-            crop_rect.width() * src_w,
-            crop_rect.height() * src_h
-        ).toRect()
-        
-        cropped_img = src_pixmap.copy(real_crop).toImage()
-        
-        # Scale to print size
-        # We want to fill the target dimensions. Since the aspect ratio of print_w/print_h
-        # should match the crop aspect ratio (if recalc did its job), we just scale.
-        final_img = cropped_img.scaled(w_px, h_px, Qt.AspectRatioMode.KeepAspectRatioByExpanding, Qt.TransformationMode.SmoothTransformation)
-        
-        # If there's a minor discrepancy, center-crop to exact pixels
-        if final_img.width() != w_px or final_img.height() != h_px:
-            final_img = final_img.copy(
-                (final_img.width() - w_px) // 2,
-                (final_img.height() - h_px) // 2,
-                w_px, h_px
-            )
-
-        # Set DPI metadata (dots per meter)
-        dpm = int(dpi / 0.0254)
-        final_img.setDotsPerMeterX(dpm)
-        final_img.setDotsPerMeterY(dpm)
+        # Unchanged source/crop/size/DPI: reuse the previous render
+        key = output_key(export_key_fields(self.current_image_path, d['crop_rect'], d['print_w'], d['print_h']), w_px, h_px, dpi, "JPG", 95)
+        if export_cache().fetch(key, fn):
+            QMessageBox.information(self, "Export Complete", f"Print-ready image saved to:\n{fn}\n\nDimensions: {w_px} x {h_px} pixels (from export cache)")
+            return
+
+        # Crop (normalized self.current_crop) and scale to fill the print size
+        cropped_img = crop_source(self.pixmap_full, d['crop_rect'])
+        final_img = set_dpi(fit_to_print(cropped_img, w_px, h_px), dpi)
 
         if final_img.save(fn, "JPG", 95):
+            export_cache().store(key, fn)
             QMessageBox.information(self, "Export Complete", f"Print-ready image saved to:\n{fn}\n\nDimensions: {w_px} x {h_px} pixels")
         else:
             QMessageBox.critical(self, "Export Failed", "Could not save JPEG file.")
 
+    def export_set(self):
+        if not self.last_calc:
+            QMessageBox.warning(self, "No Project", "Please perform a calculation first.")
+            return
+        if not self.pixmap_full:
+            QMessageBox.warning(self, "No Image", "Please load an image to export.")
+            return
+
+        dpi_options = [self.combo_dpi.itemText(i) for i in range(self.combo_dpi.count())]
+        dlg = _dialogs().ExportSetDialog(dpi_options, self.combo_dpi.currentText(), self)
+        if not dlg.exec(): return
+        opts = dlg.get_options()
+        if not opts['dpis'] and not opts['web_long_edge']: return
+        if not opts['formats']: return
+
+        out_dir = QFileDialog.getExistingDirectory(self, "Export Set To Folder")
+        if not out_dir: return
+        if not self.ensure_original(): return
+
+        d = self.last_calc
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        base_name = f"Print_Ready_Art_{d['print_w']:.1f}x{d['print_h']:.1f}_{ts}"
+        targets = plan_variants(d['print_w'], d['print_h'], opts['dpis'], opts['web_long_edge'])
+
+        self.lbl_status.setText("Exporting set...")
+        self.progress_bar.setValue(0); self.progress_bar.show()
+        QApplication.processEvents()
+
+        def on_progress(frac, path):
+            self.progress_bar.setValue(int(frac * 100))
+            self.lbl_status.setText(f"Saved {os.path.basename(path)}")
+            QApplication.processEvents()
+
+        # One decode + crop shared by every variant, skipped entirely if all outputs are cached
+        key_fields = export_key_fields(self.current_image_path, d['crop_rect'], d['print_w'], d['print_h'])
+        written = export_variants(lambda: crop_source(self.pixmap_full, d['crop_rect']), targets, opts['formats'],
+                                  out_dir, base_name, opts['quality'], on_progress, export_cache(), key_fields)
+        self.progress_bar.hide()
+
+        failed = [p for p, ok in written if not ok]
+        saved = [os.path.basename(p) for p, ok in written if ok]
+        self.lbl_status.setText(f"Exported {len(saved)} files")
+        QTimer.singleShot(3000, lambda: self.lbl_status.setText("Ready"))
+        if failed:
+            QMessageBox.warning(self, "Export Set", "Some files could not be saved:\n" + "\n".join(failed))
+        else:
+            QMessageBox.information(self, "Export Complete", f"Saved {len(saved)} files to:\n{out_dir}\n\n" + "\n".join(saved))
+
     def _create_spin(self, val):
         s = QDoubleSpinBox(); s.setRange(0, 99999); s.setDecimals(3); s.setValue(val); 
         s.setSingleStep(0.125) # Default 1/8"
@@ -634,10 +778,48 @@ class FrameApp(QMainWindow):
             self.mat_color = QColor(hex_str)
         else:
             self.frame_color = QColor(hex_str)
-            self.frame_texture = None
+            self.set_frame_texture(None)
             self.btn_extract_tex.setText("Extract Texture")
         self.recalc()
 
+    def update_palette(self):
+        """Shows mat suggestions for the current image + crop, from cache or a background analysis."""
+        if self.pixmap_full is None or self.pixmap_full.isNull(): return
+        from . import palette # numpy-backed; imported on first use
+        key = palette.cache_key(pixmap_key(self.pixmap_full), self.current_crop)
+        if key == self.palette_shown: return
+        result = palette.cached(key)
+        if result is not None: self.show_palette(key, result); return
+        if self.palette_worker and self.palette_worker.isRunning(): return # re-checked when it finishes
+
+        if self.palette_proxy[0] != key[0]: self.palette_proxy = (key[0], palette.make_proxy(self.pixmap_full))
+        self.palette_worker = palette.PaletteWorker(key, self.palette_proxy[1], self.current_crop)
+        self.palette_worker.ready.connect(self.on_palette_ready)
+        self.palette_worker.finished.connect(self.update_palette) # crop may have moved on meanwhile
+        self.palette_worker.start()
+
+    def on_palette_ready(self, key, result):
+        from . import palette
+        palette.remember(key, result)
+        if key == palette.cache_key(pixmap_key(self.pixmap_full), self.current_crop): self.show_palette(key, result)
+
+    def show_palette(self, key, result):
+        self.palette_shown = key
+        while self.suggest_row.count():
+            w = self.suggest_row.takeAt(0).widget()
+            if w: w.deleteLater()
+        if not result['mats']: return
+        lbl = QLabel("Suggested:"); lbl.setStyleSheet("color: #888; font-size: 10px;")
+        self.suggest_row.addWidget(lbl)
+        for name, col, weight in result['mats']:
+            btn = QPushButton()
+            btn.setFixedSize(22, 22)
+            btn.setCursor(Qt.CursorShape.PointingHandCursor)
+            btn.setToolTip(f"{name} (echoes {weight:.0%} of the artwork)")
+            btn.setStyleSheet(f"background-color: {col.name()}; border: 1px dashed #888; border-radius: 4px;")
+            btn.clicked.connect(lambda _, c=col.name(): self._apply_quick_color(c, True))
+            self.suggest_row.addWidget(btn)
+
     def setup_visualization_area(self, parent_layout):
         src_wid = QWidget(); src_l = QVBoxLayout(src_wid); src_l.setContentsMargins(0, 20, 0, 0)
         lbl_src = QLabel("<b>Source / Mat Editor</b>"); lbl_src.setMinimumWidth(200)
@@ -662,49 +844,55 @@ class FrameApp(QMainWindow):
         parent_layout.addWidget(src_wid, 1); parent_layout.addWidget(res_wid, 1)
 
     def load_rick_roll(self):
-        fn = "rick_default.png"
-        print(f"Loading/Downloading default image to: {fn}")
-        
-        # If it's zero size, it's definitely bad
-        if os.path.exists(fn) and os.path.getsize(fn) == 0: 
-            os.remove(fn)
-            
-        if not os.path.exists(fn):
-            try:
-                print("Attempting to download Rick Roll thumbnail...")
-                ctx = ssl.create_default_context(); ctx.check_hostname = False; ctx.verify_mode = ssl.CERT_NONE
-                req = Request(RICK_ROLL_URL, headers={'User-Agent': 'Mozilla/5.0'})
-                with urlopen(req, context=ctx) as u, open(fn, 'wb') as f: 
-                    f.write(u.read())
-                print("Download successful.")
-            except Exception as e:
-                print(f"Download failed: {e}. Generating ASCII fallback...")
-                pm = QPixmap(800, 600); pm.fill(QColor(20, 20, 20)); p = QPainter(pm)
-                font = QFont("Consolas", 14); font.setStyleHint(QFont.StyleHint.Monospace)
-                p.setFont(font); p.setPen(QColor(0, 255, 0))
-                p.drawText(QRectF(0,0,800,600), Qt.AlignmentFlag.AlignCenter, RICK_ASCII)
-                p.end()
-                pm.save(fn)
-                print("ASCII fallback generated and saved.")
-
-        if os.path.exists(fn):
-            pm = QPixmap(fn)
-            if pm.isNull():
-                print(f"Corrupted image found at {fn}. Deleting and using direct ASCII render.")
-                os.remove(fn)
-                # Render directly to self.pixmap_full instead of saving to file if download failed badly
-                self.pixmap_full = QPixmap(800, 600); self.pixmap_full.fill(QColor(20, 20, 20))
-                p = QPainter(self.pixmap_full)
-                font = QFont("Consolas", 14); font.setStyleHint(QFont.StyleHint.Monospace)
-                p.setFont(font); p.setPen(QColor(0, 255, 0))
-                p.drawText(QRectF(0,0,800,600), Qt.AlignmentFlag.AlignCenter, RICK_ASCII)
-                p.end()
-            else:
-                self.pixmap_full = pm
-
-            self.editor_cropper.set_image(self.pixmap_full)
-            self.editor_mat.set_image(self.pixmap_full)
-            self.recalc_aspect()
+        """Shows the default art without touching the network.
+
+        Uses the thumbnail fetched on an earlier run if there is one, otherwise the
+        bundled asset; the thumbnail itself is fetched in the background.
+        """
+        cached = os.path.join(APP_DATA_DIR, "rick_default.jpg")
+        pm = load_source_pixmap(cached) if os.path.exists(cached) and os.path.getsize(cached) > 0 else QPixmap()
+        if pm.isNull(): pm = load_source_pixmap(DEFAULT_IMAGE_PATH)
+        if pm.isNull(): pm = self.render_ascii_default()
+        self.show_default_image(pm)
+        if not os.path.exists(cached) and QSettings("MattG", "FrameTamer").value("startup/fetch_default_image", True, type=bool):
+            self.fetch_default_image(cached)
+
+    def show_default_image(self, pm):
+        self.pixmap_full = pm; self.source_proxy = None
+        self.default_image_key = pm.cacheKey()
+        self.editor_cropper.set_image(self.pixmap_full)
+        self.editor_mat.set_image(self.pixmap_full)
+        self.recalc_aspect()
+
+    def render_ascii_default(self):
+        pm = QPixmap(800, 600); pm.fill(QColor(20, 20, 20)); p = QPainter(pm)
+        font = QFont("Consolas", 14); font.setStyleHint(QFont.StyleHint.Monospace)
+        p.setFont(font); p.setPen(QColor(0, 255, 0))
+        p.drawText(QRectF(0,0,800,600), Qt.AlignmentFlag.AlignCenter, RICK_ASCII)
+        p.end()
+        return pm
+
+    def fetch_default_image(self, dest):
+        """Downloads the default thumbnail on Qt's network thread; never blocks the event loop."""
+        self.net = QNetworkAccessManager(self)
+        req = QNetworkRequest(QUrl(RICK_ROLL_URL))
+        req.setHeader(QNetworkRequest.KnownHeaders.UserAgentHeader, "Mozilla/5.0")
+        req.setTransferTimeout(10000)
+        reply = self.net.get(req)
+        reply.finished.connect(lambda: self.on_default_image_fetched(reply, dest))
+
+    def on_default_image_fetched(self, reply, dest):
+        reply.deleteLater()
+        if reply.error() != QNetworkReply.NetworkError.NoError:
+            print(f"Default image fetch skipped: {reply.errorString()}"); return
+        data = bytes(reply.readAll())
+        img = QImage.fromData(data)
+        if img.isNull(): return
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        with open(dest, 'wb') as f: f.write(data)
+        # Only swap if the user is still looking at the placeholder
+        if self.pixmap_full is not None and self.pixmap_full.cacheKey() == self.default_image_key:
+            self.show_default_image(QPixmap.fromImage(img))
 
     # --- LOGIC ---
     def update_ui_visibility(self):
@@ -767,11 +955,8 @@ class FrameApp(QMainWindow):
         name = self.combo_presets.currentText()
         settings = QSettings("MattG", "FrameTamer"); presets = settings.value("presets", {})
         if name in presets:
-            v = presets[name]; self.updating_ui = True
-            self.spin_iw.setValue(float(v.get('w', 16)))
-            self.spin_ih.setValue(float(v.get('h', 20)))
-            self.spin_rabbet.setValue(float(v.get('r', 0.25)))
-            self.updating_ui = False; self.recalc()
+            v = presets[name]
+            self.apply_state({'aperture_w': v.get('w', 16), 'aperture_h': v.get('h', 20), 'rabbet': v.get('r', 0.25)})
 
     def save_preset(self):
         name, ok = QInputDialog.getText(self, "Save Preset", "Preset Name:")
@@ -782,7 +967,7 @@ class FrameApp(QMainWindow):
             settings.setValue("presets", presets); self.refresh_preset_list()
 
     def manage_presets(self):
-        if PresetManagerDialog(self).exec(): self.refresh_preset_list()
+        if _dialogs().PresetManagerDialog(self).exec(): self.refresh_preset_list()
 
     def toggle_no_mat(self):
         is_no = self.chk_no_mat.isChecked()
@@ -837,52 +1022,123 @@ class FrameApp(QMainWindow):
     def import_image(self):
         path, _ = QFileDialog.getOpenFileName(self, "Open Image", "", "Images (*.png *.jpg *.jpeg)")
         if path: 
-            pm = QPixmap(path)
+            pm = load_source_pixmap(path)
             if not pm.isNull(): self.set_image(pm, path)
             else: QMessageBox.warning(self, "Error", "Failed to load image.")
 
     def load_from_google_photos(self):
-        dlg = GooglePhotosDialog(self)
-        if dlg.exec():
-            pix = dlg.get_selected_image()
-            if pix and not pix.isNull():
-                self.set_image(pix, "") # No local path
-            elif pix:
-                QMessageBox.warning(self, "Error", "Failed to load photo from Google.")
+        # Let the browser filter for photos that suit the current opening and print size
+        frame_aspect = min_pixels = None
+        if self.last_calc and self.last_calc['img_h'] > 0:
+            d = self.last_calc; dpi = int(self.combo_dpi.currentText())
+            frame_aspect = d['img_w'] / d['img_h']
+            min_pixels = (int(d['img_w'] * dpi), int(d['img_h'] * dpi))
+        dlg = _dialogs().GooglePhotosDialog(self, frame_aspect, min_pixels)
+        if not dlg.exec(): return
+        media_id = dlg.get_selected_media_id()
+        if not media_id: return
+        self.cancel_photo_fetch()
+        self.photo_preview_key = None
+
+        # Screen-size rendition first, then the original streams in the background and replaces it
+        self.photo_fetch = _dialogs().PhotoFetchWorker(dlg.manager, media_id)
+        self.photo_fetch.preview_ready.connect(self.on_photo_preview)
+        self.photo_fetch.progress.connect(self.on_photo_progress)
+        self.photo_fetch.original_ready.connect(self.on_photo_original)
+        self.photo_fetch.error.connect(self.on_photo_fetch_error)
+        self.photo_fetch.finished.connect(self.on_photo_fetch_done)
+        self.lbl_status.setText("Fetching photo...")
+        self.progress_bar.setValue(0); self.progress_bar.show(); self.btn_cancel_download.show()
+        self.photo_fetch.start()
+
+    def on_photo_preview(self, img):
+        if img.isNull(): QMessageBox.warning(self, "Error", "Failed to load photo from Google."); return
+        self.set_image(QPixmap.fromImage(img), "") # No local path until the original arrives
+        self.photo_preview_key = self.pixmap_full.cacheKey()
+        self.lbl_status.setText("Downloading full-resolution original...")
+
+    def on_photo_progress(self, received, total):
+        if total: self.progress_bar.setValue(int(received * 100 / total))
+        self.lbl_status.setText(f"Downloading original... {received / 1048576:.1f} / {total / 1048576:.1f} MB")
+
+    def on_photo_original(self, path):
+        pm = load_source_pixmap(path)
+        if pm.isNull(): QMessageBox.warning(self, "Error", "Downloaded original could not be decoded."); return
+        if self.photo_preview_key is None: self.set_image(pm, path) # original was already on disk
+        elif self.pixmap_full is not None and self.pixmap_full.cacheKey() == self.photo_preview_key: self.swap_source(pm, path)
+        else: return # another image was loaded meanwhile; the original stays on disk for next time
+        self.lbl_status.setText(f"Original loaded ({pm.width()}x{pm.height()})")
+        QTimer.singleShot(3000, lambda: self.lbl_status.setText("Ready"))
+
+    def on_photo_fetch_error(self, err_msg):
+        self.lbl_status.setText("Ready")
+        QMessageBox.warning(self, "Download Error", f"Could not download photo: {err_msg}")
+
+    def on_photo_fetch_done(self):
+        self.progress_bar.hide(); self.btn_cancel_download.hide()
+        if self.photo_fetch and self.photo_fetch._cancelled: self.lbl_status.setText("Download paused (will resume next time)")
+
+    def cancel_photo_fetch(self):
+        if self.photo_fetch and self.photo_fetch.isRunning():
+            self.photo_fetch.cancel(); self.photo_fetch.wait()
+
+    def swap_source(self, pixmap, path):
+        """Replaces the source with a higher-resolution copy of the same image, keeping the crop."""
+        crop = self.editor_cropper.crop_norm
+        self.pixmap_full = pixmap; self.current_image_path = path
+        self.editor_cropper.set_image(pixmap); self.editor_cropper.crop_norm = crop; self.editor_cropper.refresh_display()
+        self.editor_mat.set_image(pixmap); self.recalc()
 
     def set_image(self, pixmap, path=None):
-        self.pixmap_full = pixmap
+        self.pixmap_full = pixmap; self.source_proxy = None
         if path is not None: self.current_image_path = path
         self.editor_cropper.set_image(self.pixmap_full); self.editor_mat.set_image(self.pixmap_full)
         self.current_crop = QRectF(0,0,1,1); self.recalc_aspect()
 
     def load_frame_texture(self):
-        dlg = TextureSamplerDialog(self)
+        dlg = _dialogs().TextureSamplerDialog(self)
         if dlg.exec():
             tex = dlg.get_texture()
             if tex: 
-                self.frame_texture = tex
+                self.set_frame_texture(tex)
                 self.btn_extract_tex.setText("Texture Loaded")
                 self.recalc()
 
     def select_from_library(self):
-        dlg = TextureLibraryDialog(self)
+        dlg = _dialogs().TextureLibraryDialog(self)
         if dlg.exec():
             tex = dlg.get_selected_texture()
             if tex:
-                self.frame_texture = tex
+                self.set_frame_texture(tex, self.catalog_record(dlg.get_selected_path()))
                 self.btn_extract_tex.setText("Texture Loaded")
                 self.recalc()
 
+    def catalog_record(self, path):
+        """Texture catalog entry for a library file (created on first use), or None if unavailable."""
+        from .texture_library import texture_catalog
+        try: return texture_catalog().ensure(path) if path else None
+        except Exception as e: print(f"Texture catalog unavailable: {e}"); return None
+
+    def set_frame_texture(self, tex, record=None):
+        """Sets or clears the frame texture; record is its catalog entry when it came from the library."""
+        self.frame_texture = tex; self.frame_texture_levels = []; self.frame_texture_tile = None; self.frame_texture_color = None
+        self.frame_texture_path = record['path'] if tex and record else None
+        if not tex: return
+        if record:
+            from .texture_library import texture_catalog
+            self.frame_texture_color = (QColor(record['avg']), record['color_name'])
+            self.frame_texture_levels = [QPixmap.fromImage(l) for l in texture_catalog().levels(record['path'])]
+            self.frame_texture_tile = texture_catalog().tile(record['path'])
+        else:
+            avg = ColorUtils.get_average_color(tex)
+            self.frame_texture_color = (avg, ColorUtils.get_closest_name(avg))
+
     def convert_to_unit(self, target):
         if target == self.unit: return
         factor = 25.4 if target == "mm" else 1/25.4
-        new_step = 2.0 if target == "mm" else 0.125
-        self.updating_ui = True
-        for s in self.unit_inputs: 
-            s.setValue(s.value() * factor)
-            s.setSingleStep(new_step)
-        self.unit = target; self.updating_ui = False; self.recalc()
+        with self.batched_update(): # step sizes follow self.unit when the batch ends
+            for s in self.unit_inputs: s.setValue(s.value() * factor)
+            self.unit = target
 
     def toggle_grids(self):
         for e in [self.editor_cropper, self.editor_mat]: e.set_grid_enabled(self.chk_grid_src.isChecked())
@@ -900,12 +1156,12 @@ class FrameApp(QMainWindow):
         dlg = ProfessionalColorPickerDialog(self.frame_color, "Frame Color", self)
         if dlg.exec():
             self.frame_color = dlg.selectedColor()
-            self.frame_texture = None
+            self.set_frame_texture(None)
             self.btn_extract_tex.setText("Extract Texture")
             self.recalc()
 
     def recalc(self):
-        if self.updating_ui: return
+        if self.updating_ui or self.batch_depth: return
         face, rabbet, p_border = self.spin_face.value(), self.spin_rabbet.value(), self.spin_print_border.value()
         radius = self.spin_radius.value() if self.chk_radius.isChecked() else 0.0
         tol = 3.0/25.4 if self.unit == "in" else 3.0
@@ -960,9 +1216,8 @@ class FrameApp(QMainWindow):
         self.lbl_mat_thick.setText(f"Thickness: {thick_str}")
 
         # Frame Color Name logic
-        frame_actual_color = self.frame_color
-        if hasattr(self, 'frame_texture') and self.frame_texture:
-            frame_actual_color = ColorUtils.get_average_color(self.frame_texture)
+        frame_actual_color, frame_name = self.frame_color, None
+        if self.frame_texture and self.frame_texture_color: frame_actual_color, frame_name = self.frame_texture_color
 
         self.last_calc = {
             'unit': self.unit, 'cut_w': mat_cut_w * to_in, 'cut_h': mat_cut_h * to_in,
@@ -974,13 +1229,15 @@ class FrameApp(QMainWindow):
             'outer_w': ow * to_in, 'outer_h': oh * to_in, 'frame_face': face * to_in, 
             'pixmap': self.pixmap_full, 'pixmap_source_path': self.current_image_path,
             'crop_rect': self.current_crop, 'col_mat': self.mat_color, 'col_frame': self.frame_color,
-            'frame_texture': self.frame_texture, 'no_mat': self.chk_no_mat.isChecked() if self.act_mode_art.isChecked() else False, 'link_all': self.chk_link_all.isChecked(),
+            'frame_texture': self.frame_texture, 'frame_texture_levels': self.frame_texture_levels,
+            'frame_texture_tile': self.frame_texture_tile, 'texture_mode': self.combo_tex_mode.currentData(), 'no_mat': self.chk_no_mat.isChecked() if self.act_mode_art.isChecked() else False, 'link_all': self.chk_link_all.isChecked(),
             'mat_name': ColorUtils.get_closest_name(self.mat_color),
-            'frame_name': ColorUtils.get_closest_name(frame_actual_color),
+            'frame_name': frame_name or ColorUtils.get_closest_name(frame_actual_color),
             'mat_ply': f"{ply} ({thick_str})" if thick_str != "Custom" else ply
         }
         self.lbl_mat_color_name.setText(f"MAT: {self.last_calc['mat_name'].upper()}")
         self.lbl_frame_color_name.setText(f"FRAME: {self.last_calc['frame_name'].upper()}")
+        self.palette_timer.start() # debounced; the analysis itself runs in a worker
         for w in [self.preview, self.editor_cropper, self.editor_mat]: w.update_params(self.last_calc)
         u = self.unit
         mat_info = ""
@@ -1021,8 +1278,21 @@ class FrameApp(QMainWindow):
         elif direction == "down": a.append(tip+QPointF(-s/3,-s)); a.append(tip+QPointF(s/3,-s))
         p.setBrush(Qt.GlobalColor.black); p.drawPolygon(a)
 
+    def pdf_cache_key(self):
+        """Hash of everything the blueprint PDF depends on, or None if the source isn't a stable file."""
+        d = self.last_calc
+        src_id = source_identity(self.current_image_path)
+        if src_id is None: return None
+        return ExportCache.make_key(kind="pdf", source=src_id, calc=calc_fields(d),
+                                    texture=image_digest(d.get('frame_texture')), preview=image_digest(self.preview.pixmap()),
+                                    settings=[self.combo_fix.currentText(), self.spin_fix_val.value(), self.combo_align.currentText(),
+                                              self.spin_min_gutter.value(), self.spin_print_border.value(), self.spin_rabbet.value(),
+                                              self.spin_face.value(), self.spin_iw.value(), self.spin_ih.value(),
+                                              self.chk_radius.isChecked(), self.spin_radius.value(), self.chk_link.isChecked()])
+
     def export_pdf(self):
-        if not self.last_calc: return
+        if not self.last_calc or not self.ensure_original(): return
+        pdf_key = self.pdf_cache_key()
         
         # 1. Rendering Phase
         self.lbl_status.setText("Rendering PDF Preview...")
@@ -1030,26 +1300,32 @@ class FrameApp(QMainWindow):
         self.progress_bar.show()
         QApplication.processEvents()
 
-        # Render Page 1 (Blueprint) to QImage
-        img_p1 = QImage(2480, 3508, QImage.Format.Format_ARGB32) # A4 @ 300 DPI approx
-        img_p1.fill(Qt.GlobalColor.white)
-        p1 = QPainter(img_p1)
-        self._render_pdf_page1(p1, 2480, 3508)
-        p1.end()
-        self.progress_bar.setValue(40)
-        QApplication.processEvents()
+        # Rendered pages are kept for the session, so re-exporting an unchanged layout skips this phase
+        img_p1 = image_cache.get("pdf", ("page1", pdf_key)) if pdf_key else None
+        img_p2 = image_cache.get("pdf", ("page2", pdf_key)) if pdf_key else None
+        if img_p1 is None or img_p2 is None:
+            # Render Page 1 (Blueprint) to QImage
+            img_p1 = QImage(2480, 3508, QImage.Format.Format_ARGB32) # A4 @ 300 DPI approx
+            img_p1.fill(Qt.GlobalColor.white)
+            p1 = QPainter(img_p1)
+            self._render_pdf_page1(p1, 2480, 3508)
+            p1.end()
+            self.progress_bar.setValue(40)
+            QApplication.processEvents()
 
-        # Render Page 2 (Visual) to QImage
-        img_p2 = QImage(2480, 3508, QImage.Format.Format_ARGB32)
-        img_p2.fill(Qt.GlobalColor.white)
-        p2 = QPainter(img_p2)
-        self._render_pdf_page2(p2, 2480, 3508)
-        p2.end()
+            # Render Page 2 (Visual) to QImage
+            img_p2 = QImage(2480, 3508, QImage.Format.Format_ARGB32)
+            img_p2.fill(Qt.GlobalColor.white)
+            p2 = QPainter(img_p2)
+            self._render_pdf_page2(p2, 2480, 3508)
+            p2.end()
+            if pdf_key:
+                image_cache.put("pdf", ("page1", pdf_key), img_p1); image_cache.put("pdf", ("page2", pdf_key), img_p2)
         self.progress_bar.setValue(70)
         QApplication.processEvents()
 
         # Show Preview
-        dlg = PDFPreviewDialog(QPixmap.fromImage(img_p1), QPixmap.fromImage(img_p2), self)
+        dlg = _dialogs().PDFPreviewDialog(QPixmap.fromImage(img_p1), QPixmap.fromImage(img_p2), self)
         self.progress_bar.setValue(100)
         QApplication.processEvents()
         
@@ -1065,6 +1341,12 @@ class FrameApp(QMainWindow):
             self.progress_bar.setValue(50)
             QApplication.processEvents()
 
+            if export_cache().fetch(pdf_key, fn):
+                self.progress_bar.setValue(100); self.progress_bar.hide()
+                self.lbl_status.setText(f"Saved: {os.path.basename(fn)} (cached)")
+                QTimer.singleShot(3000, lambda: self.lbl_status.setText("Ready"))
+                return
+
             writer = QPdfWriter(fn)
             writer.setPageSize(QPageSize(QPageSize.PageSizeId.A4))
             writer.setResolution(300)
@@ -1088,6 +1370,7 @@ class FrameApp(QMainWindow):
             painter.drawImage(x_offset, y_offset, img_p2.scaled(scaled_w, scaled_h, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
             
             painter.end()
+            export_cache().store(pdf_key, fn)
             
             self.progress_bar.setValue(100)
             self.lbl_status.setText(f"Saved: {os.path.basename(fn)}")
@@ -0,0 +1,610 @@
+# Generated by tools/gen_colors.py -- do not edit by hand.
+# 271 colors; index cells: 8 per channel.
+CELL_BITS = 3
+NAMES = (
+    'Cotton White\nBright White\nPaper White\nSnow\nIvory\nFloral White\nAntique White\nGhost White\nWhite Sm'
+    'oke\nSeashell\nOld Lace\nLinen\nBone\nParchment\nEggshell\nAsh Gray\nCool Gray\nSilver\nPewter\nSlate Gray\n'
+    'Charcoal\nSteel Gray\nBlack\nJet Black\nMidnight\nTan\nSand\nBeige\nTaupe\nCamel\nOatmeal\nTerracotta\nUmber'
+    '\nSienna\nChocolate\nWalnut\nDark Walnut\nMahogany\nOak\nCherry Wood\nWenge\nBirch\nEbony\nRosewood\nCharcoa'
+    'l Black\nPainted Black\nNavy Blue\nRoyal Blue\nSky Blue\nSteel Blue\nDenim\nOxford Blue\nTeal\nCyan\nPowde'
+    'r Blue\nPrussian Blue\nCeleste\nForest Green\nSage Green\nOlive\nEmerald\nMint\nSeafoam\nHunter Green\nLim'
+    'e\nKelly Green\nMoss\nJade\nDeep Red\nBurgundy\nCrimson\nBrick\nWine\nRose\nDusty Rose\nSalmon\nCoral\nPlum\nL'
+    'avender\nMauve\nAubergine\nViolet\nIndigo\nMagenta\nGold\nSunflower\nOchre\nBurnt Orange\nPeach\nAmber\nMust'
+    'ard\nMuted Dark Red\nMuted Red\nMuted Light Red\nDark Red\nRed\nLight Red\nVibrant Dark Red\nVibrant Red'
+    '\nVibrant Light Red\nMuted Dark Green\nMuted Green\nMuted Light Green\nDark Green\nGreen\nLight Green\nV'
+    'ibrant Dark Green\nVibrant Green\nVibrant Light Green\nMuted Dark Blue\nMuted Blue\nMuted Light Blue\n'
+    'Dark Blue\nBlue\nLight Blue\nVibrant Dark Blue\nVibrant Blue\nVibrant Light Blue\nMuted Dark Yellow\nMu'
+    'ted Yellow\nMuted Light Yellow\nDark Yellow\nYellow\nLight Yellow\nVibrant Dark Yellow\nVibrant Yellow'
+    '\nVibrant Light Yellow\nMuted Dark Cyan\nMuted Cyan\nMuted Light Cyan\nDark Cyan\nLight Cyan\nVibrant D'
+    'ark Cyan\nVibrant Cyan\nVibrant Light Cyan\nMuted Dark Magenta\nMuted Magenta\nMuted Light Magenta\nDa'
+    'rk Magenta\nLight Magenta\nVibrant Dark Magenta\nVibrant Magenta\nVibrant Light Magenta\nMuted Dark O'
+    'range\nMuted Orange\nMuted Light Orange\nDark Orange\nOrange\nLight Orange\nVibrant Dark Orange\nVibran'
+    't Orange\nVibrant Light Orange\nMuted Purple\nPurple\nLight Purple\nDark Purple\nVibrant Purple\nMuted '
+    'Dark Pink\nMuted Pink\nMuted Light Pink\nDark Pink\nPink\nLight Pink\nVibrant Dark Pink\nVibrant Pink\nV'
+    'ibrant Light Pink\nMuted Brown\nBrown\nLight Brown\nDark Brown\nVibrant Brown\nGray\nLight Gray\nDark Gr'
+    'ay\nMuted Dark Tan\nMuted Tan\nMuted Light Tan\nDark Tan\nLight Tan\nVibrant Dark Tan\nVibrant Tan\nVibr'
+    'ant Light Tan\nMuted Olive\nLight Olive\nDark Olive\nVibrant Olive\nMuted Teal\nLight Teal\nDark Teal\nV'
+    'ibrant Teal\nMuted Dark Cream\nMuted Cream\nMuted Light Cream\nDark Cream\nCream\nLight Cream\nVibrant '
+    'Dark Cream\nVibrant Cream\nVibrant Light Cream\nVibrant Deep Blue Shade\nVibrant Dark Blue Shade\nVib'
+    'rant Blue Shade\nVibrant Deep Green Shade\nVibrant Deep Cyan Shade\nVibrant Dark Green Shade\nVibran'
+    't Dark Cyan Shade\nVibrant Cyan Shade\nVibrant Green Shade\nVibrant Deep Red Shade\nVibrant Deep Pur'
+    'ple Shade\nVibrant Deep Yellow Shade\nBlackish Shade\nMuted Dark Blue Shade\nDark Blue Shade\nBlue Sh'
+    'ade\nMuted Dark Green Shade\nMuted Dark Cyan Shade\nDark Green Shade\nDark Cyan Shade\nCyan Shade\nGre'
+    'en Shade\nVibrant Deep Magenta Shade\nVibrant Dark Purple Shade\nVibrant Deep Orange Shade\nMuted Da'
+    'rk Red Shade\nMuted Dark Purple Shade\nDark Purple Shade\nMuted Dark Yellow Shade\nDark Gray-ish Sha'
+    'de\nMuted Blue Shade\nMuted Green Shade\nMuted Cyan Shade\nVibrant Dark Red Shade\nVibrant Dark Magen'
+    'ta Shade\nVibrant Purple Shade\nVibrant Dark Orange Shade\nDark Red Shade\nDark Magenta Shade\nPurple'
+    ' Shade\nDark Orange Shade\nMuted Purple Shade\nVibrant Dark Yellow Shade\nDark Yellow Shade\nGray-ish'
+    ' Shade\nMuted Red Shade\nMuted Magenta Shade\nMuted Orange Shade\nMuted Yellow Shade\nLight Blue Shad'
+    'e\nLight Green Shade\nLight Cyan Shade\nRed Shade\nMagenta Shade\nOrange Shade\nYellow Shade\nMuted Lig'
+    'ht Blue Shade\nVibrant Yellow Shade\nMuted Light Green Shade\nMuted Light Cyan Shade\nVibrant Red Sh'
+    'ade\nVibrant Magenta Shade\nVibrant Orange Shade\nLight Purple Shade\nMuted Light Red Shade\nMuted Li'
+    'ght Purple Shade\nMuted Light Yellow Shade\nLight Red Shade\nLight Magenta Shade\nLight Orange Shade'
+    '\nLight Yellow Shade\nWhitish Shade'
+)
+RGB = bytes.fromhex(
+    'fbfbf9fffffff5f5f8fffafafffff0fffaf0faebd7f8f8fff5f5f5fff5eefdf5e6faf0e6e3dac9f1e9d2f0ead6b2beb5'
+    '90a4aec0c0c08e8e8e70809036454f71797e0000003434342c3e50d2b48cc2b280f5f5dc483c32c19a6be9e0d2e2725b'
+    '635147a0522d694b377f63505d432cc04000bc9e82903820645452f5f5dc28282865000b2c2c2c1a1a1a0000804169e1'
+    '87ceeb4682b41560bd00214700808000ffffb0e0e6003153b2ffff228b229caf8880800050c878bdfcc99fe2bf355e3b'
+    '32cd324cbb178a9a5b00a86b8b0000800020dc143cb22222722f37ff007fc2737ffa8072ff7f508e4585e6e6fae0b0ff'
+    '3d0c158f00ff4b0082ff00ffd4af37ffc400cc7722cc5500ffdab9ffbf00ffdb583d28287a5151d6c1c1471e1e8e3d3d'
+    'e0b7b7660000cc0000ff9999283d28517a51c1d6c11e471e3d8e3db7e0b700660000cc0099ff9928283d51517ac1c1d6'
+    '1e1e473d3d8eb7b7e00000660000cc9999ff3d3d287a7a51d6d6c147471e8e8e3de0e0b7656600cbcc00feff99283d3d'
+    '517a7ac1d6d61e4747b7e0e000656600cbcc99feff3d283d7a517ad6c1d6471e47e0b7e0660065cc00cbff99fe3d3628'
+    '7a6c51d6cfc147391e8e723de0d2b7664200cc8400ffdb99ad84ad8e3d8efefffe511451ff32fe3d282c7a5158d6c1c5'
+    '471e258e3d4be0b7be660011cc0023ff99aaad8484c17070feffff511414ff3232a32828eaadad5b0a0a3d34287a6851'
+    'd6cdc147351ee0ceb7663a00cc7400ffd399adad84fefeff515114feff3284adadfffefe14515132feff3d3c287a7851'
+    'd6d5c147451e8e8b3de0deb7666100ccc300fffa990000200000600000c000200000202000600000606000a0c000c000'
+    '2000002000202020002020202020402020602020a02040202040402060202060602080a020a020400020400060402000'
+    '4020204020404020604040204040404040804080404080806000006000206000c06020006020206020406020a0604020'
+    '6040806060006060206060608040408040608060408080408080e080e08080e0e0a02020a02060a06020a0a020a0a0c0'
+    'a0c000a0c0a0a0c0c0c00000c00040c06000c080e0c0a0a0c0a0c0c0c0a0e08080e080a0e0a080e0e080e0e0e0'
+)
+# uint16 little-endian: candidate entry indices per cell, and per-cell start offsets into them
+CELL_OFFSETS = bytes.fromhex(
+    '0000290062008f00b200c600d200d500d900150153017d01ac01cb01d601e401f1011b02500265029002bd02c702cd02'
+    'd502ea020e03350349035c0365036b0370037b038a03a303b403c003cb03d203da03e203eb03f703fc0306040e041204'
+    '19041e0424042d0435044004440446044a044e0455045d046a0474047a047d048004af04f404350562057c058a059505'
+    'a105eb051e0659069c06b006bf06d106e306200764079907df07fa070e081a081f084b087c08b608e008fe080e091509'
+    '180927092f0941095a096d09780984098e099609a109b909d209ea09010a140a2a0a2f0a310a360a3a0a410a520a5a0a'
+    '610a660a6b0a720a790a870a990a9f0aa20ac80a070b220b4e0b5b0b680b700b780bbb0bff0b4a0c900ca80cb60cc80c'
+    'da0cfa0c430d890da20db80dda0deb0def0d270e6a0e880ea60ec00ecf0ed50ed90e040f1e0f370f530f6c0f770f860f'
+    '940f990fa90fca0fdf0ff40f111039105d10601064106d106f1072108b10a910ba10c210c910d510d910e61006111911'
+    '20114d118b11c811dd11ef11fa11ff11031242126d12ac12e61203130f13201334136e139e13c513e413fc1326144414'
+    '57147f14b814d814f8140f15291535153c15561577159415b815c915e415f71503161616371659168116a116ae16cd16'
+    'e516f016011719172417351753176a177317801794179d17a217aa17c817d817e417021831185e1875189118a518ad18'
+    'b018ce18ee1809192e19361942195b1965199b19bf19e319021a121a2b1a4e1a611a8a1aa61ac71af91a261b461b571b'
+    '5e1b7a1b891ba01bbf1bcc1be41bfd1b081c141c241c3a1c531c681c7a1ca21cc31cc91cdf1c021d161d3d1d681d8a1d'
+    '941d9e1db91dce1dd71de21dfb1d161e251e3d1e501e651e751e8f1e9a1ea01ea51ebc1ecf1eed1e031f121f241f371f'
+    '441f671f7d1fad1fdd1ffc1f21203e204f206e209520c820e220fe2011211e2124213b2159217f21a121bd21d921fd21'
+    '1422232235225d2270228e22b622e22201230823202359238c23bc23ed231a2442244b246924a024ca24ed240f253925'
+    '5a256625702579258d259d25a225a525a925bb25d125f02513263b2652265a265e266a269026bd26dc26fb261e273727'
+    '47274f275b276b27762787279b27aa27b327c027db27fa27122836285f2886289d28a928ad28bf28d928f22825295329'
+    '732979298629a529cb29042a352a652aa32aab2ab42ad02ae72a112b432b7e2bb32bbf2bc62bce2bd42bd72bdc2be02b'
+    'e32bf02bf62b002c1d2c2f2c472c4b2c4e2c5d2c6e2c862c9e2cbc2cd42ce72ceb2cf72c082d102d1d2d2e2d3e2d5b2d'
+    '6f2d7f2d972da52db82dd02de72d0f2e1d2e282e322e4b2e692e922eac2ed72ef32efb2e092f122f332f542f7d2fb62f'
+    'ec2ff42ffa2f013012302e3062308c30b230'
+)
+CELL_CANDIDATES = bytes.fromhex(
+    '160017002a002c002d003300370050005b005e00640067006d00700076007f0087008a008f0092009d00a000a900ae00'
+    'b100be00c700ca00cb00d000d100d200d300d400d700d800dd00df00e000e100e30014001600170018001c002a002c00'
+    '2d002e003300370050005b005e00640067006d007000730076007f00820087008a008f0092009b009d00a000a900ad00'
+    'ae00b100be00c700c800ca00cb00d000d100d200d300d400d500d700d800dd00de00df00e000e100e200e300e400e900'
+    'ec00ed001400170018001c002a002c002d002e0033003700500052005b005e0064006d007000730076007f0082008700'
+    '8a008f009b009d00a000ae00b100be00c700c800cb00d100d300d400d500d700d800dd00de00e000e100e200e4001400'
+    '170018002a002c002e003300370052005b006d007000710073007f00820087008a009b009d00c700c800c900cb00d100'
+    'd300d400d500d600d800de00e100e200e400e50018002e003300370052006d0070007100730074009b00c800c900d400'
+    'd500d600de00e200e500ee002e005200710073007400c800c900d500d600e500ea00ee007400c900d6007400c900d600'
+    'ea0014001600170018001c0024002a002c002d00330037003f0050005b005e00640067006a006d007000760079007f00'
+    '820087008a008f0092009d00a000a900ad00ae00b100b800bc00be00c100c700ca00cb00cc00d000d100d200d300d400'
+    'd500d700d800d900dd00df00e000e100e300e400eb00ec00ef0014001600170018001c0024002a002c002d0033003700'
+    '3f0050005b005e00640067006a006d0070007300760079007f00820087008a008f0092009b009d00a000a900ae00b100'
+    'b800bc00be00c100c700c800ca00cb00cc00cd00d000d100d200d300d400d500d700d800d900da00dd00df00e000e100'
+    'e200e300e4001400170018001c002a002c002d00330037003f005b00640067006d007000730076007f00820087008a00'
+    '8f009d00a000ae00bc00be00c800cb00cd00d300d400d500d700d800da00e000e100e200e300e400e500140017001800'
+    '1c002a002c002e00330037003f0052005b00640067006d006e0070007100730076007f008200840087008a008f009b00'
+    '9d00ae00bc00be00c800cb00cd00d300d400d500d600d700d800da00de00e100e200e400e500f000140018002e003200'
+    '3300370052006d006e0070007100730074007f00820084008a00bc00c800c900cd00d400d500d600d800da00de00e200'
+    'e500ee00f0002e00320052006e0071007400c900d500d600e500ee002e002f00320052006e0071007400c900d500d600'
+    'e500ea00ee00f0002e002f0031003200520071007400c900d600db00e500ea00ee001400170018001c002a002c002d00'
+    '330037003f005b00640067006a006d00760079007f00820087008f0092009d00ae00b100b800bc00be00c100ca00cb00'
+    'cc00d200d300d400d700d800d900df00e000e300e4001400170018001c0024002a002c002d003300370039003f005b00'
+    '5e00640067006a006d007000760079007f008200840087008a008f0092009d00a000ae00b100b800bc00be00c100ca00'
+    'cb00cc00cd00d200d300d400d500d700d800d900da00e000e100e300e400e6001400170018002c0037003f0064006700'
+    '6d0076007f0082008400bc00be00cd00d700d800d900da00e4001400170018001c002c0032003300340037003f006400'
+    '65006d006e007000710076007f0080008200840087008f00ae00bc00be00cd00d400d500d600d700d800d900da00db00'
+    'e100e200e400e500e600e700f000f30014001500170018001c00200028002c002e002f00310032003300340037003f00'
+    '640065006d006e00700071007f0080008200840087008a00bc00cd00d400d500d600d800da00db00e100e200e400e500'
+    'e600e700ee00f000f3002f003100320034006e0071008400d600db00e5002f00310032007100d600db002f0031003200'
+    '71007400c900d600db0039003f006400670068006a00760079007f008200b800bc00be00c100cc00d700d800d900dc00'
+    'e300e6001400170018001c003400370039003f0064006500670068006a00760079007f00820084008f009200ae00b800'
+    'bc00be00c100cc00cd00d700d800d900da00dc00e300e400e600f2001400170018001c003400370039003f0043006400'
+    '6500670068006a006e00760079007f00800082008400b800bc00be00c100cc00cd00d700d800d900da00db00dc00e300'
+    'e400e500e600e700f3001400180034003f004300650068006e007100800082008400bc00cd00d800da00db00e500e600'
+    'e70014001800310032003400430065006e007100800082008400bc00cd00ce00da00db00e500e7002f00310032003400'
+    '71008400ce00db00e7002f00310032003400ce00db002f0031003200ce00db0039003f00410068006a006b00cc00cf00'
+    'd900dc00e60039003f0041004300650068006a008400cc00cd00cf00d900da00dc00e600340039003c003f0040004100'
+    '4300650068006a00800082008400bc00cc00cd00cf00d900da00db00dc00e600e700f200f3003100340039003f004300'
+    '6500680080008400bc00cd00ce00da00db00dc00e600e7003100320034004300650080008400cd00ce00da00db00e700'
+    '2f003100320034004300800084008500ce00db00e7002f003100320034008500ce00db002f003100320034008500ce00'
+    'db00f80039004000410068006b00cf00dc00e600390040004100430068006b00cf00dc00e600340039003c0040004100'
+    '430068006b00cf00dc00e600e70034003c00400043006800310034003c004300680080008500ce00db00e70031003400'
+    '3c0043008500ce00db00e70031008500ce00db002f00310035008500bd00ce00db00400041006b00cf00dc0040004100'
+    '43006b00cf00dc0039003c0040004100430068006b00cf00dc003c0040004100430068008500ce00dc00310034003c00'
+    '4000430068008500ce00db00e700f9003c0043008500ce008500ce0035008500bd00ce00400041006b00cf003c004000'
+    '410043006b00cf00dc003c004000410043006b00cf00dc00f90035003c0040004100430068006b006c008500ce00cf00'
+    'dc00f90035003c00400043006c008500bd00ce00f900fa0035003c0043008500bd00ce0035008500bd0035008500bd00'
+    '160017001c002a002b002c002d00330050005b005e00610064006d007000760087008a008f0092009d00a000a300a900'
+    'ad00ae00b100be00c700ca00cb00d000d100d200d300d400d700dd00df00e000e100e300e800e900eb00ec00ed001400'
+    '1600170018001c0024002a002b002c002d00330037004500480050005b005e006100640067006d007000730076007900'
+    '7f00820087008a008c008f0092009b009d00a000a300a900ad00ae00b100b300be00c100c700c800ca00cb00d000d100'
+    'd200d300d400d500d700d800dd00de00df00e000e100e200e300e400e800e900eb00ec00ed00ef001400170018001c00'
+    '24002a002b002c002d002e00330037004800500052005b005e0064006d0070007100730076007f00820087008a008c00'
+    '8f0092009b009d00a000a300a900ad00ae00b100be00c100c700c800cb00d000d100d200d300d400d500d600d700d800'
+    'dd00de00df00e000e100e200e300e400e500e900ec00ed00ef001400170018001c002a002c002e003300370048005200'
+    '5b005e006d007000710073007f00820087008a008c008f009b009d00a000ae00be00c800d100d300d400d500d600d800'
+    'dd00de00e000e100e200e400e500ed00ee00f00018002e003300370052006d00700071007300740087008a008c009b00'
+    'c800c900d400d500d600de00e100e200e500ea00ee00f0002e005200710073007400c900d500d600de00e200e500ea00'
+    'ee00f0002e005100520071007400c900d600e500ea00ee00f0002e002f0032005100520071007400c900d600e500ea00'
+    'ee0014001600170018001c002000220024002a002b002c002d00330037003f00480050005b005e006100640067006a00'
+    '6d007000760079007f00820087008a008f00920095009b009d00a000a300a900ad00ae00b100b300b800bc00be00c100'
+    'c400c700ca00cb00cc00d000d100d200d300d400d700d800d900dd00df00e000e100e300e400e800e900eb00ec00ed00'
+    'ef00f100f2001400170018001c0024002a002c002d003300370050005b005e00640067006d007000760079007f008200'
+    '87008a008f0092009b009d00a000a900ae00b100b800bc00be00c100cb00d200d300d400d500d700d800df00e000e100'
+    'e200e300e400ec00ed00ef001400170018001c0020002200240028002a002c002d00330037003f00480050005b005e00'
+    '640067006d006e0070007100760079007f00820087008a008f0092009b009d00a000a900ae00b100bc00be00c100cb00'
+    'd300d400d500d700d800da00de00e000e100e200e300e400e500ec00ed00ef00f0001400170018001c00200022002400'
+    '28002a002c002e00330037003f00480052005b005c005e00640067006d006e00700071007300760079007f0082008400'
+    '870088008a008c008f0092009b009d009e00a000ae00b100bc00be00c100c800cd00d300d400d500d600d700d800da00'
+    'de00e000e100e200e300e400e500ed00ee00f000f300f500140018002e003200370052006e00700071008a009b00bc00'
+    'd500d600da00de00e200e500ee00f0002e002f00320052006e0071007400c900d500d600e200e500ea00ee00f0002e00'
+    '2f003100320052006e007100740088009900c900d500d600e200e500ea00ee00f0002e002f0031003200510052006e00'
+    '710074009900c900d600db00e500ea00ee00f000f8001400170018001c0020002200240028002a002c002d0039003f00'
+    '48005b005e00640067006a006d007000760079007c007f00820087008a008f00920095009d00a000ae00b100b300b800'
+    'bc00be00c100c400ca00cb00cc00d200d300d400d700d800d900df00e000e100e300e400e600eb00ec00ef00f100f200'
+    '1400170018001c0020002200240028002a002c002d00330037003f0048005b005e006400650067006a006d0070007600'
+    '79007c007f008200840087008a008f00920095009d00a000ae00b100b300b800bc00be00c100c400cb00cc00cd00d200'
+    'd300d400d500d700d800d900da00df00e000e100e200e300e400e600ec00ed00ef00f100f200f3001400170018001c00'
+    '20002200240028002a002c0037003f005b006400650067006d006e0070007100760079007f008200840087008a008f00'
+    '92009d00ae00b100b800bc00be00c100cd00d400d500d700d800d900da00e100e200e300e400e500e600ef00f000f200'
+    'f300130014001500170018001c00200022002300240028002a002c0032003300340037003f0048005b005c0064006500'
+    '67006d006e0070007100760079007f00800082008400870088008a008f00900092009b009d009e00ae00af00b100bc00'
+    'be00c100cd00d400d500d600d700d800d900da00db00e100e200e300e400e500e600e700ed00ee00f000f300f5001400'
+    '150018002800310032003400370065006e0071008000820084008800bc00cd00d500d600da00db00e200e500e700ee00'
+    'f000f300130015002f003100320034006e007100800084008800cd00d600da00db00e500e700ee00f000f3002f003100'
+    '32006e007100d600db00e500e700ee00f000f8002f0031003200d600db001400170018001c0020002200240028003900'
+    '3b003f0064006500670068006a00760079007c007f0082008f0092009500ae00b100b300b800bc00be00c100c400cc00'
+    'd700d800d900da00dc00e300e400e600ef00f100f2001400170018001c00200022002400280039003f00640065006700'
+    '68006a007600770079007c007f008000820084008f0090009200ae00af00b100b800bc00be00bf00c100c400cc00cd00'
+    'd700d800d900da00dc00e300e400e600ef00f100f200f30014001500170018001c002000220023002400280034003900'
+    '3f0043005c0064006500670068006e0071007600770079007f0080008200840088008f00900092009e00ae00af00b800'
+    'bc00be00bf00c100cd00d700d800d900da00db00dc00e300e400e500e600e700ef00f000f200f300f600f70013001400'
+    '150018001c00200022002300280031003200340039003f0043005c00650068006e00710077007f008000820084008800'
+    '90009e00af00bc00bf00cd00d800d900da00db00e400e500e600e700f000f3001300140015001800200028002f003100'
+    '320034003f004300650068006e0071008000820084008800bc00cd00ce00da00db00e500e600e700f000f30013001500'
+    '2f003100320034006e00710080008400ce00da00db00e500e700f0002f0031003200ce00db00e700f8002f0031003200'
+    '39003f004100650068006a007c00c400cc00cf00d900dc00e600f100f20039003f00410065006800d900dc00e6001500'
+    '340039003f004100430065006800770080008400cd00d900da00dc00e600e700f300130015003100340039003c003f00'
+    '4300650068006e007700800084009000af00bc00bf00cd00da00db00dc00e600e700f300130015003100320034003c00'
+    '4300650068006e0080008400cd00ce00da00db00e600e700f300130015002f0031003200340043008000ce00db00e700'
+    '13002f0031003200340080008500ba00ce00db00e700f80013002f003100320075008500ba00ce00db00f80039004000'
+    '410068006b00cf00dc00e60039003c00400041004300650068006b00cf00dc00e60013001500340039003c0040004100'
+    '42004300650068006b0077007a008000bf00c200cf00db00dc00e600e700f700f9001200130015003100340039003c00'
+    '400041004200430065006800770080008500ba00bf00ce00db00dc00e600e700f700f900100012001300150031003400'
+    '3a003c00400042004300650068007700800084008500ba00bf00ce00db00e600e700f90010001200130015002f003000'
+    '3100320034003a003c00430080008500ba00ce00db00e700f800f900fa00ff000101100013002f003000310032003400'
+    '3c004300750080008500ba00bd00ce00db00e700f800fa00100013002f00300031003200340035003c003e0075008500'
+    'ba00bd00ce00db00e700f800fa00ff0001010201400041006b00cf00dc00400041003c00400041004300dc003c004000'
+    '4300f9003c00400043008500ba00ce00f90010003000310035003c003e0043008500ba00bd00ce00db00e700f900fa00'
+    '01010201300035003c008500ba00bd00ce00fa00300035008500ba00bd00ce00fa00400041006b00cf00dc003c004000'
+    '41006b00cf003c004000410043006b00cf00f9003c004000410043006c008500f900300035003c003e00400043006c00'
+    '8500ba00bd00ce00f900fa0001011000300035003a003c003e00400043006c0085008600ba00bd00ce00f900fa000101'
+    '0201300035003c008500bd00fa0035008500bd0017002a002b002c002d004500480050005b005e0061006d0087008a00'
+    '8f0092009d00a000a300a900ad00ae00b100b300be00d000d100d200d300dd00df00e000e100e800e900eb00ec00ed00'
+    '1400170018001c00240027002a002b002c002d0044004500480050005b005e00610064006d007000760079007f008700'
+    '8a008c008f00920095009b009d00a000a300a900ad00ae00b100b300be00c100d000d100d200d300d400d500d700d800'
+    'dd00de00df00e000e100e200e300e400e800e900eb00ec00ed00ef00f40017002a002c00480052005b005e006d007000'
+    '87008a008c008f009b009d00a000ae00d400d500dd00de00e000e100e200e900ec00ed001400170018001c002a002c00'
+    '2e00480052005b006d007000710073007f0087008a008c008f0099009b009d00a000ae00c800d400d500d600d800dd00'
+    'de00e000e100e200e400e500e900ea00ec00ed00ee00f000f500fc00520071008a008c009b00d500d600de00e200e500'
+    'ea00ee00f0005200710074008c009900c900d600de00e200e500ea00ee00f0005100520071007400c900d600ea00ee00'
+    '5100520071007400c900d600ea00ee001400170018001c0020002200240027002a002b002c002d003f00480050005b00'
+    '5e006100640067006d007000760079007c007f00820087008a008f00920095009b009d00a000a300a900ad00ae00b100'
+    'b300b800be00c100c400d000d100d200d300d400d700d800dd00df00e000e100e300e400e800e900eb00ec00ed00ef00'
+    'f100f200f4001400170018001c00200022002400270028002a002b002c002d003f00480050005b005c005e005f006400'
+    '67006d007000760079007f00820087008a008f00920095009b009d009e00a000a100a300a900ad00ae00b100b300b800'
+    'be00c100d200d300d400d500d700d800dd00df00e000e100e200e300e400e900eb00ec00ed00ef00f200f400f5001400'
+    '170018001c002000220023002400270028002a002c002d003f0048004d00500052005b005c005e005f00640067006d00'
+    '6e0070007100760079007f008200870088008a008c008f0092009b009d009e00a000a100a900ad00ae00b100b800bc00'
+    'be00c100d300d400d500d700d800da00dd00de00e000e100e200e300e400e500e900ec00ed00ef00f000f200f300f400'
+    'f500f6001400170018001c00200022002300240028002a002c00330037003f0048004d0052005b005c005e005f006400'
+    '6d006e0070007100760079007f008200870088008a008c008f00920099009b009d009e00a000a100ae00af00b100bc00'
+    'be00c100d400d500d600d800da00de00e000e100e200e300e400e500ec00ed00ee00ef00f000f300f400f500f600fc00'
+    '1400180028004d0052005c006e00710088008a008c0099009b009e00d500d600de00e200e500ea00ee00f000f300f500'
+    '2f0032004d0052006e00710088009900d600e200e500ea00ee00f0002f00310032004d00510052006e00710074008800'
+    '9900c900d600e200e500ea00ee00f0002f00310032004d00510052006e007100740088009900c900d600e500ea00ee00'
+    'f000f80017001c00220024002c003f0048005b0064006700760079007c007f008f00920095009d00ae00b100b300b800'
+    'be00c100c400d700d900e300e400ef00f100f2001400170018001c002000220023002400270028002a002c003f004800'
+    '5b005c005e005f006400650067006d007600770079007c007f00820087008a008f0090009200930095009d009e00a000'
+    'a100ae00af00b100b300b800bc00be00bf00c100c400d300d400d700d800d900da00df00e000e100e200e300e400e600'
+    'eb00ec00ed00ef00f100f200f300f400f500f600f70014001500170018001c00200022002300240028002a002c003f00'
+    '48005b005c005f006400650067006d006e0071007600770079007f0080008200870088008a008f009000920093009d00'
+    '9e00a000a100ae00af00b100b800bc00be00bf00c100d400d500d700d800d900da00e000e100e200e300e400e500e600'
+    'ec00ed00ef00f000f200f300f400f500f60014001500180020002200230028003f005c0065006e0071007f0080008200'
+    '880090009e00af00da00e400e500f000f300f50013001400150018002800310032004d005c006e007100800088009900'
+    '9e00da00e500e700ee00f000f300f50012001300140015001800230028002f003100320034004d005c006e0071008000'
+    '84008800900099009e00af00d500d600da00db00e200e500e700ee00f000f300f500f800130015002f00310032004d00'
+    '6e00710088009900d600db00e500e700ee00f000f8002f0031003200f800140017001c00200022002300240028003900'
+    '3b003f005c0064006500670068006a007600770079007a007c007f0082008f0090009200930095009e00ae00af00b100'
+    'b300b800be00bf00c100c200c400cc00d700d800d900dc00e300e400e600ef00f100f200f300f400f600f700fd001400'
+    '1500170018001c0020002100220023002400280039003b003f0042005c005f0064006500670068006e00760077007900'
+    '7a007c007f008000820088008f0090009200930095009e00a100ae00af00b100b300b800bc00be00bf00c100c200c400'
+    'd700d800d900da00dc00e300e400e600e700ef00f100f200f300f400f500f600f700fd00140015002000220023002400'
+    '280039003f005c00650068006e00770080008800900093009e00af00bf00d900da00e400e600e700f200f300f600f700'
+    '13001400150020002200230028003f005c00650068006e00710077008000880090009e00af00bc00bf00da00db00e500'
+    'e600e700f000f300f600f700120013001500200023002800310032004d005c0065006e00710077008000880090009e00'
+    'af00bf00da00db00e500e700f000f3001200130015002f00310032006e00710080008800db00e500e700f000f8001300'
+    '2f0031003200db00f8002f0031003200f8002000220023002400280039003b003f004000410042005c00650067006800'
+    '6a00770079007a007c00900093009500af00b800bf00c100c200c400cc00cf00d900da00dc00e600f100f200f300f600'
+    'f700fd00fe000001230039003b003f00410042006500680077007a007c00800090009300af00bf00c200c400d900dc00'
+    'e600f100f200f300f600f70013001500230039003f00410042006500680077007a00800090009300af00bf00c200da00'
+    'dc00e600e700f200f300f600f70012001300150023002800310034003c003f0042006500680077007a00800090009300'
+    'af00ba00bf00c200da00db00e600e700f300f600f70010001200130015003100320034003a003c004200430065006800'
+    '6e00770080009000af00ba00bf00da00db00e600e700f30010001200130015002f0031008000ba00db00e700f8001000'
+    '1200130015002f003100320075008000ba00ce00db00e700f800ff00100013002f0030003100320075008500ba00ce00'
+    'db00f800ff0002013900400041006800dc0039003b003c004000410042006500680077007a00bf00c200dc00e600f700'
+    'fe00120013001500340039003a003b003c0040004100420043006500680077007a00800090009300af00b600ba00bf00'
+    'c200cf00db00dc00e600e700f300f700f900fe001200130015003a003c004000420043006500680077007a008000ba00'
+    'bf00c200db00e600e700f700f900100012001300150031003a003c00420043006500680077008000ba00ce00db00e700'
+    'f900ff00010102010f0010001200130015002f003000310034003a003c003e00420043007500800085009800b600ba00'
+    'ce00db00e700f800f900fa00ff00010102010f00100011001200130015002f00300031003200340036003a003c003e00'
+    '660069006f007200750080008100830085009800b600ba00bd00ce00db00e700f800f900fa00ff000101020107010801'
+    '09010f0010001100120013002f00300031003200350036003a003c003e00660069006f00720075008100830085008600'
+    '9800ba00bd00ce00db00e700f800fa00ff00010102010601080140004100dc003c0040004100dc003a003c0040004100'
+    '420043006800dc00f9003c00f9003c00ba00f9000f001000120013003000310036003a003c003e00430069006c007200'
+    '83008500b600ba00bd00ce00f900fa00ff00010102010f0010001100120030003100350036003a003c003e0066006900'
+    '6c006f00720075008100830085008600ba00bd00ce00f800f900fa00ff000101020110003000350036003e0072007500'
+    '830085008600ba00bd00ce00fa00ff00010102013c00400041006b00cf00dc00f90000013c00400041006b00cf00f900'
+    '00013a003c004000410043006b006c00cf00dc00f900000101013c0040006c00f90030003a003c003e00400069006c00'
+    '8500ba00f900fa00010102010f001000110030003500360038003a003c003d003e0040004300660069006c006f007200'
+    '8100830085008600b600ba00bd00ce00f900fa00ff000101020109010f0030003500360038003c003d003e0069006c00'
+    '830085008600ba00bd00f900fa0001010201300035003e0085008600bd00fa0017001c00240027002b002c0044004500'
+    '4700480050005b005e005f006100760087008a008f00920095009b009d00a000a300a900ab00ad00ae00b100b300be00'
+    'dd00df00e000e100e300e800e900eb00ec00ed00ef00f400fb0017001c002200240027002a002b002c00440045004700'
+    '480050005b005e005f0061006d0070007600790087008a008c008f00920095009b009d00a000a100a300a900ab00ad00'
+    'ae00b100b300be00c100d100d300d400dd00de00df00e000e100e200e300e400e800e900eb00ec00ed00ef00f400f500'
+    'fb00fc00040117001c002200240027002a002b002c004400450047004800500052005b005e005f0061006d0070007600'
+    '87008a008c008f00920099009b009d00a000a100a300a900ab00ad00ae00b100be00d400d500dd00de00e000e100e200'
+    'e300e400e500e800e900eb00ec00ed00ee00ef00f000f400f500fb00fc00040148004d0052005f00710087008a008c00'
+    '99009b00a100de00e100e200e500ed00ee00f000f400f500fc004d00520071008a008c0099009b00a100d600de00e200'
+    'e500ea00ed00ee00f000f500fc004d005100520071008c009900d600e500ea00ee00f000510052009900ea00ee005100'
+    '8d00ea00ee0017001c002000210022002400270028002a002b002c00440045004700480050005b005c005e005f006100'
+    '6400760079007c0087008a008f00920095009b009d00a000a100a300a900ab00ad00ae00b100b300b800be00c100c400'
+    'dd00df00e000e100e300e400e800e900eb00ec00ed00ef00f100f200f400f600fb00fd001c0020002200240027002800'
+    '48005b005c005e005f007600790087008a008f00920095009b009d009e00a000a100a900ab00ad00ae00b100b300b800'
+    'be00c100e000e100e300e400eb00ec00ed00ef00f400f500fb001400170018001c002000210022002300240027002800'
+    '2c00450048004d005b005c005e005f006d006e00760079007f00870088008a008c008f00920099009b009d009e00a000'
+    'a100a900ab00ae00af00b100b800be00c100de00e000e100e200e300e400e500e900ec00ed00ef00f000f200f300f400'
+    'f500f600fb00fc001400170018001c00200021002200230024002700280048004d0052005b005c005e005f006d006e00'
+    '7000710076007f00870088008a008c008f009000920099009b009d009e00a000a100ab00ae00af00b100be00d500de00'
+    'e100e200e400e500ec00ed00ee00ef00f000f300f400f500f600fc0014002000230028004d0052005c005f006e007100'
+    '88008a008c0099009b009e00a100d600de00e200e500ea00ed00ee00f000f300f400f500fc004d0052006e0071008800'
+    '9900d600e500ea00ee00f000f5002f0032004d00510052006e00710088008d009900d600e500ea00ee00f000f500f800'
+    '2f00310032004d00510052006e007100740088008d009900c900d600e500ea00ee00f000f800060117001c0020002100'
+    '220023002400270028002c003b003f0048005b005c005e005f0064007600770079007c007f0087008f00900092009300'
+    '95009d009e00a000a100ab00ae00af00b100b300b800be00bf00c100c400df00e000e300e400eb00ec00ed00ef00f100'
+    'f200f400f600f700fb00fd00140017001c0020002100220023002400270028003f0048005c005f006500760077007900'
+    '7c008f0090009200930095009e00a100ae00af00b100b300b800be00bf00c100c400e300e400ec00ed00ef00f100f200'
+    'f300f400f500f600f700fd0014001c0020002100220023002400270028003f0048004d005c005f0065006e0076007700'
+    '790088008f009000920093009e00a100af00b100be00bf00c100e400ef00f000f200f300f400f500f600130014001500'
+    '200022002300280048004d005c005f0065006e0071007700800088009000930099009e00a100af00bf00e400e500f000'
+    'f300f400f500f6001300150020002300280031004d005c006e00710080008800900099009e00a100af00bf00e500e700'
+    'ee00f000f300f50012001300140015002000230028002f00310032004a004d005c0065006e0071007700800088009000'
+    '980099009e00a100a600a700af00bf00d600da00db00e200e500e700ea00ee00f000f300f500f800fc00060110001200'
+    '130015002f00310032004a004d0051006e00710075008000880098009900a600d600db00e500e700ea00ee00f000f300'
+    'f500f800ff00060113002f00310032004d00510071007500880098009900d600db00e500ea00ee00f000f80006011c00'
+    '20002100220023002400270028003b003f005c005f0065006800770079007a007c0090009200930095009e00af00b300'
+    'b800bf00c100c200c400e300e600ef00f100f200f400f600f700fd00fe00140015001c00200021002200230024002700'
+    '280039003b003f00420048005c005f00650068006e007600770079007a007c00800088008f0090009200930095009e00'
+    'a100af00b100b300b800be00bf00c100c200c400d900e300e400e600ef00f100f200f300f400f500f600f700fd00fe00'
+    '15002000210022002300240028003f0042005c00650068006e0077007a0080008800900093009e00af00bf00c200e600'
+    'e700f200f300f400f500f600f700fd00120013001500200022002300280042004d005c00650068006e0077007a008000'
+    '88009000930099009e00a600af00bf00c200e600e700f000f300f500f600f7001200130015002300280031004d005c00'
+    '65006e007700800088009000980099009e00a600af00bf00e700f000f30010001200130015002f00310032004a004d00'
+    '6e00710080008800980099009e00a600ba00db00e500e700f000f300f800ff00060110001200130015002f0031007500'
+    '9800ba00f800ff0006012f00310075009800f800ff000601230039003b00410042006500680077007a007c0090009300'
+    'af00b800bf00c200c400dc00e600f100f200f600f700fd00fe000001150020002300280039003b003f00410042005c00'
+    '6500680077007a007c00800090009300af00b800bf00c200c400dc00e600f100f200f300f600f700fd00fe0000011200'
+    '13001500230028003a003b00410042006500680077007a00800090009300a600af00b600bf00c200e600e700f200f300'
+    'f600f700fd00fe0010001200130015001d0023002600280031003a003c0042005c00650068006e0077007a0080008800'
+    '9000930098009e00a600af00b600ba00bf00c200e600e700f300f600f7000101100012001300150031003a0042006500'
+    '770080009800a600b600ba00bf00e700ff000f00100012001300150026002f0031003a003c0042007200750080009800'
+    'a600b600ba00db00e700f800ff00010102010601070108010f0010001200130015002f00300031003a00720075009800'
+    'ba00f800ff00010102010601080110002f0030003100720075009800ba00f800ff000201060139003b00400041004200'
+    '6500680077007a007d009300bf00c200c500dc00e600f700fe000001120015001d00230039003a003b003c0040004100'
+    '420054006500680077007a007c007d00800090009300af00b600bf00c200c500dc00e600e700f700f900fe0000011200'
+    '130015001a001d00260039003a003b003c004000410042006500680077007a00800090009300a600af00b600ba00bf00'
+    'c200dc00e600e700f700f900fe00000101010f00100012001300150019001a001d00260031003a003c00400041004200'
+    '6500680077007a008000900093009800a600af00b600ba00bf00c200db00e600e700f700f900fe00ff00010102010701'
+    '09010f00100011001200130015001a001d00260031003a003c003e004200650077007a0080009800a600b600ba00bf00'
+    'c200e700f900ff00010102010701080109010f00100012001300300031003a003c00b600ba00ff00010102010f001000'
+    '1100120013003000310036003a003c003e00660069006f0072007500810083009800b600ba00f800f900fa00ff000101'
+    '020106010701080109010f00100011002f003000310036003e00660069006f0072007500810083009800ba00f800fa00'
+    'ff00010102010601080140004100420068007a007d00c200c500dc00fe0000013a003c00400041004200540068007a00'
+    '7d00b600c200c500dc00f700f900fe000001100012001a001d0026003a003c00400041004200540068006c007a00b600'
+    'ba00c200dc00f700f900fe0000010101090110001a003a003c00400042006c00b600ba00f90001010f0010001a003a00'
+    '3c003e00420069006c00b600ba00f900fa00ff000101020109010f001000110012001a002600300036003a003c003d00'
+    '3e00660069006c006f007200810083008600b600ba00f900fa00ff00010102010701080109010f001000110030003600'
+    '3a003e00660069006c006f0072007500810083008600ba00bd00f900fa00ff0001010201300036003e00720083008600'
+    'ba00fa0002013c0040004100420054006b007d00c500cf00dc00f900fe0000011a003a003c0040004100420054006b00'
+    '6c007a007d00b600c500cf00dc00f900fe00000101010d013a003c00400041006c00b600f900000101013c0040006c00'
+    'f90001013c003e0069006c00f900fa00010102010f00100011003000360038003a003c003d003e00660069006c006f00'
+    '720078008100830086009100b000b600ba00bd00c000f900fa000101020109013000360038003d003e00660069006c00'
+    '810083008600bd00f900fa00010102013000360038003d003e006900810083008600bd00fa000201250027002b004400'
+    '4500470048005e005f00610062009500a000a100a300a400a900ab00ad00b300e800e900eb00ec00ed00ef00f400fb00'
+    '0301040122002400250027002b004400450046004700480050005b005e005f006100620087008a008c00920095009b00'
+    '9d00a000a100a300a400a900ab00ad00b100b300dd00e000e100e800e900eb00ec00ed00ef00f400f500fb00fc000301'
+    '04011c002200240027002b00440045004600470048004d0052005c005e005f00610087008a008c0099009b009d009e00'
+    'a000a100a300a400a900ab00ad00dd00de00e100e200e800e900ec00ed00ef00f000f400f500fb00fc00040145004600'
+    '470048004d0052005f008a008c0099009b00a100ab00de00e200ed00ee00f000f400f500fb00fc00040148004d005200'
+    '5c005f006e00710088008a008c008d0099009b009e00a100ab00de00e100e200e500ea00ed00ee00f000f400f500fc00'
+    '04014d00510052006e00710088008c008d0099009b00a100d600de00e200e500ea00ee00f000f500fc004d0051005200'
+    '8d009900ea00ee00f00051008d00ea00210022002400250027002b00440045004700480057005f0061009500a100a300'
+    'a900ab00ad00b300b800c400e800eb00ec00ed00ef00f400fb00fd002000210022002300240025002700280045004700'
+    '48005c005f0095009b009e00a100a300a900ab00ad00b300eb00ec00ed00ef00f400f500f600fb00fc00fd0020002100'
+    '22002300240027002800470048004d005c005f00880099009b009e00a100ab00ec00ed00ef00f000f400f500f600fb00'
+    'fc002000210022002300240027002800470048004d0052005c005f006e00710088008a008c00900099009b009e00a100'
+    'ab00af00e200e500ed00ee00f000f300f400f500f600fb00fc0004014d00880099009e00ee00f000f500fc004d006e00'
+    '710088008d009900e500ea00ee00f000f500fc00130015002f004a004d00510052006e00710088008c008d0098009900'
+    '9c009e00d600e500ea00ee00f000f500f800fc0006012f004d0051008d0099009c00ea00ee00f80006011c0020002100'
+    '2200230024002500270028003b0047004800560057005c005f007600770079007c008f00900092009300950096009e00'
+    'a100ab00ae00af00b100b300b400b800be00bf00c100c200c400e300eb00ec00ed00ef00f100f200f400f500f600f700'
+    'fb00fd00050120002100220023002400250027002800470048005c005f0077007c009000930095009e00a100ab00af00'
+    'b300b800bf00c400ef00f100f200f300f400f500f600f700fb00fd000501150020002100220023002400270028004700'
+    '48004a004d005c005f006e00770088009000930099009e00a100a700ab00af00bf00ef00f000f200f300f400f500f600'
+    'f700fc00fd00130015002000210022002300280048004a004d005c005f006e00770088009000930099009e00a100a600'
+    'a700af00bf00f000f300f400f500f600f700fc001300150023004a004d005c006e008800900099009e00a700af00f000'
+    'f300f5001200130015002f0031004a004d005c006e00710080008800980099009e00a600a700e500ee00f000f300f500'
+    'f800fc00060110001200130015002f0031004a004d0051006e0071007500800088008d00980099009c009e00a600a700'
+    'e500e700ea00ee00f000f300f500f800ff000601070108010a010b0113002f0031004d005100750088008d0098009900'
+    '9c00ea00ee00f000f800ff00060108010b01200021002200230024002500270028003b00560057005c005f0065007700'
+    '79007a007c0090009300950096009e00a100af00b300b400b800bf00c100c200c400ef00f100f200f400f600f700fd00'
+    'fe000501200021002200230028003b00420056005c0077007a007c00900093009e00af00bf00c200c400f100f200f300'
+    'f400f600f700fd00fe0005011200130015001d002000210022002300280042004a005c005f00650077007a0088009000'
+    '93009e00a100a600a700af00bf00c200f200f300f400f500f600f700fd0010001200130015001d001f00200021002200'
+    '23002400260028003a0042004a004d005c005f0065006e0077007a008000880090009300980099009e00a100a600a700'
+    'af00b600bf00c200e600e700f000f200f300f400f500f600f700fd0007010a010b0110001200130015001d0020002300'
+    '2600280031003a0042004a004d005c0065006e0077007a008000880090009300980099009e00a600a700af00b600ba00'
+    'bf00c200e700f000f300f500f600f700f800ff00070108010a010b0110001200130015001d0026002f0031003a004a00'
+    '4d006e00750080008800980099009e00a600a700b600ba00e700f000f300f800ff000601070108010a010b0110001200'
+    '130015002f0031004d00750098009900a600ba00f800ff000601070108012f0075009800f800ff000601080121002300'
+    '3b004100420054005600650077007a007c00900093009600af00b400bf00c200c400c500f100f200f600f700fd00fe00'
+    '0001050123003b004200560077007a0090009300af00bf00c200f600f700fd00fe001200130015001d00230026003a00'
+    '42004a00650077007a0090009300a600a700af00b600bf00c200f600f700fe00100012001300150019001a001d002300'
+    '26003a0042004a00650077007a008000900093009800a600a700af00b600ba00bf00c200f300f600f700010107011000'
+    '12001300150026003a0042009800a600b600ba00ff0007010f00100011001200130015001a00260031003a004a007200'
+    '9800a600b600ba00f800ff000101020106010701080109010f00100011001200130015002600300031003a006f007200'
+    '75009800a600b600ba00f800ff0001010201060107010801090110006f00720075009800ba00f800ff00020106010801'
+    '3b004100420054007a007d009600c200c500f700fe0000011d003b0041004200540077007a007d0093009600bf00c200'
+    'c500f700fe000001120015001a001d0026003a003c0041004200540077007a009300a600b600bf00c200f700f900fe00'
+    '000101010f00100012001300150019001a001d0026003a003c00420077007a009800a600b600ba00bf00c200f700f900'
+    '0101070109010f0010001100120013001a001d0026003a0042009800a600b600ba00f900ff0001010201070108010901'
+    '0f0010001100120026003a0066006f0072009800b600ba00ff00010102010701080109010f0010001100120013002600'
+    '300036003a003e005d006000660069006f007200750078008100830089008b00910098009f00a200b000b200b600ba00'
+    'c000f800fa00ff000101020106010701080109010f0010001100300036003e004f005d00660069006f00720075007800'
+    '8100830089008b00910098009f00b000ba00c000f800fa00ff00010102010601070108010901410054007d00c500fe00'
+    '000119001a001d0026003a003b003c0040004100420054007a007d00b600c200c500f700f900fe00000101010d010f00'
+    '1000120019001a001d0026003a003c003e0040004100420054005a00680069006c007a007d00a600b600ba00c200c500'
+    'f700f900fe00000101010201070109010c010d010f00100019001a001d0026003a003c003e00420069006c00b600ba00'
+    'f90001010201070109010d010f001000110019001a001d0026003a003c003d003e0042005d00660069006c006f007800'
+    '7b0081008300910094009f00b000b200b600ba00c000c300f900fa00ff00010102010701080109010d010c000f001000'
+    '110019001a002600300036003a003c003d003e005d006000660069006c006f00720078007b0081008300890091009400'
+    '9f00a200b000b200b600ba00c000c300f900fa00ff00010102010701080109010f00100011003000360038003a003d00'
+    '3e005d00660069006c006f00720075007800810083008600890091009f00b000ba00c000f900fa00ff00010102010701'
+    '08010901300036003e006f007200810083008600fa00020140004100540055007d00b900c500f900fe00000119001a00'
+    '1d0026003a003c004000410042005400550059005a0069006c007a007d00b600b900c200c500f900fe00000101010901'
+    '0d0119001a003a003c003e004000410054005a0069006c007d00b600b900c500f900fe000001010109010d013a003c00'
+    '3e0069006c00f900010109010d010f003c003d003e00660069006c00f9000101020109010f0011003000360038003d00'
+    '3e00660069006c006f0078007b008100830086009100b000c000c300f900fa000101020109010f001100300036003800'
+    '3d003e00660069006c006f00720078007b008100830086009100b000c000c300f900fa000101020109010e0111003000'
+    '360038003d003e00660069006f007200810083008600fa000201250027002b00440045004600470048005f0061006200'
+    'a100a300a400ab00e800e900eb00ec00f400fb00fc0003010401250027002b00440045004600470048005f006200a100'
+    'a300a400ab00f400fb00fc00030104012700440045004600470048004d005f0062008c009900a100a400ab00ed00f400'
+    'f500fb00fc000301040146004700480049004d005f008c009900a100a400ab00f400f500fb00fc000401460047004800'
+    '49004d0052005c005f0088008c008d0099009b009e00a100a400ab00ea00ed00ee00f000f400f500fb00fc0004014900'
+    '4d0051008c008d009900ea00ee00f000f500fc00510053008d009900ea00ee00510053008d009c00ea00210022002500'
+    '27004400450046004700480057005f0062009500a100a400ab00b300f400fb00fd000301040105012100250027004600'
+    '4700480057005c005f009e00a100a400ab00f400f500fb00fc00fd000401200021002200230025002700280045004600'
+    '470048004d005c005f00880099009e00a100a400aa00ab00af00ed00f400f500f600fb00fc00fd000401210023002700'
+    '28004600470048004d005c005f00880099009e00a100ab00f000f400f500f600fb00fc0004014a004d005c005f008800'
+    '8d0099009e00a100a700ee00f000f400f500fc0049004a004d0051005c006e0088008d0099009c009e00a100a700ea00'
+    'ee00f000f500fc0049004a004d005100530088008d00980099009c00a700ea00ee00f000f500f800fc0006010b012f00'
+    '4d005100530088008d00980099009c00ea00ee00f80006012100220023002400250027003b0047004800560057005c00'
+    '5f007c0090009300950096009e00a100aa00ab00af00b300b400c400ef00f100f200f400f600f700fb00fd0005012100'
+    '2300250027004700560057005c005f00900093009e00a100ab00af00b400f400f500f600fb00fd00050115001f002000'
+    '21002200230024002500270028004600470048004a004d00560057005c005f0077007a0088009000930099009e00a100'
+    'a600a700aa00ab00af00b400bf00c200ef00f000f200f300f400f500f600f700fb00fc00fd0005010a01120013001500'
+    '1f002000210022002300270028004600470048004a004b004c004d0056005c005f006e0077007a008800900093009800'
+    '99009e00a100a600a700aa00ab00af00bf00c200f000f300f400f500f600f700fb00fc00fd000a010b01120013001500'
+    '1f00230028004a004b004d005c005f007700880090009300980099009e00a100a600a700af00bf00f000f300f400f500'
+    'f600fc000a010b011200130015001f00230026004a004b004d005c006e007700800088008d009000980099009c009e00'
+    'a100a600a700af00bf00ee00f000f300f500f800fc00ff000601070108010a010b0110001200130015002f0031004a00'
+    '4d0051006e00750088008d00980099009c00a600a700ee00f000f500f800fc00ff000601070108010a010b0113002f00'
+    '4a004d00510075008d008e00980099009c00ee00f800ff00060108010b011f00210022002300250027003b0056005700'
+    '5c005f0077007a007c00900093009600a100af00b400bf00c200c400f100f200f400f600f700fd00fe0005011d001f00'
+    '20002100220023002500270028003b0042004a004c00560057005c005f0077007a007c009000930096009e00a100a700'
+    'af00b400bf00c200c400f200f400f500f600f700fd00fe0005011200130015001d001f00200021002200230026002700'
+    '28003b0042004a004b004c004d005400560057005c005f0077007a00880090009300960099009e00a100a600a700af00'
+    'b400b600bf00c200f200f300f400f500f600f700fd00fe0005010a010b010c01120015001d001f002300260042004a00'
+    '4d005c0077007a0088009000930098009e00a600a700af00bf00c200f600f7000a010b0110001200130015001d001f00'
+    '2300260042004a004b004d00770088009000980099009e00a600a700af00bf00ff00070108010a010b010c0110001200'
+    '1300150026004a004d00880098009900a600a700f800ff000601070108010a010b011000120013004a0075009800a600'
+    'f800ff000601070108010b0175009800f800ff000601080121003b00420054005600570077007a007c007d0090009300'
+    '9600b400bf00c200c500f600f700fd00fe00000105011d001f002100230026003b0042004a004c005400560057007700'
+    '7a00900093009600a600a700af00b400bf00c200c500f600f700fd00fe000001050112001300150019001a001d001f00'
+    '2100230026003a003b0042004a004b004c005400560077007a00900093009600a600a700af00b400b600bf00c200f600'
+    'f700fd00fe0007010a010b010c01100012001300150019001a001d001f00230026003a0042004a004b00540077007a00'
+    '900093009800a600a700af00b600ba00bf00c200f7000101070109010a010b010c010f00100012001300150019001a00'
+    '1d001f0026003a0042004a0060009800a600a700ac00b600ba00ff0001010701080109010a010b010c010f0010001100'
+    '120019001a0026003a004a00600072009800a200a600ac00b600ba00f800ff000101020106010701080109010a010b01'
+    '0c010f00100011001200130019001a0026003a004a004f005d0060006f007200750089008b0098009f00a200a500a600'
+    'ac00b000b600ba00f800ff000101020106010701080109010b010f00100011004f005d0060006f007200750089008b00'
+    '8e0098009f00a200ac00ba00f800ff0002010601070108013b00420054005500560059007a007d009600b400c200c500'
+    'f700fe0000011a001d0026003b0042005400560077007a007d0093009600b600c200c500f700fe000001100012001300'
+    '150019001a001d001f0026003a0042004a004b004c00540056005a0077007a007d00900093009600a600a700b600ba00'
+    'bf00c200c500f700f900fe0000010101070109010a010c010d010f001000120019001a001d0026003a00420054007a00'
+    'a600b600ba00c2000101070109010c010f0010001100120019001a001d0026003a0042005d0060006600910098009f00'
+    'a200a600ac00b000b200b600ba00ff00010102010701080109010c010c000f0010001100120019001a001d0026003a00'
+    '3e005d006000660069006f0072007800810089008b009100940098009f00a200a600ac00b000b200b600ba00c000ff00'
+    '010102010701080109010c010c000f00100011001900300036003a003e004f005d006000660069006f00720075007800'
+    '7b008100830089008b009100940098009f00a200ac00b000b200ba00c000c300f800fa00ff0001010201060107010801'
+    '09010e010c000f0010001100300036004f005d00600066006f007200750078008100830089008b0091009f00a200b000'
+    'b200c000f800fa00ff000201060108010e015400550059007d00c500fe00000119001a001d0026003a00410042005400'
+    '550059005a007a007d009600b600b900c200c500f700f900fe0000010c010d010f0010001100120019001a001d002600'
+    '3a003c003e00410042005400550059005a005d0060006300660069006c0078007a007b007d007e009100940097009f00'
+    'a200a600ac00b000b200b500b600b900ba00c000c200c300c500c600f700f900fe00000101010201070109010a010c01'
+    '0d010c000f0010001100120019001a001d0026003a003c003d003e00420054005a005d006000660069006c0078007a00'
+    '7b007e009100940097009f00a200a600ac00b000b200b500b600ba00c000c200c300c600f900fe00ff00010102010701'
+    '080109010c010d010c000f001000110019001a001d001e0026003a003d003e00420058005d006000660069006c006f00'
+    '720078007b008100830089009100940097009f00a200ac00b000b200b500b600ba00c000c300f900ff00010102010701'
+    '080109010c010d010c000d000e000f001000110019001a001e002600300036003a003d003e005d006000660069006c00'
+    '6f00720078007b008100830089008b00910094009f00a200ac00b000b200b600ba00c000c300f900fa00ff0001010201'
+    '0701080109010d010e010c000d000e000f00100011001e003000360038003d003e004e004f005d006000660069006f00'
+    '720078007b0081008300860089008b00910094009f00a200ac00b000b200ba00c000c300fa00ff000101020107010801'
+    '09010e010c000d000e000f0011001e003000360038003d003e004e004f005d006000660069006f007200750078007b00'
+    '81008300860089008b00910094009f00a200b000b200c000c300fa00ff00020108010e015400550059005a007d00b900'
+    'c500fe00000119001a001d0026003a003c004000410042005400550059005a006c007a007d007e009700b500b600b900'
+    'c500c600f900fe000001010109010c010d010c000f001000110019001a001d0026003a003c003d003e00400041004200'
+    '54005500580059005a005d006000660069006c0078007a007b007d007e009100940097009f00a200ac00b000b200b500'
+    'b600b900ba00c000c300c500c600f900fe00000101010201070109010c010d010c000f00110019001a001e0026003a00'
+    '3c003d003e00540058005a005d006000660069006c0078007b007e0081009100940097009f00a200b000b200b500b600'
+    'b900ba00c000c300c600f9000101020109010d010c000f00110019001a001e003a003d003e0058005d00660069006c00'
+    '6f0078007b007e00810083009100940097009f00b000b200b500c000c300c600f9000101020109010d010c000d000e00'
+    '0f0011001e00300036003d003e005d00660069006c006f0078007b00810083008900910094009f00b000b200c000c300'
+    'f900fa000101020109010d010e010200060008000b000c000d000e000f0011001b001e0029003000360038003d003e00'
+    '4e005d00660069006c006f00720078007b008100830086008900910094009f00b000b200c000c300fa00010102010901'
+    '0e01020008000c000d000e0011001b001e0029003000360038003d003e004e00660069006f0078007b00810083008600'
+    '8900910094009f00b000c000c300fa0002010e01250027004400460047006200a400aa00ab00fb000301040146004700'
+    '6200a400aa00ab00fb00fc0003010401460047004900a400aa00ab00fb00fc0004012700450046004700480049004d00'
+    '5f008c008d009900a100a400aa00ab00f400f500fb00fc0004014600470049004d005f008c008d009900a100a400aa00'
+    'ab00ee00f500fc000401490053008d009900fc0053008d009c00510053008d009c002100250027004400460047005700'
+    '5f006200a100a400aa00ab00fb00fd0003010401050121002500270044004600470057005c005f006200a100a400aa00'
+    'ab00f400f500fb00fc00fd000301040105011f0021002500270046004700480049004a004d0057005c005f0062008800'
+    '99009e00a100a400a700aa00ab00f400f500f600fb00fc00fd000301040105011f002100230025002700460047004800'
+    '49004a004b004d005c005f0088008d009000930099009e00a100a400a700aa00ab00af00f000f400f500f600fb00fc00'
+    'fd0004010a011f00210023002700280046004700480049004a004b004c004d005c005f0088008c008d00900098009900'
+    '9c009e00a100a400a600a700aa00ab00af00ee00f000f400f500f600fb00fc0004010a010b011f00460049004a004d00'
+    '5100530088008d00980099009c009e00a100a600a700ee00f000f500fc0006010a010b0149004d00510053008d009900'
+    '9c000601510053008d009c002100250027004700560057009600aa00ab00b400fd0005011f0021002300250027004600'
+    '470048004a004b004c00560057005c005f0077007a009000930096009e00a100a700aa00ab00af00b400bf00c200f400'
+    'f500f600f700fb00fc00fd0005010a011d001f00210022002300250027004600470048004a004b004c004d0056005700'
+    '5c005f0077007a00880090009300960099009e00a100a600a700aa00ab00af00b400bf00c200f400f500f600f700fb00'
+    'fc00fd0005010a010b011f0021002300460047004a004b004c004d0056005c005f00880090009300980099009e00a100'
+    'a600a700aa00ab00af00f400f500f600fc00fd000a010b01120015001d001f002100230026004a004b004c004d005c00'
+    '5f006300880090009300980099009e00a100a500a600a700aa00af00f500fc0006010a010b011200130015001d001f00'
+    '2300260049004a004b004c004d005c00630088008d00980099009c009e00a100a500a600a700f000f500f800fc00ff00'
+    '0601070108010a010b010c01120013001f004a004b004d0053006300750088008d008e00980099009c00a500a600a700'
+    'f800ff000601070108010a010b014a004d005100530075008d008e00980099009c00a500f800ff00060108010b012100'
+    '2500560057009600b400fd0005011f0021004c005600570093009600a700b400c200fd0005011d001f00210026004a00'
+    '4b004c0056007a009300a600a700c200fd000a010c011d001f0026004a004b004c00a600a7000a010b010c0112001d00'
+    '1f0026004a004b004c0063009800a500a600a700070108010a010b010c0112001d001f0026004a004b004d0063009800'
+    'a500a600a700ac00ff000601070108010a010b010c014a00630075008e009800a500a600ac00f800ff00060107010801'
+    '0a010b014f0075008e009800f800ff00060108010b014c005400560059007a009600b400c200c500fd00fe0000010501'
+    '1a001d001f00260042004a004b004c00540055005600570059007a0093009600a700b400c200c500f700fd00fe000001'
+    '05010a010c01120019001a001d001f0026003a0042004a004b004c0054005600630077007a0093009600a600a700b400'
+    'b600bf00c200f700fd00fe0007010a010b010c01120019001a001d001f0026003a0042004a004b004c00540063009800'
+    'a500a600a700ac00b600070109010a010b010c010f0010001100120019001a001d001f0026003a0042004a004b004c00'
+    '5d006000630098009f00a200a500a600a700ac00b600ba00ff000101020106010701080109010a010b010c010f001000'
+    '1100120019001a001d0026003a004a004b004f005d00600063006f00720089008b00910098009f00a200a500a600a700'
+    'ac00b000b200b600ba00ff000101020106010701080109010a010b010c010f001000110019001a0026004a004f005d00'
+    '600063006f007200750089008b008e00910098009f00a200a500a600ac00b000b200b600ba00f800ff00010102010601'
+    '0701080109010a010b010c010f0011004f005d0060006f007200750089008b008e0098009f00a200a500ac00f800ff00'
+    '02010601070108010b0154005500560059007a007d009600b400c200c500fe00000154007d00c500fe0019001a001d00'
+    '26003a0042004b004c0054005a007a00a600b600c200fe000a010c010d010f00120019001a001d0026003a0042004b00'
+    '54005a00600063009700a500a600ac00b500b6000101070109010a010b010c010d010f00110019001a001d0026003a00'
+    '5d0060006300910094009f00a200a500ac00b000b200b500b60001010701080109010c010c000f001000110019001a00'
+    '1d001e0026003a0058005d0060006300660069006f00720078007b008100830089008b0091009400970098009f00a200'
+    'a500a600ac00b000b200b500b600c000c300ff000101020106010701080109010a010b010c010d010e010c000f001000'
+    '110019001e0036003e004f0058005d0060006300660069006f007200750078007b008100830089008b008e0091009400'
+    '98009f00a200a500ac00b000b200b500c000c300ff000101020106010701080109010b010e010c000f0011001e003600'
+    '4e004f005d00600066006f007200750078008100830089008b008e00910094009f00a200ac00b000b200c000ff000201'
+    '060108010e015400550059007d00c50000011a001d005400550059005a007d00b600b900c500fe0000010d010f001900'
+    '1a001d0026003a0042005400550059005a0063006c007a007d007e009700ac00b500b600b900c500c600f900fe000001'
+    '0101070109010c010d010f00110019001a001d0026003a00540058005a005d0060006300660069006c0078007b007e00'
+    '9100940097009f00a200ac00b000b200b500b600c000c300c600f9000101070109010c010d0106000c000d000e000f00'
+    '1000110019001a001d001e0026003a003d003e0058005a005d0060006300660069006c006f00720078007b007e008100'
+    '830089008b009100940097009f00a200a500ac00b000b200b500b600ba00c000c300c600f900ff000101020107010801'
+    '09010c010d010e0106000b000c000d000e000f00110019001a001b001e00290036003a003d003e0058005d0060006600'
+    '69006f00720078007b008100830089008b009100940097009f00a200ac00b000b200b500b600c000c300c60001010201'
+    '0701080109010d010e0102000600080009000a000b000c000d000e000f0011001b001e00290036003d003e004e004f00'
+    '58005d006000660069006f00720078007b008100830089008b009100940097009f00a200ac00b000b200b500c000c300'
+    '01010201080109010e0100000100020003000400050006000700080009000a000b000c000d000e000f0011001b001e00'
+    '29003000360038003d003e004e004f0058005d006000660069006f007200750078007b0081008300860089008b008e00'
+    '910094009a009f00a200a800ac00b000b200b700bb00c000c300fa00ff000201080109010e015400550059005a007d00'
+    'b900c50000015400550059005a007d00b900c50000010d0119001a003a0054005500580059005a0069006c007b007d00'
+    '7e0094009700b200b500b600b900c300c500c600f9000001010109010c010d0119001a0058005a00660069006c007800'
+    '7b007e00910094009700b200b500b900c000c300c600f900010109010d0106000c000d000e000f00110019001a001b00'
+    '1e0029003d003e0058005a005d006000660069006c0078007b007e00810083009100940097009f00a200b000b200b500'
+    'c000c300c600f9000101020109010d010e0100000200040005000600080009000a000b000c000d000e000f0011001b00'
+    '1e00290036003d003e004e0058005d006000660069006c006f0078007b007e008100830089009100940097009f00a200'
+    'b000b200b500c000c300c6000101020109010d010e0100000100020003000400050006000700080009000a000b000c00'
+    '0d000e000f0011001b001e002900360038003d003e004e0058005d006000660069006c006f00720078007b007e008100'
+    '8300860089008b009100940097009a009f00a200a800b000b200b500b700bb00c000c300c600020109010e0100000100'
+    '020003000400050006000700080009000a000b000c000d000e000f0011001b001e0029003000360038003d003e004e00'
+    '58005d00660069006f00720078007b0081008300860089008b00910094009a009f00a800b000b200b700bb00c000c300'
+    'fa0002010e01250044004600470057006200a400aa00ab00fb0003010401460047006200a400aa000301040146004700'
+    '4900a400aa00ab00fc00040146004900a400aa00fc000401460049008d00490053008d009c00fc00490053008d009c00'
+    '53008d009c00210025004600470057006200a400aa00ab00fb000301040105012500460047005700a400aa0025004600'
+    '47004900a400aa00ab00fb00fc0004011f002100250027004600470049004a004b004c004d00560057005f008d009900'
+    'a100a400a700aa00ab00f400f500fb00fc00fd0004010a010b011f00460049004a004b004c004d008d0099009c00a100'
+    'a700aa00f500fc0004010a010b011f00460049004a004b004c004d005100530088008d00980099009c00a100a600a700'
+    'aa00f500fc00040106010a010b01490053008d009c0053008d009c001f0021002500460047004c00560057009600aa00'
+    'ab00b400fb00fd0005011f0021002500460047004a004b004c00560057009600a700aa00ab00b400fd0005011f002100'
+    '2500460047004a004b004c00560057005f009600a100a600a700aa00ab00b400fb00fc00fd0005010a010b011d001f00'
+    '21004600470049004a004b004c004d0056005f00630098009900a100a600a700aa00ab00fc00fd000a010b011d001f00'
+    '21002600460049004a004b004c004d005600630088008d00980099009c00a100a500a600a700aa00f500fc0006010701'
+    '08010a010b010c011d001f00260049004a004b004c004d0063008d008e00980099009c00a500a600a700fc0006010701'
+    '08010a010b010c011f004a004b004d00530063008d008e00980099009c00a500a600a7000601070108010a010b018e00'
+    '9c0006010b011f00210025004c005400560057009600aa00b400fd0005011d001f00210025004a004b004c0054005600'
+    '57009600a700aa00b400fd0005010a011d001f004a004b004c005600a7000a011d001f0026004a004b004c006300a500'
+    'a600a7000a010b010c011d001f0026004a004b004c0063009800a500a600a700ac00070108010a010b010c011f002600'
+    '4a004b0063009800a500a600a700ac000601070108010a010b010c01190026004a004b004f005d006000630072007500'
+    '89008b008e0098009c009f00a200a500a600a700ac00f800ff000601070108010a010b010c014f006000630072007500'
+    '89008b008e0098009c00a200a500ac00f800ff000601070108010a010b011d001f004c00540055005600570059007d00'
+    '9600b400c500fd00fe00000105011a001d001f0026004a004b004c00540055005600570059007a007d009600a700b400'
+    'c200c500fd00fe0005010a010c0119001a001d001f0026004a004b004c00540056006300a7000a010c0119001a001d00'
+    '1f0026004a004b004c0054006300a500a600a700ac00b60007010a010b010c0119001a001d001f0026004a004b004c00'
+    '5d00600063009800a200a500a600a700ac00b6000701080109010a010b010c01110019001a0026004a004b005d006000'
+    '630089008b0098009f00a200a500ac0006010701080109010a010b010c010f001000110019001a0026004a004b004f00'
+    '5d00600063006f0072007500780089008b008e009100940098009f00a200a500a600ac00b000b200b600c000ff000201'
+    '06010701080109010a010b010c014f005d0060006f00720089008b008e009f00a200a500ac00060108014c0054005500'
+    '560059007d009600b400c500fe0000011d004c0054005500560059005a007d009600c50019001a001d001f0026004b00'
+    '4c0054005500560059005a0063007d009700a600b500b600c500fe00070109010a010c010d0119001a001d001f002600'
+    '3a004b004c00540058005a005d006000630094009700a200a500a600ac00b000b200b500b600070109010a010b010c01'
+    '0d010c000f00110019001a001d0026004b0058005a005d006000630066006f0078007b0089008b009100940097009f00'
+    'a200a500a600ac00b000b200b500b600c000c30001010701080109010a010b010c010d010c001100190058005d006000'
+    '63006f00780089008b009100940097009f00a200a500ac00b000b200b500c0000701080109010c0106000c000d000e00'
+    '0f00110019001e004e004f0058005d0060006300660069006f00720078007b008100830089008b008e00910094009700'
+    '9f00a200a500ac00b000b200b500c000c30006010701080109010b010e010c0011001e004e004f0058005d0060006600'
+    '6f0072007800810089008b008e00910094009f00a200a500ac00b000b200c000060108010e015400550059005a007d00'
+    'b900c500000119001a001d005400550059005a007d00b900c500fe0000010c010d0119001a0054005a009700b500b900'
+    '0c010d0119001a001d002600540058005a005d0060006300690078007b007e009100940097009f00a200a500ac00b000'
+    'b200b500b600b900c000c300c600070109010c010d010c000d000f00110019001a001e0058005a005d00600063006600'
+    '690078007b007e009100940097009f00a200ac00b000b200b500c000c300c600070109010c010d0106000a000b000c00'
+    '0d000e000f00110019001a001b001e00290058005d006000660069006f0078007b007e008100830089008b0091009400'
+    '97009f00a200ac00b000b200b500c000c300c60009010d010e0100000100020003000400050006000700080009000a00'
+    '0b000c000d000e000f00110019001b001e00290036003d004e004f0058005d006000660069006f00720078007b008100'
+    '830089008b009100940097009a009f00a200a800ac00b000b200b500b700bb00c000c300c600080109010e0100000100'
+    '020003000400050006000700080009000a000b000c000d000e000f0011001b001e002900360038003d004e004f005800'
+    '5d006000660069006f00720078007b008100830089008b008e00910094009a009f00a200a800ac00b000b200b700bb00'
+    'c000c30008010e015400550059005a007d00b900c5000001550059005a007d00b900c5005a007e009700b500b900c600'
+    '0d01190058005a00690078007b007e0094009700b200b500b900c000c300c60009010d0106000c000d000e001b001e00'
+    '29003d0058005a005d006600690078007b007e009100940097009f00b000b200b500c000c300c60009010d0100000100'
+    '020003000400050006000700080009000a000b000c000d000e0011001b001e00290036003d004e0058005d0060006600'
+    '69006f0078007b007e008100830089009100940097009a009f00a200a800b000b200b500b700bb00c000c300c6000901'
+    '0d010e0100000100020003000400050006000700080009000a000b000c000d000e001b001e0029003d004e0058006600'
+    '690078007b007e00810083009100940097009a00a800b000b200b500b700bb00c000c300c6000e010000010002000300'
+    '0400050006000700080009000a000b000c000d000e001b001e00290038003d004e005800660078007b00810083008900'
+    '910094009a00a800b000b700bb00c000c3000e01'
+)
@@ -2,13 +2,24 @@ import os
 from PyQt6.QtGui import QColor
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Per-user storage (tokens, caches); system Local AppData on Windows, home dir elsewhere
+APP_DATA_DIR = os.path.join(os.environ.get('LOCALAPPDATA', os.path.expanduser('~')), 'FrameTamer')
 DEFAULT_MAT_COLOR = QColor("#FBFBF9")
 DEFAULT_FRAME_COLOR = QColor(60, 40, 30)
-DEFAULT_TEXTURE_PATH = os.path.join(BASE_DIR, "textures", "walnut.png")
+TEXTURES_DIR = os.path.join(BASE_DIR, "textures") # texture library, independent of the working directory
+DEFAULT_TEXTURE_PATH = os.path.join(TEXTURES_DIR, "walnut.png")
+DEFAULT_IMAGE_PATH = os.path.join(BASE_DIR, "assets", "default_art.jpg") # bundled startup art, no network needed
 QUICK_MAT_COLORS = ["#FBFBF9", "#F5F5F8", "#FFFFF0", "#B2BEB1", "#2C2C2C"]
 QUICK_FRAME_COLORS = ["#7F6350", "#5D432C", "#694B37", "#BC9E82", "#F5F5DC", "#1A1A1A"]
 GRID_MAJOR_COLOR = QColor(255, 255, 0, 200)
 GRID_MINOR_COLOR = QColor(0, 255, 255, 80)
+# Resampling method per call site: "smooth" (QImage.scaled), "area", "lanczos" or "auto" (see resample.py)
+RESAMPLE_EXPORT = "auto"
+RESAMPLE_PREVIEW = "smooth"
+RESAMPLE_PDF_PREVIEW = "smooth"
+THUMBNAIL_WORKERS = 8 # concurrent Google Photos thumbnail downloads
+SAMPLER_PROXY_SIDE = 2048 # long edge of the texture sampler's on-screen copy
+TEXTURE_FACE_PX = 256 # saved textures are normalized so the moulding face spans this many pixels
 RICK_ROLL_URL = "https://img.youtube.com/vi/dQw4w9WgXcQ/0.jpg"
 
 RICK_ASCII = """
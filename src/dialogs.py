@@ -4,14 +4,21 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                              QAbstractItemView, QStackedWidget, QCheckBox, 
                              QFrame, QWidget, QMessageBox, QColorDialog,
                              QGridLayout, QGroupBox, QRadioButton, QButtonGroup, 
-                             QFormLayout, QScrollArea)
-from PyQt6.QtCore import Qt, QRect, QRectF, QPointF, QEvent, QSize, QThread, pyqtSignal, QTimer, QSettings, QPoint
+                             QFormLayout, QScrollArea, QListView, QComboBox, QDateEdit, QLineEdit, QApplication)
+from PyQt6.QtCore import (Qt, QRect, QRectF, QPointF, QEvent, QSize, QThread, pyqtSignal, QTimer, QSettings, QPoint, QFileSystemWatcher,
+                          QObject, QAbstractListModel, QModelIndex, QDate, QDateTime, QTime)
 from PyQt6.QtGui import QPixmap, QPainter, QColor, QPen, QTransform, QIcon, QImage, QFont, QPdfWriter, QPageSize
 import os
+import time
 import threading
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from .utils import ColorUtils, UnitUtils
-from .google_photos import GooglePhotosManager
+from .photo_cache import photo_cache, LISTING_TTL
+from .photo_index import photo_index, ORIENTATIONS, RECONCILE_DAYS
+from .image_cache import image_cache, pixmap_key, load_source_pixmap, CATEGORY_LABELS
+from .resample import scaled_pixmap
+from .constants import RESAMPLE_PDF_PREVIEW, APP_DATA_DIR, THUMBNAIL_WORKERS, SAMPLER_PROXY_SIDE, TEXTURES_DIR
+from . import texture_library
 
 class TextureSamplerDialog(QDialog):
     def __init__(self, parent=None):
@@ -21,7 +28,7 @@ class TextureSamplerDialog(QDialog):
         
         # Data
         self.pixmap_orig = None
-        self.pixmap_rotated = None # Cache rotated version
+        self.pixmap_view = None # Screen-sized copy; rotated by the painter while straightening
         self.selection_norm = QRectF(0.2, 0.2, 0.6, 0.1) 
         self.texture_side = None
         
@@ -92,7 +99,12 @@ class TextureSamplerDialog(QDialog):
         self.slider_rot = QSlider(Qt.Orientation.Horizontal)
         self.slider_rot.setRange(-450, 450); self.slider_rot.setValue(0) # +/- 45 deg
         self.slider_rot.valueChanged.connect(self.on_rotation_changed)
+        self.slider_rot.sliderReleased.connect(self.update_display) # redraw smoothly once the drag ends
         h_ctrl.addWidget(self.slider_rot)
+
+        btn_auto = QPushButton("Auto Straighten"); btn_auto.clicked.connect(self.auto_straighten)
+        btn_auto.setToolTip("Detect the moulding's edges, straighten it and select a strip along them")
+        h_ctrl.addWidget(btn_auto)
         
         btn_reset = QPushButton("Reset View"); btn_reset.clicked.connect(self.reset_view)
         h_ctrl.addWidget(btn_reset)
@@ -118,7 +130,7 @@ class TextureSamplerDialog(QDialog):
         # Since we are in src/dialogs.py, we go up one level
         default_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "texture_default.jpg")
         if os.path.exists(default_path):
-            self.pixmap_orig = QPixmap(default_path)
+            self.set_source(QPixmap(default_path))
             self.slider_rot.setValue(0)
             self.reset_view()
             self.on_rotation_changed()
@@ -129,14 +141,15 @@ class TextureSamplerDialog(QDialog):
         if not tex: return
         name, ok = QInputDialog.getText(self, "Save Texture", "Texture Name:")
         if ok and name:
-            if not os.path.exists("textures"): os.makedirs("textures")
-            path = os.path.join("textures", f"{name}.png")
+            os.makedirs(TEXTURES_DIR, exist_ok=True)
+            path = os.path.join(TEXTURES_DIR, f"{name}.png")
             tex.save(path)
+            texture_library.texture_catalog().add(path, tex.toImage()) # metadata, tile and strip levels, computed once
 
     def load_image(self):
         path, _ = QFileDialog.getOpenFileName(self, "Open Image", "", "Images (*.png *.jpg *.jpeg)")
         if path:
-            self.pixmap_orig = QPixmap(path)
+            self.set_source(load_source_pixmap(path))
             self.slider_rot.setValue(0)
             self.reset_view()
             self.on_rotation_changed()
@@ -151,12 +164,23 @@ class TextureSamplerDialog(QDialog):
         self.grid_visible = False
         self.update_display()
 
+    def set_source(self, pixmap):
+        self.pixmap_orig = pixmap
+        self.pixmap_view = scaled_pixmap(pixmap, SAMPLER_PROXY_SIDE, SAMPLER_PROXY_SIDE) \
+            if max(pixmap.width(), pixmap.height()) > SAMPLER_PROXY_SIDE else pixmap
+
+    def rotation_transform(self):
+        return QTransform().rotate(self.slider_rot.value() / 10.0)
+
+    def rotated_size(self):
+        """Size of the straightened original (its rotated bounding box), without rotating any pixels."""
+        if not self.pixmap_orig: return QSize()
+        return self.rotation_transform().mapRect(QRectF(self.pixmap_orig.rect())).toAlignedRect().size()
+
     def on_rotation_changed(self):
         if not self.pixmap_orig: return
-        deg = self.slider_rot.value() / 10.0
-        t = QTransform().rotate(deg)
-        self.pixmap_rotated = self.pixmap_orig.transformed(t, Qt.TransformationMode.SmoothTransformation)
-        
+        # Rotation is applied by the painter to the proxy in update_display; the original is only
+        # rotated when the texture is extracted
         # Show grid for 500ms
         if getattr(self, 'fully_initialized', False):
             self.grid_visible = True
@@ -165,6 +189,16 @@ class TextureSamplerDialog(QDialog):
         # FIX: Do NOT reset view here, just update display to keep zoom/pan
         self.update_display()
 
+    def auto_straighten(self):
+        """Sets the rotation and selection from the dominant edges of the on-screen proxy."""
+        if not self.pixmap_view: return
+        from . import straighten # numpy-backed; imported on first use
+        result = straighten.detect(self.pixmap_view.toImage())
+        self.slider_rot.setValue(int(round(result['angle'] * 10)))
+        self.selection_norm = result['selection']
+        if self.texture_side is None: (self.rb_side_top if result['horizontal'] else self.rb_side_left).setChecked(True)
+        self.update_display()
+
     def set_texture_side(self, side, checked):
         if not checked: return
         self.texture_side = side
@@ -173,10 +207,11 @@ class TextureSamplerDialog(QDialog):
 
     def get_transforms(self):
         """Returns (draw_rect, scale) for the image on the label"""
-        if not self.pixmap_rotated: return QRectF(), 1.0
+        if not self.pixmap_orig: return QRectF(), 1.0
         
         Lw, Lh = self.lbl_preview.width(), self.lbl_preview.height()
-        Iw, Ih = self.pixmap_rotated.width(), self.pixmap_rotated.height()
+        size = self.rotated_size()
+        Iw, Ih = size.width(), size.height()
         
         if Iw == 0 or Ih == 0: return QRectF(), 1.0
         fit_scale = min(Lw/Iw, Lh/Ih) * 0.9
@@ -191,7 +226,7 @@ class TextureSamplerDialog(QDialog):
         return QRectF(Ix, Iy, Dw, Dh), final_scale
 
     def update_display(self):
-        if not self.pixmap_rotated: return
+        if not self.pixmap_view: return
         
         w, h = self.lbl_preview.width(), self.lbl_preview.height()
         if w <= 0 or h <= 0: return
@@ -200,10 +235,18 @@ class TextureSamplerDialog(QDialog):
         canvas.fill(QColor(32, 32, 32))
         p = QPainter(canvas)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
-        p.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        # Nearest-neighbour while the slider is held keeps dragging fluid; smooth once it settles
+        p.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, not self.slider_rot.isSliderDown())
 
         img_rect, scale = self.get_transforms()
-        p.drawPixmap(img_rect.toRect(), self.pixmap_rotated)
+        # Draw the proxy rotated about the centre of the straightened image's bounding box
+        p.save()
+        p.translate(img_rect.center())
+        p.rotate(self.slider_rot.value() / 10.0)
+        view_scale = scale * self.pixmap_orig.width() / self.pixmap_view.width()
+        p.scale(view_scale, view_scale)
+        p.drawPixmap(QPointF(-self.pixmap_view.width() / 2, -self.pixmap_view.height() / 2), self.pixmap_view)
+        p.restore()
         
         # Draw Grid Overlay (Helpful for straightening)
         # 100px fixed-spacing "Window-Frame" grid
@@ -269,7 +312,7 @@ class TextureSamplerDialog(QDialog):
         self.lbl_preview.setPixmap(canvas)
 
     def eventFilter(self, source, event):
-        if source == self.lbl_preview and self.pixmap_rotated:
+        if source == self.lbl_preview and self.pixmap_view:
             if event.type() == QEvent.Type.Wheel:
                 delta = event.angleDelta().y()
                 factor = 1.1 if delta > 0 else 0.9
@@ -398,29 +441,41 @@ class TextureSamplerDialog(QDialog):
                 
         return super().eventFilter(source, event)
 
+    def side_transform(self, cw, ch):
+        """Orients a cw x ch strip so the frame's outer edge is at the top. Returns (transform, out_w, out_h)."""
+        if self.texture_side == "bottom": return QTransform(1, 0, 0, -1, 0, ch), cw, ch
+        if self.texture_side == "left": return QTransform(0, 1, 1, 0, 0, 0), ch, cw
+        if self.texture_side == "right": return QTransform(-1, 0, 0, 1, cw, 0) * QTransform(0, 1, 1, 0, 0, 0), ch, cw
+        return QTransform(), cw, ch
+
     def get_texture(self):
-        if not self.pixmap_rotated: return None
+        if not self.pixmap_orig: return None
         if not self.texture_side: return None
-        w, h = self.pixmap_rotated.width(), self.pixmap_rotated.height()
+        size = self.rotated_size()
+        w, h = size.width(), size.height()
         r = QRectF(self.selection_norm.x()*w, self.selection_norm.y()*h, 
                    self.selection_norm.width()*w, self.selection_norm.height()*h).toRect()
         if r.width() < 1 or r.height() < 1: return None
-        
-        crop = self.pixmap_rotated.copy(r)
-
-        if self.texture_side == "bottom":
-            t = QTransform(1, 0, 0, -1, 0, crop.height())
-            crop = crop.transformed(t, Qt.TransformationMode.SmoothTransformation)
-        elif self.texture_side == "left":
-            t = QTransform(0, 1, 1, 0, 0, 0)
-            crop = crop.transformed(t, Qt.TransformationMode.SmoothTransformation)
-        elif self.texture_side == "right":
-            t = QTransform(-1, 0, 0, 1, crop.width(), 0)
-            crop = crop.transformed(t, Qt.TransformationMode.SmoothTransformation)
-            t = QTransform(0, 1, 1, 0, 0, 0)
-            crop = crop.transformed(t, Qt.TransformationMode.SmoothTransformation)
-
-        return crop
+
+        # One affine map from the unrotated original straight into the oriented strip:
+        # rotate, shift the straightened bounding box so the selection sits at the origin, then flip/transpose
+        rot = self.rotation_transform()
+        box = rot.mapRect(QRectF(self.pixmap_orig.rect()))
+        side, out_w, out_h = self.side_transform(r.width(), r.height())
+        m = rot * QTransform.fromTranslate(-box.x() - r.x(), -box.y() - r.y()) * side
+
+        # Only the source pixels under the strip are sampled (plus a pixel of margin for filtering)
+        src = m.inverted()[0].mapRect(QRectF(0, 0, out_w, out_h)).adjusted(-1, -1, 1, 1)
+        src = src.intersected(QRectF(self.pixmap_orig.rect())).toAlignedRect()
+
+        out = QImage(out_w, out_h, QImage.Format.Format_ARGB32_Premultiplied)
+        out.fill(Qt.GlobalColor.transparent)
+        p = QPainter(out)
+        p.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        p.setTransform(m)
+        p.drawPixmap(src, self.pixmap_orig, src)
+        p.end()
+        return QPixmap.fromImage(texture_library.normalize(out))
     
     def resizeEvent(self, event): self.update_display(); super().resizeEvent(event)
 
@@ -440,6 +495,14 @@ class TextureLibraryDialog(QDialog):
         self.list_widget.setSpacing(10)
         self.list_widget.itemSelectionChanged.connect(self.update_preview)
         left_lay.addWidget(QLabel("<b>Textures Found:</b>"))
+        search_row = QHBoxLayout()
+        self.edit_search = QLineEdit(); self.edit_search.setPlaceholderText("Search by name...")
+        self.edit_search.textChanged.connect(self.apply_search)
+        self.search_color = None
+        self.btn_search_color = QPushButton("By Color..."); self.btn_search_color.clicked.connect(self.pick_search_color)
+        btn_clear = QPushButton("Clear"); btn_clear.clicked.connect(self.clear_search)
+        search_row.addWidget(self.edit_search, 1); search_row.addWidget(self.btn_search_color); search_row.addWidget(btn_clear)
+        left_lay.addLayout(search_row)
         left_lay.addWidget(self.list_widget)
         
         # Right: Preview
@@ -466,25 +529,83 @@ class TextureLibraryDialog(QDialog):
         main_layout.addWidget(left_wid, 1)
         main_layout.addWidget(right_wid)
         
+        self.items = {} # path -> (QListWidgetItem, mtime)
+        self.placeholder = QPixmap(80, 80); self.placeholder.fill(QColor("#3a3a3a"))
+        self.loader = texture_library.ThumbnailLoader(parent=self)
+        self.loader.ready.connect(self.on_thumbnail)
+        # Files added, replaced or removed while the dialog is open update the list in place
+        os.makedirs(TEXTURES_DIR, exist_ok=True)
+        self.watcher = QFileSystemWatcher([TEXTURES_DIR], self)
+        self.watcher.directoryChanged.connect(lambda _: self.sync_timer.start())
+        self.sync_timer = QTimer(self); self.sync_timer.setSingleShot(True); self.sync_timer.setInterval(200)
+        self.sync_timer.timeout.connect(self.load_library)
+
         self.load_library()
         
     def load_library(self):
-        self.list_widget.clear()
-        if not os.path.exists("textures"): return
-        for fn in os.listdir("textures"):
-            if fn.lower().endswith(".png"):
-                path = os.path.join("textures", fn)
-                pix = QPixmap(path)
-                item = QListWidgetItem(fn[:-4])
-                item.setIcon(QIcon(pix))
+        """Brings the list in line with the folder: only added, changed or removed files are touched."""
+        found = texture_library.scan(TEXTURES_DIR)
+        for path in [p for p in self.items if p not in found]:
+            item, _ = self.items.pop(path)
+            self.list_widget.takeItem(self.list_widget.row(item))
+        self.list_widget.setSortingEnabled(False)
+        for path, mtime in sorted(found.items()):
+            if path in self.items and self.items[path][1] == mtime: continue
+            if path in self.items:
+                item = self.items[path][0]
+            else:
+                item = QListWidgetItem(os.path.basename(path)[:-4])
                 item.setData(Qt.ItemDataRole.UserRole, path)
                 self.list_widget.addItem(item)
+            self.items[path] = (item, mtime)
+            thumb = image_cache.get("library", (path, mtime))
+            if thumb is not None: item.setIcon(QIcon(thumb)); continue
+            item.setIcon(QIcon(self.placeholder))
+            self.loader.request(path, mtime)
+        self.apply_search()
+
+    def pick_search_color(self):
+        col = QColorDialog.getColor(self.search_color or QColor(120, 80, 50), self, "Find Textures by Color")
+        if not col.isValid(): return
+        self.search_color = col
+        self.btn_search_color.setStyleSheet(f"background-color: {col.name()};")
+        self.apply_search()
+
+    def clear_search(self):
+        self.search_color = None; self.btn_search_color.setStyleSheet("")
+        self.edit_search.clear(); self.apply_search()
+
+    def apply_search(self):
+        """Filters by name; with a search color, shows cataloged textures nearest that color first."""
+        text = self.edit_search.text().strip().lower()
+        if self.search_color is None:
+            self.list_widget.setSortingEnabled(True); self.list_widget.sortItems()
+            for item, _ in self.items.values(): item.setHidden(text not in item.text().lower())
+            return
+        rank = {n: i for i, n in enumerate(texture_library.texture_catalog().search(name=text, color=self.search_color))}
+        self.list_widget.setSortingEnabled(False)
+        current = self.list_widget.currentItem()
+        items = [self.list_widget.takeItem(0) for _ in range(self.list_widget.count())]
+        items.sort(key=lambda it: rank.get(os.path.basename(it.data(Qt.ItemDataRole.UserRole)), len(rank)))
+        for item in items:
+            self.list_widget.addItem(item)
+            item.setHidden(os.path.basename(item.data(Qt.ItemDataRole.UserRole)) not in rank)
+        if current: self.list_widget.setCurrentItem(current)
+
+    def on_thumbnail(self, path, mtime, img):
+        entry = self.items.get(path)
+        if img.isNull() or entry is None or entry[1] != mtime: return # gone or replaced meanwhile
+        thumb = image_cache.put("library", (path, mtime), QPixmap.fromImage(img))
+        entry[0].setIcon(QIcon(thumb))
+        if self.list_widget.currentItem() is entry[0]: self.update_preview()
                 
     def update_preview(self):
         item = self.list_widget.currentItem()
         if item:
-            pix = QPixmap(item.data(Qt.ItemDataRole.UserRole))
-            self.lbl_zoom.setPixmap(pix.scaled(200, 200, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+            path = item.data(Qt.ItemDataRole.UserRole)
+            thumb = image_cache.get("library", (path, self.items[path][1])) if path in self.items else None
+            if thumb is not None: self.lbl_zoom.setPixmap(thumb)
+            else: self.lbl_zoom.clear(); self.lbl_zoom.setText("Loading...")
         else:
             self.lbl_zoom.clear(); self.lbl_zoom.setText("Select to preview")
 
@@ -495,15 +616,26 @@ class TextureLibraryDialog(QDialog):
         if QMessageBox.question(self, "Delete", f"Delete '{item.text()}'?", 
                                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No) == QMessageBox.StandardButton.Yes:
             os.remove(path)
-            self.load_library()
+            texture_library.texture_catalog().remove(path)
+            self.items.pop(path, None)
+            self.list_widget.takeItem(self.list_widget.row(item))
             self.update_preview()
 
+    def done(self, result):
+        self.watcher.removePaths(self.watcher.directories()); self.sync_timer.stop()
+        self.loader.shutdown()
+        super().done(result)
+
     def get_selected_texture(self):
         item = self.list_widget.currentItem()
-        if item: return QPixmap(item.data(Qt.ItemDataRole.UserRole))
+        if item: return QPixmap.fromImage(texture_library.load_texture(item.data(Qt.ItemDataRole.UserRole)))
         return None
 
-from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox, QWidget
+    def get_selected_path(self):
+        item = self.list_widget.currentItem()
+        return item.data(Qt.ItemDataRole.UserRole) if item else None
+
+from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox, QWidget, QSpinBox
 
 class PresetManagerDialog(QDialog):
     def __init__(self, parent=None):
@@ -553,63 +685,269 @@ class PresetManagerDialog(QDialog):
             self.load_presets()
 
 class PhotoLoader(QThread):
-    finished = pyqtSignal(list, str) # list of (id, pixmap, base_url), next_page_token
+    listed = pyqtSignal(list, str) # list of media ids, next_page_token
+    refreshed = pyqtSignal(list, str) # the cached listing was out of date; replaces what listed emitted
     error = pyqtSignal(str)
 
     def __init__(self, manager, page_token=None):
         super().__init__()
         self.manager = manager
+        self.cache = photo_cache()
         self.page_token = page_token
 
     def run(self):
         try:
-            data = self.manager.list_media_items(self.page_token)
-            items = data.get('mediaItems', [])
-            next_token = data.get('nextPageToken', "")
-            
-            results = []
-            for item in items:
-                # Fetch small thumbnail for the list
-                thumb_data = self.manager.get_image_data(item['baseUrl'], width=150, height=150)
-                img = QImage.fromData(thumb_data)
-                pix = QPixmap.fromImage(img)
-                results.append((item['id'], pix, item['baseUrl']))
-            
-            self.finished.emit(results, next_token)
+            # Render from the cached listing immediately, refresh it only once it is stale
+            data, age = self.cache.get_listing(self.page_token)
+            if data is not None:
+                self.listed.emit([item['id'] for item in data.get('mediaItems', [])], data.get('nextPageToken', ""))
+            if data is None or age > LISTING_TTL:
+                old_ids = [item['id'] for item in data.get('mediaItems', [])] if data else None
+                data = self.manager.list_media_items(self.page_token)
+                self.cache.put_listing(self.page_token, data)
+                ids = [item['id'] for item in data.get('mediaItems', [])]
+                if old_ids is None: self.listed.emit(ids, data.get('nextPageToken', ""))
+                elif ids != old_ids: self.refreshed.emit(ids, data.get('nextPageToken', ""))
+        except Exception as e:
+            self.error.emit(str(e))
+
+class ThumbnailFetcher(QObject):
+    """Downloads and decodes thumbnails on a bounded thread pool.
+
+    Only ids in the most recent request() are fetched; jobs for rows the user
+    has already scrolled past are dropped before touching the disk or network.
+    """
+    ready = pyqtSignal(str, QImage) # id, decoded thumbnail
+
+    def __init__(self, manager, size=150, workers=THUMBNAIL_WORKERS, parent=None):
+        super().__init__(parent)
+        self.manager = manager
+        self.cache = photo_cache()
+        self.size = size
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        self.wanted = set()
+        self.inflight = set()
+        self._lock = threading.Lock()
+        self._resolve_lock = threading.Lock()
+
+    def request(self, ids):
+        """ids in priority order (visible rows first); replaces any earlier request."""
+        with self._lock:
+            self.wanted = set(ids)
+            new = [m for m in ids if m not in self.inflight]
+            self.inflight.update(new)
+        for m in new: self.pool.submit(self._fetch, m)
+
+    def _resolve(self, media_id):
+        # baseUrls expire; refresh this id together with other wanted stale ids in one batchGet
+        with self._resolve_lock:
+            if not self.cache.stale_ids([media_id]): return
+            with self._lock: others = list(self.wanted - {media_id})
+            batch = [media_id] + self.cache.stale_ids(others)[:49]
+            self.cache.update_base_urls(self.manager.get_media_items(batch))
+
+    def _fetch(self, media_id):
+        try:
+            with self._lock:
+                if media_id not in self.wanted: return
+            data = self.cache.get_thumbnail(media_id, self.size, self.size)
+            if data is None:
+                self._resolve(media_id)
+                data = self.manager.get_image_data(self.cache.base_url(media_id), width=self.size, height=self.size)
+                self.cache.put_thumbnail(media_id, self.size, self.size, data)
+            self.ready.emit(media_id, QImage.fromData(data))
+        except Exception as e:
+            print(f"Thumbnail failed: {e}")
+        finally:
+            with self._lock: self.inflight.discard(media_id)
+
+    def shutdown(self):
+        with self._lock: self.wanted = set()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+class PhotoGridModel(QAbstractListModel):
+    """Media ids of the loaded pages; pixmaps are only held for rows near the viewport."""
+    def __init__(self, size=150, parent=None):
+        super().__init__(parent)
+        self.ids = []
+        self.rows = {} # id -> row
+        self.pixmaps = {}
+        self.placeholder = QPixmap(size, size); self.placeholder.fill(QColor("#3a3a3a"))
+        self.next_token = None
+        self.more = True
+        self.loading = False
+        self.page_start = 0 # first row of the page being loaded
+        self.fetch_page = None # callback(page_token) that starts loading the next page
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.ids)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid(): return None
+        pid = self.ids[index.row()]
+        if role == Qt.ItemDataRole.DecorationRole: return self.pixmaps.get(pid, self.placeholder)
+        if role == Qt.ItemDataRole.UserRole: return pid
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.more and not self.loading and self.fetch_page is not None
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent): return
+        self.loading = True
+        self.fetch_page(self.next_token)
+
+    def append_page(self, ids, next_token):
+        self.page_start = len(self.ids)
+        if ids:
+            self.beginInsertRows(QModelIndex(), len(self.ids), len(self.ids) + len(ids) - 1)
+            for pid in ids: self.rows[pid] = len(self.ids); self.ids.append(pid)
+            self.endInsertRows()
+        self.next_token = next_token
+        self.more = bool(next_token)
+
+    def replace_page(self, ids, next_token):
+        # The library changed since this page was cached: drop its rows and insert the fresh ones
+        if self.page_start < len(self.ids):
+            self.beginRemoveRows(QModelIndex(), self.page_start, len(self.ids) - 1)
+            for pid in self.ids[self.page_start:]: self.rows.pop(pid, None); self.pixmaps.pop(pid, None)
+            del self.ids[self.page_start:]
+            self.endRemoveRows()
+        self.append_page(ids, next_token)
+
+    def set_results(self, ids, more=False):
+        """Replaces all rows (search results, or an empty list to restart paging when more=True)."""
+        self.beginResetModel()
+        self.ids = list(ids)
+        self.rows = {pid: i for i, pid in enumerate(self.ids)}
+        self.pixmaps = {pid: pix for pid, pix in self.pixmaps.items() if pid in self.rows}
+        self.next_token = None; self.more = more; self.loading = False; self.page_start = 0
+        self.endResetModel()
+
+    def set_pixmap(self, pid, pix):
+        row = self.rows.get(pid)
+        if row is None: return
+        self.pixmaps[pid] = pix
+        idx = self.index(row)
+        self.dataChanged.emit(idx, idx, [Qt.ItemDataRole.DecorationRole])
+
+    def keep_only(self, first, last):
+        """Releases pixmaps for rows outside [first, last]."""
+        keep = set(self.ids[max(0, first):last + 1])
+        for pid in [p for p in self.pixmaps if p not in keep]: del self.pixmaps[pid]
+
+class PhotoFetchWorker(QThread):
+    """Fetches a picked photo in two stages: a screen-size rendition to show right away,
+    then the original streamed to APP_DATA_DIR/originals (resumable, cancellable)."""
+    preview_ready = pyqtSignal(QImage)
+    progress = pyqtSignal(int, int) # bytes received, total
+    original_ready = pyqtSignal(str) # local path
+    error = pyqtSignal(str)
+
+    def __init__(self, manager, media_id, preview_size=2048):
+        super().__init__()
+        self.manager = manager
+        self.media_id = media_id
+        self.preview_size = preview_size
+        self.dest_path = os.path.join(APP_DATA_DIR, "originals", media_id)
+        self._cancelled = False
+
+    def cancel(self): self._cancelled = True
+
+    def base_url(self):
+        cache = photo_cache()
+        if cache.stale_ids([self.media_id]): cache.update_base_urls(self.manager.get_media_items([self.media_id]))
+        return cache.base_url(self.media_id)
+
+    def run(self):
+        try:
+            if os.path.exists(self.dest_path): # downloaded before
+                self.original_ready.emit(self.dest_path); return
+            base_url = self.base_url()
+            data = self.manager.get_image_data(base_url, width=self.preview_size, height=self.preview_size)
+            self.preview_ready.emit(QImage.fromData(data))
+
+            os.makedirs(os.path.dirname(self.dest_path), exist_ok=True)
+            if self.manager.download_original(base_url, self.dest_path, self.progress.emit, lambda: self._cancelled):
+                self.original_ready.emit(self.dest_path)
+        except Exception as e:
+            self.error.emit(str(e))
+
+class PhotoIndexSync(QThread):
+    progress = pyqtSignal(int, int) # items indexed, new this sync
+    done = pyqtSignal(int)
+    error = pyqtSignal(str)
+
+    def __init__(self, manager, full=False):
+        super().__init__()
+        self.manager = manager
+        self.full = full # list the whole library now instead of waiting for the periodic full pass
+        self._cancelled = False
+
+    def cancel(self): self._cancelled = True
+
+    def run(self):
+        try:
+            # Synced pages carry fresh baseUrls; keep them so search results need no re-resolve
+            cache = photo_cache()
+            added = photo_index().sync(self.manager, self.progress.emit, lambda: self._cancelled,
+                                       lambda items: cache.update_base_urls({i['id']: i['baseUrl'] for i in items}), self.full)
+            self.done.emit(added)
         except Exception as e:
             self.error.emit(str(e))
 
 class GooglePhotosDialog(QDialog):
-    def __init__(self, parent=None):
+    THUMB_SIZE = 150
+    PREFETCH_SCREENS = 1 # rows requested beyond the viewport, in screenfuls
+    KEEP_SCREENS = 3 # pixmaps further than this from the viewport are released
+
+    def __init__(self, parent=None, frame_aspect=None, min_pixels=None):
         super().__init__(parent)
         self.setWindowTitle("Browse Google Photos")
-        self.resize(900, 700)
+        self.resize(1000, 750)
+        from .google_photos import GooglePhotosManager # Google client libraries load only when browsing
         self.manager = GooglePhotosManager()
-        self.selected_base_url = None
-        self.next_page_token = None
-        self.loading = False
+        self.loader = None
+        self.syncer = None
+        self.generation = 0 # bumped when switching between browsing and filtered results
+        self.frame_aspect = frame_aspect # opening w/h of the current frame
+        self.min_pixels = min_pixels # (w, h) pixels needed for the current print size and DPI
+        self.index = photo_index()
         
         layout = QVBoxLayout(self)
-        
-        # Grid list
-        self.list_widget = QListWidget()
-        self.list_widget.setViewMode(QListWidget.ViewMode.IconMode)
-        self.list_widget.setIconSize(QSize(150, 150))
-        self.list_widget.setResizeMode(QListWidget.ResizeMode.Adjust)
-        self.list_widget.setSpacing(10)
-        self.list_widget.setWordWrap(True)
-        layout.addWidget(self.list_widget)
+        layout.addLayout(self.setup_filters())
+        
+        # Virtualized grid: rows are just ids, thumbnails are requested for the visible range
+        self.model = PhotoGridModel(self.THUMB_SIZE, self)
+        self.model.fetch_page = self.load_page
+        self.view = QListView()
+        self.view.setViewMode(QListView.ViewMode.IconMode)
+        self.view.setIconSize(QSize(self.THUMB_SIZE, self.THUMB_SIZE))
+        self.view.setGridSize(QSize(self.THUMB_SIZE + 20, self.THUMB_SIZE + 20))
+        self.view.setUniformItemSizes(True)
+        self.view.setMovement(QListView.Movement.Static)
+        self.view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.view.setLayoutMode(QListView.LayoutMode.Batched); self.view.setBatchSize(500)
+        self.view.setModel(self.model)
+        self.view.doubleClicked.connect(self.accept)
+        layout.addWidget(self.view)
+
+        self.fetcher = ThumbnailFetcher(self.manager, self.THUMB_SIZE, parent=self)
+        self.fetcher.ready.connect(self.on_thumbnail)
+
+        # Coalesce scroll/resize/insert bursts into one visible-range update
+        self.visible_timer = QTimer(self); self.visible_timer.setSingleShot(True); self.visible_timer.setInterval(50)
+        self.visible_timer.timeout.connect(self.update_visible)
+        self.view.verticalScrollBar().valueChanged.connect(lambda _: self.visible_timer.start())
+        self.model.rowsInserted.connect(lambda *_: self.visible_timer.start())
         
         # Bottom controls
-        self.btn_load_more = QPushButton("Load More")
-        self.btn_load_more.clicked.connect(self.load_photos)
-        self.btn_load_more.hide()
-        
         btn_layout = QHBoxLayout()
         self.lbl_status = QLabel("Ready")
         btn_layout.addWidget(self.lbl_status)
+        self.btn_retry = QPushButton("Retry"); self.btn_retry.clicked.connect(self.retry_page); self.btn_retry.hide()
+        btn_layout.addWidget(self.btn_retry)
         btn_layout.addStretch()
-        btn_layout.addWidget(self.btn_load_more)
         
         btn_select = QPushButton("Select Photo"); btn_select.clicked.connect(self.accept)
         btn_select.setStyleSheet("background: #0078d7; color: white; font-weight: bold; padding: 5px 15px;")
@@ -618,51 +956,171 @@ class GooglePhotosDialog(QDialog):
         
         layout.addLayout(btn_layout)
         
-        # Start initial load
-        self.load_photos()
+        # Start initial load; later pages are pulled by the view through fetchMore as the user scrolls
+        self.update_index_label()
+        self.model.fetchMore()
 
-    def load_photos(self):
-        if self.loading: return
-        self.loading = True
-        self.lbl_status.setText("Connecting...")
-        self.btn_load_more.setEnabled(False)
-        
-        self.loader = PhotoLoader(self.manager, self.next_page_token)
-        self.loader.finished.connect(self.on_photos_loaded)
-        self.loader.error.connect(self.on_error)
+    def setup_filters(self):
+        """Filters run against the local metadata index (see Sync Library), not the API."""
+        row = QHBoxLayout()
+        self.combo_album = QComboBox(); self.combo_album.addItem("All Photos", None)
+        for album_id, title in self.index.albums(): self.combo_album.addItem(title or "(untitled)", album_id)
+        self.combo_orient = QComboBox(); self.combo_orient.addItems(ORIENTATIONS)
+        self.chk_dates = QCheckBox("Taken")
+        self.date_from = QDateEdit(QDate.currentDate().addYears(-1)); self.date_from.setCalendarPopup(True)
+        self.date_to = QDateEdit(QDate.currentDate()); self.date_to.setCalendarPopup(True)
+        self.chk_aspect = QCheckBox("Fits frame aspect"); self.chk_aspect.setEnabled(bool(self.frame_aspect))
+        self.chk_res = QCheckBox("Enough pixels for print"); self.chk_res.setEnabled(bool(self.min_pixels))
+        if self.min_pixels: self.chk_res.setToolTip(f"At least {self.min_pixels[0]} x {self.min_pixels[1]} px")
+        self.btn_sync = QPushButton("Sync Library"); self.btn_sync.clicked.connect(self.toggle_sync)
+
+        for w in [QLabel("Album:"), self.combo_album, self.combo_orient, self.chk_dates, self.date_from,
+                  QLabel("to"), self.date_to, self.chk_aspect, self.chk_res]: row.addWidget(w)
+        row.addStretch(); row.addWidget(self.btn_sync)
+
+        for combo in (self.combo_album, self.combo_orient): combo.currentIndexChanged.connect(lambda _: self.apply_filters())
+        for chk in (self.chk_dates, self.chk_aspect, self.chk_res): chk.toggled.connect(lambda _: self.apply_filters())
+        for edit in (self.date_from, self.date_to): edit.dateChanged.connect(lambda _: self.chk_dates.isChecked() and self.apply_filters())
+        return row
+
+    def filters_active(self):
+        return (self.combo_album.currentData() is not None or self.combo_orient.currentText() != "Any"
+                or self.chk_dates.isChecked() or self.chk_aspect.isChecked() or self.chk_res.isChecked())
+
+    def apply_filters(self):
+        self.generation += 1; self.btn_retry.hide()
+        if not self.filters_active():
+            # Back to paging through the API listing (served from the listing cache where possible)
+            self.model.set_results([], more=True)
+            self.model.fetchMore()
+            return
+        if not self.index.count():
+            self.model.set_results([])
+            self.lbl_status.setText("Sync Library first to search your photos locally")
+            return
+
+        kwargs = {'album_id': self.combo_album.currentData(), 'orientation': self.combo_orient.currentText()}
+        if self.chk_dates.isChecked():
+            kwargs['date_from'] = QDateTime(self.date_from.date(), QTime(0, 0)).toSecsSinceEpoch()
+            kwargs['date_to'] = QDateTime(self.date_to.date().addDays(1), QTime(0, 0)).toSecsSinceEpoch()
+        if self.chk_aspect.isChecked(): kwargs['aspect'] = self.frame_aspect
+        if self.chk_res.isChecked(): kwargs['min_long'], kwargs['min_short'] = max(self.min_pixels), min(self.min_pixels)
+
+        t = time.perf_counter()
+        ids = self.index.search(**kwargs)
+        self.model.set_results(ids)
+        self.lbl_status.setText(f"{len(ids)} matching photos ({(time.perf_counter() - t) * 1000:.0f} ms)")
+        self.visible_timer.start()
+
+    def update_index_label(self):
+        def when(key):
+            last = self.index.state(key)
+            return QDateTime.fromSecsSinceEpoch(int(float(last))).toString("yyyy-MM-dd hh:mm") if last else "never"
+        self.btn_sync.setToolTip(f"{self.index.count()} photos indexed, last sync: {when('last_sync')}, last full check: {when('last_full_sync')}\n"
+                                 "A sync stops at the first photos already indexed. Older photos uploaded since, and deletions, "
+                                 f"are picked up by a full check every {RECONCILE_DAYS} days. Shift-click to run one now.")
+
+    def toggle_sync(self):
+        if self.syncer and self.syncer.isRunning():
+            self.syncer.cancel(); self.btn_sync.setEnabled(False); return
+        self.syncer = PhotoIndexSync(self.manager, full=bool(QApplication.keyboardModifiers() & Qt.KeyboardModifier.ShiftModifier))
+        self.syncer.progress.connect(lambda total, added: self.lbl_status.setText(f"Indexing... {total} photos ({added} new)"))
+        self.syncer.done.connect(self.on_sync_done)
+        self.syncer.error.connect(self.on_error)
+        self.syncer.finished.connect(lambda: (self.btn_sync.setText("Sync Library"), self.btn_sync.setEnabled(True)))
+        self.btn_sync.setText("Stop Sync")
+        self.syncer.start()
+
+    def on_sync_done(self, added):
+        self.lbl_status.setText(f"Library indexed: {self.index.count()} photos ({added} new)")
+        current = self.combo_album.currentData()
+        self.combo_album.blockSignals(True)
+        self.combo_album.clear(); self.combo_album.addItem("All Photos", None)
+        for album_id, title in self.index.albums(): self.combo_album.addItem(title or "(untitled)", album_id)
+        self.combo_album.setCurrentIndex(max(0, self.combo_album.findData(current)))
+        self.combo_album.blockSignals(False)
+        self.update_index_label()
+        if self.filters_active(): self.apply_filters()
+
+    def load_page(self, page_token):
+        self.lbl_status.setText("Connecting..." if not self.model.ids else "Loading more...")
+        gen = self.generation
+        self.loader = PhotoLoader(self.manager, page_token)
+        self.loader.setParent(self) # a superseded loader keeps running until its page arrives
+        self.loader.listed.connect(lambda ids, tok: gen == self.generation and self.model.append_page(ids, tok))
+        self.loader.refreshed.connect(lambda ids, tok: gen == self.generation and self.model.replace_page(ids, tok))
+        self.loader.error.connect(lambda msg: gen == self.generation and self.on_page_error(msg))
+        self.loader.finished.connect(lambda: gen == self.generation and self.on_page_done())
         self.loader.start()
 
-    def on_photos_loaded(self, results, next_token):
-        self.loading = False
-        self.next_page_token = next_token
-        
-        for pid, pix, base_url in results:
-            item = QListWidgetItem()
-            item.setIcon(QIcon(pix))
-            item.setData(Qt.ItemDataRole.UserRole, base_url)
-            self.list_widget.addItem(item)
-            
-        self.lbl_status.setText(f"Loaded {self.list_widget.count()} photos")
-        self.btn_load_more.setEnabled(True)
-        self.btn_load_more.setVisible(bool(next_token))
+    def on_page_done(self):
+        self.model.loading = False
+        if not self.lbl_status.text().startswith("Error"):
+            self.lbl_status.setText(f"Loaded {self.model.rowCount()} photos")
+        self.visible_timer.start()
+        # Keep pulling pages while the grid doesn't fill the viewport yet; after that the view calls fetchMore on scroll
+        grid, vp = self.view.gridSize(), self.view.viewport().rect()
+        if self.model.rowCount() < max(1, vp.width() // grid.width()) * (vp.height() // grid.height() + 1): self.model.fetchMore()
+
+    def on_page_error(self, err_msg):
+        """A failed page stops paging (so the viewport refill can't retry it in a loop) until the user presses Retry."""
+        self.model.more = False; self.btn_retry.show()
+        self.on_error(err_msg)
+
+    def retry_page(self):
+        self.btn_retry.hide(); self.lbl_status.setText("Retrying...")
+        self.model.more = True; self.model.fetchMore()
+
+    def visible_rows(self):
+        """(first, last) row indices currently on screen, from the fixed grid geometry."""
+        grid = self.view.gridSize()
+        vp = self.view.viewport().rect()
+        first = -1
+        for y in range(0, grid.height(), 8):
+            idx = self.view.indexAt(QPoint(grid.width() // 2, y))
+            if idx.isValid(): first = idx.row(); break
+        if first < 0: return 0, -1
+        cols = max(1, vp.width() // grid.width())
+        return first, min(len(self.model.ids) - 1, first + cols * (vp.height() // grid.height() + 2) - 1)
+
+    def update_visible(self):
+        first, last = self.visible_rows()
+        if last < first: return
+        span = last - first + 1
+        ids = self.model.ids
+        lo, hi = max(0, first - span * self.PREFETCH_SCREENS), min(len(ids) - 1, last + span * self.PREFETCH_SCREENS)
+        self.model.keep_only(first - span * self.KEEP_SCREENS, last + span * self.KEEP_SCREENS)
+
+        # Visible rows first, then the prefetch window below and above
+        order = ids[first:last + 1] + ids[last + 1:hi + 1] + ids[lo:first]
+        wanted = []
+        for pid in order:
+            if pid in self.model.pixmaps: continue
+            pix = image_cache.get("photos", (pid, self.THUMB_SIZE))
+            if pix is not None: self.model.set_pixmap(pid, pix)
+            else: wanted.append(pid)
+        self.fetcher.request(wanted)
+
+    def on_thumbnail(self, pid, img):
+        if img.isNull(): return
+        self.model.set_pixmap(pid, image_cache.put("photos", (pid, self.THUMB_SIZE), QPixmap.fromImage(img)))
 
     def on_error(self, err_msg):
-        self.loading = False
         self.lbl_status.setText(f"Error: {err_msg}")
         QMessageBox.critical(self, "Photos Error", f"Failed to load photos:\n{err_msg}")
 
-    def get_selected_image(self):
-        item = self.list_widget.currentItem()
-        if item:
-            base_url = item.data(Qt.ItemDataRole.UserRole)
-            # Fetch higher res for the actual app
-            try:
-                data = self.manager.get_image_data(base_url, width=2048, height=2048)
-                img = QImage.fromData(data)
-                return QPixmap.fromImage(img)
-            except Exception as e:
-                QMessageBox.warning(self, "Download Error", f"Could not download full image: {e}")
-        return None
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.visible_timer.start()
+
+    def done(self, result):
+        self.fetcher.shutdown()
+        if self.syncer and self.syncer.isRunning(): self.syncer.cancel(); self.syncer.wait()
+        super().done(result)
+
+    def get_selected_media_id(self):
+        idx = self.view.currentIndex()
+        return idx.data(Qt.ItemDataRole.UserRole) if idx.isValid() else None
 
 class TutorialStep(QWidget):
     def __init__(self, title, description, image_path=None):
@@ -970,7 +1428,8 @@ class PDFPreviewDialog(QDialog):
         c_layout.addWidget(lbl_p1)
         
         self.img_blueprint = QLabel()
-        scaled_bp = page_blueprint.scaled(preview_width, preview_height, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        scaled_bp = image_cache.get_or_create("pdf", (pixmap_key(page_blueprint), preview_width, preview_height),
+            lambda: scaled_pixmap(page_blueprint, preview_width, preview_height, Qt.AspectRatioMode.KeepAspectRatio, RESAMPLE_PDF_PREVIEW))
         self.img_blueprint.setPixmap(scaled_bp)
         self.img_blueprint.setStyleSheet("border: 1px solid #444; background: white;")
         self.img_blueprint.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -988,7 +1447,8 @@ class PDFPreviewDialog(QDialog):
         c_layout.addWidget(lbl_p2)
         
         self.img_visual = QLabel()
-        scaled_vis = page_visual.scaled(preview_width, preview_height, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        scaled_vis = image_cache.get_or_create("pdf", (pixmap_key(page_visual), preview_width, preview_height),
+            lambda: scaled_pixmap(page_visual, preview_width, preview_height, Qt.AspectRatioMode.KeepAspectRatio, RESAMPLE_PDF_PREVIEW))
         self.img_visual.setPixmap(scaled_vis)
         self.img_visual.setStyleSheet("border: 1px solid #444; background: white;")
         self.img_visual.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -1014,3 +1474,112 @@ class PDFPreviewDialog(QDialog):
         btn_layout.addWidget(btn_cancel)
         btn_layout.addWidget(self.btn_save)
         layout.addLayout(btn_layout)
+
+class ImageCacheDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Image Cache")
+        self.resize(620, 360)
+
+        layout = QVBoxLayout(self)
+        self.table = QTableWidget(0, 6)
+        self.table.setHorizontalHeaderLabels(["Category", "Entries", "Memory", "Hits", "Misses", "Evictions"])
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        layout.addWidget(self.table)
+
+        self.lbl_total = QLabel("")
+        layout.addWidget(self.lbl_total)
+
+        h_budget = QHBoxLayout()
+        h_budget.addWidget(QLabel("Memory Budget (MB):"))
+        self.spin_budget = QSpinBox(); self.spin_budget.setRange(64, 65536); self.spin_budget.setSingleStep(64)
+        self.spin_budget.setValue(image_cache.budget // (1024 * 1024))
+        h_budget.addWidget(self.spin_budget)
+        btn_apply = QPushButton("Apply"); btn_apply.clicked.connect(self.apply_budget)
+        h_budget.addWidget(btn_apply)
+        h_budget.addStretch()
+        btn_clear = QPushButton("Clear Cache"); btn_clear.clicked.connect(self.clear_cache)
+        btn_close = QPushButton("Close"); btn_close.clicked.connect(self.accept)
+        h_budget.addWidget(btn_clear); h_budget.addWidget(btn_close)
+        layout.addLayout(h_budget)
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh_timer.start(1000)
+        self.refresh()
+
+    def refresh(self):
+        stats = image_cache.stats()
+        self.table.setRowCount(0)
+        for cat, st in sorted(stats.items()):
+            r = self.table.rowCount()
+            self.table.insertRow(r)
+            vals = [CATEGORY_LABELS.get(cat, cat), str(st['entries']), f"{st['bytes'] / (1024*1024):.1f} MB",
+                    str(st['hits']), str(st['misses']), str(st['evictions'])]
+            for c, v in enumerate(vals): self.table.setItem(r, c, QTableWidgetItem(v))
+        total_mb = image_cache.total_bytes() / (1024 * 1024)
+        budget_mb = image_cache.budget / (1024 * 1024)
+        self.lbl_total.setText(f"<b>Total:</b> {total_mb:.1f} MB of {budget_mb:.0f} MB budget")
+
+    def apply_budget(self):
+        mb = self.spin_budget.value()
+        QSettings("MattG", "FrameTamer").setValue("cache/budget_mb", mb)
+        image_cache.set_budget(mb * 1024 * 1024)
+        self.refresh()
+
+    def clear_cache(self):
+        image_cache.clear()
+        self.refresh()
+
+class ExportSetDialog(QDialog):
+    def __init__(self, dpi_options, current_dpi, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Export Set")
+        self.resize(360, 320)
+        from .export import supported_formats
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel("Render several deliverables from a single decode of the artwork."))
+
+        gb_dpi = QGroupBox("Print Resolutions"); l_dpi = QHBoxLayout()
+        self.dpi_checks = []
+        for dpi in dpi_options:
+            chk = QCheckBox(f"{dpi} DPI"); chk.setChecked(dpi == current_dpi)
+            chk.setProperty("dpi", int(dpi))
+            self.dpi_checks.append(chk); l_dpi.addWidget(chk)
+        gb_dpi.setLayout(l_dpi); layout.addWidget(gb_dpi)
+
+        gb_fmt = QGroupBox("Formats"); l_fmt = QHBoxLayout()
+        self.fmt_checks = []
+        for fmt in supported_formats():
+            chk = QCheckBox(fmt); chk.setChecked(fmt == "JPG")
+            self.fmt_checks.append(chk); l_fmt.addWidget(chk)
+        gb_fmt.setLayout(l_fmt); layout.addWidget(gb_fmt)
+
+        gb_web = QGroupBox("Web Proof"); l_web = QFormLayout()
+        self.chk_web = QCheckBox("Include web proof"); self.chk_web.setChecked(True)
+        self.spin_web = QSpinBox(); self.spin_web.setRange(256, 8192); self.spin_web.setValue(1600); self.spin_web.setSuffix(" px")
+        self.chk_web.toggled.connect(self.spin_web.setEnabled)
+        l_web.addRow(self.chk_web); l_web.addRow("Long Edge:", self.spin_web)
+        gb_web.setLayout(l_web); layout.addWidget(gb_web)
+
+        l_q = QFormLayout()
+        self.spin_quality = QSpinBox(); self.spin_quality.setRange(50, 100); self.spin_quality.setValue(95)
+        l_q.addRow("JPG/WebP Quality:", self.spin_quality)
+        layout.addLayout(l_q)
+
+        btn_layout = QHBoxLayout(); btn_layout.addStretch()
+        btn_cancel = QPushButton("Cancel"); btn_cancel.clicked.connect(self.reject)
+        btn_ok = QPushButton("Export..."); btn_ok.clicked.connect(self.accept)
+        btn_ok.setStyleSheet("background-color: #107c10; font-weight: bold; padding: 5px 15px; color: white;")
+        btn_layout.addWidget(btn_cancel); btn_layout.addWidget(btn_ok)
+        layout.addLayout(btn_layout)
+
+    def get_options(self):
+        return {
+            'dpis': [c.property("dpi") for c in self.dpi_checks if c.isChecked()],
+            'formats': [c.text() for c in self.fmt_checks if c.isChecked()],
+            'web_long_edge': self.spin_web.value() if self.chk_web.isChecked() else 0,
+            'quality': self.spin_quality.value(),
+        }
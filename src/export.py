@@ -0,0 +1,110 @@
+import os
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QImageWriter
+from .resample import scaled
+from .constants import RESAMPLE_EXPORT
+from .export_cache import ExportCache, source_identity, rect_fields
+
+# Display name -> (file extension, Qt writer format)
+EXPORT_FORMATS = {"JPG": ("jpg", "JPG"), "PNG": ("png", "PNG"), "WebP": ("webp", "WEBP")}
+WEB_PROOF_DPI = 72
+
+def supported_formats():
+    """Export formats the installed Qt image plugins can actually write."""
+    writable = {bytes(f).decode().upper() for f in QImageWriter.supportedImageFormats()}
+    return [name for name, (_, qt_fmt) in EXPORT_FORMATS.items() if qt_fmt in writable]
+
+def crop_source(pixmap, crop_rect):
+    """Crops the source pixmap to the normalized crop rect and returns a QImage."""
+    src_w, src_h = pixmap.width(), pixmap.height()
+    real_crop = QRectF(crop_rect.x() * src_w, crop_rect.y() * src_h,
+                       crop_rect.width() * src_w, crop_rect.height() * src_h).toRect()
+    return pixmap.copy(real_crop).toImage()
+
+def fit_to_print(img, w_px, h_px, method=RESAMPLE_EXPORT):
+    """Scales to fill w_px x h_px, then center-crops any rounding discrepancy."""
+    final_img = scaled(img, w_px, h_px, Qt.AspectRatioMode.KeepAspectRatioByExpanding, method)
+    if final_img.width() != w_px or final_img.height() != h_px:
+        final_img = final_img.copy((final_img.width() - w_px) // 2, (final_img.height() - h_px) // 2, w_px, h_px)
+    return final_img
+
+def set_dpi(img, dpi):
+    dpm = int(dpi / 0.0254) # dots per meter
+    img.setDotsPerMeterX(dpm)
+    img.setDotsPerMeterY(dpm)
+    return img
+
+def export_key_fields(source_path, crop_rect, print_w, print_h, method=RESAMPLE_EXPORT):
+    """Inputs shared by every output of one export, or None if the source has no stable identity."""
+    src_id = source_identity(source_path)
+    if src_id is None: return None
+    return {'source': src_id, 'crop': rect_fields(crop_rect), 'print': [round(print_w, 6), round(print_h, 6)], 'method': method}
+
+def output_key(key_fields, w_px, h_px, dpi, fmt, quality, resampled_from=None):
+    """resampled_from lists the intermediate sizes an output was scaled through; a direct render has none."""
+    if key_fields is None: return None
+    extra = {'resampled_from': resampled_from} if resampled_from else {}
+    return ExportCache.make_key(**key_fields, size=[w_px, h_px], dpi=dpi, format=fmt, quality=quality, **extra)
+
+def plan_variants(print_w, print_h, dpis, web_long_edge=0):
+    """Returns [(label, dpi, w_px, h_px)] sorted largest first so each step can reuse the previous result."""
+    targets = [(f"{dpi}dpi", dpi, int(print_w * dpi), int(print_h * dpi)) for dpi in dpis]
+    if web_long_edge > 0:
+        s = web_long_edge / max(print_w, print_h)
+        targets.append((f"web_{web_long_edge}px", WEB_PROOF_DPI, max(1, round(print_w * s)), max(1, round(print_h * s))))
+    return sorted(set(targets), key=lambda t: t[2] * t[3], reverse=True)
+
+def export_variants(load_cropped, targets, formats, out_dir, base_name, quality=95, progress=None, cache=None, key_fields=None):
+    """Renders every target size from a single cropped decode and writes it in each format.
+
+    Each target is resampled from the smallest earlier (larger) target in the
+    plan that covers it, or from the cropped source, so a 150 DPI and a web
+    proof don't each rescale the full-resolution crop again. That base is part
+    of the cache key, since a chained resample differs from a direct render.
+    load_cropped is only called if some output is missing from the export cache.
+    Returns a list of (path, ok) tuples.
+    """
+    written = []
+    steps = max(1, len(targets) * len(formats))
+    sizes = [(w_px, h_px) for _, _, w_px, h_px in targets]
+    # The resample base of each target is fixed by the plan (not by which outputs were cached),
+    # so the same output always has the same pixels and cache key
+    parents = []
+    for i, (w_px, h_px) in enumerate(sizes):
+        covering = [j for j in range(i) if sizes[j][0] >= w_px and sizes[j][1] >= h_px]
+        parents.append(min(covering, key=lambda j: sizes[j][0] * sizes[j][1]) if covering else None)
+
+    def chain(i):
+        j = parents[i]
+        return [] if j is None else chain(j) + [list(sizes[j])]
+
+    source, rendered = [], {}
+    def render(i):
+        if i not in rendered:
+            if parents[i] is not None: base = render(parents[i])
+            else:
+                if not source: source.append(load_cropped())
+                base = source[0]
+            rendered[i] = set_dpi(fit_to_print(base, *sizes[i]), targets[i][1])
+        return rendered[i]
+
+    def report(path, ok):
+        written.append((path, ok))
+        if progress: progress(len(written) / steps, path)
+
+    for i, (label, dpi, w_px, h_px) in enumerate(targets):
+        jobs = []
+        for fmt in formats:
+            ext, qt_fmt = EXPORT_FORMATS[fmt]
+            path = os.path.join(out_dir, f"{base_name}_{label}.{ext}")
+            key = output_key(key_fields, w_px, h_px, dpi, fmt, quality, chain(i))
+            if cache and cache.fetch(key, path): report(path, True)
+            else: jobs.append((path, qt_fmt, key))
+        if not jobs: continue
+
+        img = render(i)
+        for path, qt_fmt, key in jobs:
+            ok = img.save(path, qt_fmt, quality if qt_fmt != "PNG" else -1)
+            if ok and cache: cache.store(key, path)
+            report(path, ok)
+    return written
@@ -0,0 +1,121 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+import threading
+from PyQt6.QtCore import QSettings
+from .constants import APP_DATA_DIR
+
+DEFAULT_MAX_MB = 2048
+
+def source_identity(path):
+    """Identity of a source file on disk, or None when there is no stable file to key on."""
+    if not path or not os.path.exists(path): return None
+    st = os.stat(path)
+    return [os.path.abspath(path), st.st_size, st.st_mtime_ns]
+
+def rect_fields(r):
+    return [round(r.x(), 6), round(r.y(), 6), round(r.width(), 6), round(r.height(), 6)]
+
+def image_digest(pixmap):
+    """SHA-256 of an image's pixels, for inputs (textures, previews) that have no file identity."""
+    if pixmap is None or pixmap.isNull(): return None
+    img = pixmap.toImage() if hasattr(pixmap, 'toImage') else pixmap
+    return hashlib.sha256(img.constBits().asstring(img.sizeInBytes())).hexdigest()
+
+def calc_fields(calc):
+    """JSON-able subset of a layout calculation (numbers, strings, colors); pixmaps are keyed separately."""
+    out = {}
+    for k, v in calc.items():
+        if isinstance(v, (int, float, str, bool)) or v is None: out[k] = v
+        elif hasattr(v, 'name') and hasattr(v, 'alpha'): out[k] = v.name()
+        elif hasattr(v, 'width') and hasattr(v, 'x'): out[k] = rect_fields(v)
+    return out
+
+class ExportCache:
+    """Content-addressed store of finished exports with LRU eviction.
+
+    Keys are SHA-256 hashes of everything that determines the output file.
+    Hits are copied to the destination (not hardlinked, so editing an export
+    in place can never corrupt the cached copy).
+    """
+    def __init__(self, cache_dir=None, max_bytes=None):
+        self.cache_dir = cache_dir or os.path.join(APP_DATA_DIR, "export_cache")
+        if max_bytes is None:
+            max_bytes = int(QSettings("MattG", "FrameTamer").value("export_cache/max_mb", DEFAULT_MAX_MB)) * 1024 * 1024
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(self.cache_dir, "index.json")
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.index = self._load_index()
+
+    @staticmethod
+    def make_key(**fields):
+        blob = json.dumps(fields, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(blob).hexdigest()
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'r') as f: return json.load(f)
+        except (OSError, ValueError): return {}
+
+    def _save_index(self):
+        tmp = self.index_path + ".tmp"
+        with open(tmp, 'w') as f: json.dump(self.index, f)
+        os.replace(tmp, self.index_path)
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def fetch(self, key, dest):
+        """Copies a cached output to dest. Returns True on a hit."""
+        if not key: return False
+        with self._lock:
+            entry = self.index.get(key)
+            path = self._entry_path(key)
+            if not entry or not os.path.exists(path) or os.path.getsize(path) != entry['size']:
+                if entry: del self.index[key]; self._save_index()
+                return False
+            shutil.copyfile(path, dest)
+            entry['last_used'] = time.time()
+            self._save_index()
+            return True
+
+    def store(self, key, src_path):
+        if not key or not os.path.exists(src_path): return
+        with self._lock:
+            path = self._entry_path(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            shutil.copyfile(src_path, path)
+            self.index[key] = {'size': os.path.getsize(path), 'last_used': time.time()}
+            self._evict()
+            self._save_index()
+
+    def total_bytes(self):
+        return sum(e['size'] for e in self.index.values())
+
+    def clear(self):
+        with self._lock:
+            for key in list(self.index): self._remove(key)
+            self._save_index()
+
+    def _remove(self, key):
+        self.index.pop(key, None)
+        try: os.remove(self._entry_path(key))
+        except OSError: pass
+
+    def _evict(self):
+        total = self.total_bytes()
+        for key in sorted(self.index, key=lambda k: self.index[k]['last_used']):
+            if total <= self.max_bytes: break
+            total -= self.index[key]['size']
+            self._remove(key)
+
+_shared = None
+
+def export_cache():
+    """Shared instance used by the interactive and the batch (Export Set) paths."""
+    global _shared
+    if _shared is None: _shared = ExportCache()
+    return _shared
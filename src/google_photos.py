@@ -1,18 +1,19 @@
 import os
 import pickle
 import requests
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
+from requests.adapters import HTTPAdapter
+from .constants import APP_DATA_DIR, THUMBNAIL_WORKERS
+from .http_scheduler import RequestScheduler
 
 SCOPES = ['https://www.googleapis.com/auth/photoslibrary.readonly']
+API_ROOT = 'https://photoslibrary.googleapis.com/v1'
 
 class GooglePhotosManager:
     def __init__(self):
         self.creds = None
         self.service = None
         # Use system Local AppData for secure storage
-        self.app_data_dir = os.path.join(os.environ.get('LOCALAPPDATA', os.path.expanduser('~')), 'FrameTamer')
+        self.app_data_dir = APP_DATA_DIR
         if not os.path.exists(self.app_data_dir):
             os.makedirs(self.app_data_dir)
             
@@ -22,8 +23,19 @@ class GooglePhotosManager:
         if not os.path.exists(self.creds_path):
             self.creds_path = 'credentials.json' # Fallback to local file for dev
 
+        # One pooled session so thumbnails reuse TLS connections instead of handshaking per request
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=THUMBNAIL_WORKERS)
+        self.session.mount('https://', adapter); self.session.mount('http://', adapter)
+        # All traffic goes through the scheduler: rate limit, per-host cap, retries with backoff, timeouts
+        self.http = RequestScheduler(self.session)
+
     def authenticate(self):
         """Authenticates the user and returns the credentials."""
+        # The auth libraries are slow to import; only pay for them when signing in
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from google.auth.transport.requests import Request
+
         if os.path.exists(self.token_path):
             with open(self.token_path, 'rb') as token:
                 self.creds = pickle.load(token)
@@ -44,30 +56,101 @@ class GooglePhotosManager:
         
         return self.creds
 
-    def list_media_items(self, page_token=None):
+    def list_media_items(self, page_token=None, page_size=50):
         """Lists media items from Google Photos."""
         if not self.creds:
             self.authenticate()
             
-        url = 'https://photoslibrary.googleapis.com/v1/mediaItems'
+        url = f'{API_ROOT}/mediaItems'
         params = {
-            'pageSize': 50,
+            'pageSize': page_size,
         }
         if page_token:
             params['pageToken'] = page_token
             
-        headers = {
+        response = self.http.get(url, headers=self._headers(), params=params)
+        response.raise_for_status()
+        return response.json()
+
+    def _headers(self):
+        return {
             'Authorization': f'Bearer {self.creds.token}',
             'Content-Type': 'application/json'
         }
-        
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        return response.json()
+
+    def get_media_items(self, media_ids):
+        """Re-resolves media items by id (baseUrls expire after about an hour). Returns {id: baseUrl}."""
+        if not self.creds:
+            self.authenticate()
+
+        urls = {}
+        for i in range(0, len(media_ids), 50): # batchGet accepts at most 50 ids
+            response = self.http.get(f'{API_ROOT}/mediaItems:batchGet',
+                                     headers=self._headers(), params={'mediaItemIds': media_ids[i:i + 50]})
+            response.raise_for_status()
+            for result in response.json().get('mediaItemResults', []):
+                item = result.get('mediaItem')
+                if item: urls[item['id']] = item['baseUrl']
+        return urls
+
+    def list_albums(self):
+        """Returns every album (id, title, ...) in the library."""
+        if not self.creds:
+            self.authenticate()
+
+        albums, token = [], None
+        while True:
+            params = {'pageSize': 50}
+            if token: params['pageToken'] = token
+            response = self.http.get(f'{API_ROOT}/albums', headers=self._headers(), params=params)
+            response.raise_for_status()
+            data = response.json()
+            albums += data.get('albums', [])
+            token = data.get('nextPageToken')
+            if not token: return albums
+
+    def list_album_item_ids(self, album_id):
+        """Returns the ids of every media item in an album."""
+        if not self.creds:
+            self.authenticate()
+
+        ids, token = [], None
+        while True:
+            body = {'albumId': album_id, 'pageSize': 100}
+            if token: body['pageToken'] = token
+            response = self.http.request('POST', f'{API_ROOT}/mediaItems:search',
+                                         headers=self._headers(), json=body)
+            response.raise_for_status()
+            data = response.json()
+            ids += [item['id'] for item in data.get('mediaItems', [])]
+            token = data.get('nextPageToken')
+            if not token: return ids
 
     def get_image_data(self, base_url, width=1024, height=1024):
         """Fetches image data from a base URL with specific dimensions."""
         download_url = f"{base_url}=w{width}-h{height}"
-        response = requests.get(download_url)
+        response = self.http.get(download_url)
         response.raise_for_status()
         return response.content
+
+    def download_original(self, base_url, dest_path, progress=None, is_cancelled=None, chunk_size=256 * 1024):
+        """Streams the original file (=d) to dest_path, resuming a partial .part file with a Range request.
+
+        Returns True when the file is complete, False if cancelled (the .part file is kept for resume).
+        """
+        part_path = dest_path + ".part"
+        have = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        headers = {'Range': f'bytes={have}-'} if have else {}
+        with self.http.get(f"{base_url}=d", headers=headers, stream=True) as response:
+            if response.status_code == 416: # .part already holds the whole file
+                os.replace(part_path, dest_path); return True
+            response.raise_for_status()
+            if response.status_code != 206: have = 0 # server ignored the Range; start over
+            total = have + int(response.headers.get('Content-Length', 0))
+            with open(part_path, 'ab' if have else 'wb') as f:
+                for chunk in response.iter_content(chunk_size):
+                    if is_cancelled and is_cancelled(): return False
+                    f.write(chunk); have += len(chunk)
+                    if progress: progress(have, total)
+        os.replace(part_path, dest_path)
+        return True
@@ -0,0 +1,117 @@
+import time
+import random
+import threading
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+import requests
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+DEFAULT_TIMEOUT = (5, 30) # (connect, read) seconds
+
+class TokenBucket:
+    """Allows `rate` acquisitions per second on average, with bursts of up to `capacity`."""
+    def __init__(self, rate, capacity, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = self.clock()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1 - 1e-9: # refills land a hair under 1 in floating point
+                    self.tokens = max(0.0, self.tokens - 1)
+                    return
+                wait = (1 - self.tokens) / self.rate
+            self.sleep(wait)
+
+class RequestScheduler:
+    """Sends requests through a shared session while staying under quota.
+
+    Every attempt takes a token from a global bucket and a slot from a per-host
+    semaphore; a streamed response keeps its slot until its body is read or it
+    is closed. Throttling (429) and transient server errors are retried with
+    exponential backoff and full jitter, honoring Retry-After when the server
+    sends one. Responses are returned as-is once retries are exhausted, so
+    callers keep using raise_for_status().
+    """
+    def __init__(self, session=None, rate=10.0, burst=20, per_host=6, max_retries=5,
+                 base_delay=0.5, max_delay=30.0, timeout=DEFAULT_TIMEOUT, sleep=time.sleep):
+        self.session = session or requests.Session()
+        self.bucket = TokenBucket(rate, burst, sleep=sleep)
+        self.per_host = per_host
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self.sleep = sleep
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def _host_slot(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._hosts: self._hosts[host] = threading.BoundedSemaphore(self.per_host)
+            return self._hosts[host]
+
+    def backoff(self, attempt):
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def retry_after(self, response):
+        """Seconds requested by a Retry-After header (delta or HTTP date), or None."""
+        value = response.headers.get('Retry-After')
+        if not value: return None
+        try: return min(self.max_delay, max(0.0, float(value)))
+        except ValueError: pass
+        try: return min(self.max_delay, max(0.0, parsedate_to_datetime(value).timestamp() - time.time()))
+        except (TypeError, ValueError): return None
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        slot = self._host_slot(url)
+        for attempt in range(self.max_retries + 1):
+            last = attempt == self.max_retries
+            self.bucket.acquire()
+            slot.acquire(); keep = False
+            try:
+                try: response = self.session.request(method, url, **kwargs)
+                except (requests.ConnectionError, requests.Timeout):
+                    if last: raise
+                    response = None
+                if response is not None and (response.status_code not in RETRY_STATUSES or last):
+                    keep = bool(kwargs.get('stream'))
+                    if keep: self._hold_until_done(response, slot)
+                    return response
+            finally:
+                if not keep: slot.release()
+            delay = self.retry_after(response) if response is not None else None
+            if delay is None: delay = self.backoff(attempt)
+            if response is not None: response.close()
+            self.sleep(delay) # the host slot is free while we wait
+
+    def _hold_until_done(self, response, slot):
+        """A streamed body is read after request() returns, so its host slot is kept until the body is
+        fully read (urllib3 then releases the connection) or the response is closed, whichever comes first."""
+        lock, held = threading.Lock(), [True]
+        def release():
+            with lock:
+                if not held[0]: return
+                held[0] = False
+            slot.release()
+        close, release_conn = response.close, response.raw.release_conn
+        def close_and_release():
+            try: close()
+            finally: release()
+        def release_conn_and_slot():
+            try: release_conn()
+            finally: release()
+        response.close = close_and_release; response.raw.release_conn = release_conn_and_slot
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
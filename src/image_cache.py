@@ -0,0 +1,118 @@
+import os
+import threading
+from collections import OrderedDict
+from PyQt6.QtCore import QSettings
+from PyQt6.QtGui import QPixmap, QImage
+
+DEFAULT_BUDGET_MB = 512
+
+# Display names for the Help > Image Cache view
+CATEGORY_LABELS = {
+    "source": "Decoded Sources",
+    "preview": "Scaled Previews",
+    "texture": "Texture Strips",
+    "pdf": "PDF Page Images",
+    "photos": "Google Photos Thumbnails",
+    "library": "Texture Library Icons",
+}
+
+def image_nbytes(img):
+    """Approximate memory held by a QPixmap/QImage."""
+    if img is None or img.isNull(): return 0
+    if isinstance(img, QImage): return img.sizeInBytes()
+    return img.width() * img.height() * max(1, img.depth()) // 8
+
+class ImageCache:
+    """Process-wide LRU cache for pixmaps/images with a shared byte budget.
+
+    Entries are keyed by (category, key). Evicting an entry only drops the
+    cache's reference; widgets that still hold the object keep it alive.
+    """
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_MB * 1024 * 1024):
+        self.budget = budget_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict() # (category, key) -> (image, nbytes)
+        self._bytes = 0
+        self._stats = {}
+
+    def _cat(self, category):
+        if category not in self._stats:
+            self._stats[category] = {'hits': 0, 'misses': 0, 'bytes': 0, 'entries': 0, 'evictions': 0}
+        return self._stats[category]
+
+    def get(self, category, key):
+        with self._lock:
+            entry = self._entries.get((category, key))
+            st = self._cat(category)
+            if entry is None:
+                st['misses'] += 1
+                return None
+            self._entries.move_to_end((category, key))
+            st['hits'] += 1
+            return entry[0]
+
+    def put(self, category, key, img):
+        if img is None or img.isNull(): return img
+        size = image_nbytes(img)
+        with self._lock:
+            self._drop((category, key))
+            if size > self.budget: return img # Too large to ever fit, hand it back uncached
+            self._entries[(category, key)] = (img, size)
+            st = self._cat(category); st['bytes'] += size; st['entries'] += 1
+            self._bytes += size
+            self._evict()
+        return img
+
+    def get_or_create(self, category, key, factory):
+        img = self.get(category, key)
+        if img is None: img = self.put(category, key, factory())
+        return img
+
+    def discard(self, category, key):
+        with self._lock: self._drop((category, key))
+
+    def clear(self, category=None):
+        with self._lock:
+            for k in [k for k in self._entries if category is None or k[0] == category]:
+                self._drop(k)
+
+    def set_budget(self, budget_bytes):
+        with self._lock:
+            self.budget = max(0, int(budget_bytes))
+            self._evict()
+
+    def total_bytes(self):
+        return self._bytes
+
+    def stats(self):
+        """Returns {category: {'hits', 'misses', 'bytes', 'entries', 'evictions'}}."""
+        with self._lock: return {c: dict(s) for c, s in self._stats.items()}
+
+    def _drop(self, full_key, evicted=False):
+        entry = self._entries.pop(full_key, None)
+        if entry is None: return
+        st = self._cat(full_key[0]); st['bytes'] -= entry[1]; st['entries'] -= 1
+        self._bytes -= entry[1]
+        if evicted: st['evictions'] += 1
+
+    def _evict(self):
+        while self._bytes > self.budget and self._entries:
+            self._drop(next(iter(self._entries)), evicted=True)
+
+image_cache = ImageCache()
+
+def load_budget_from_settings():
+    settings = QSettings("MattG", "FrameTamer")
+    mb = int(settings.value("cache/budget_mb", DEFAULT_BUDGET_MB))
+    image_cache.set_budget(mb * 1024 * 1024)
+    return mb
+
+def pixmap_key(pixmap):
+    """Stable identity for a pixmap's pixel data (changes when the data does)."""
+    return pixmap.cacheKey() if pixmap is not None else 0
+
+def load_source_pixmap(path):
+    """Decodes an image file through the cache so re-opening the same file skips the decode."""
+    try: stamp = os.path.getmtime(path)
+    except OSError: stamp = 0
+    return image_cache.get_or_create("source", (path, stamp), lambda: QPixmap(path))
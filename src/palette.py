@@ -0,0 +1,111 @@
+"""Dominant-palette extraction and mat suggestions for the current artwork.
+
+Analysis runs on a small proxy (PROXY_SIDE px) of the source, restricted to the
+crop, with a vectorized k-means over a NumPy view of its pixels. Results are
+cached per image and crop, and computed off the GUI thread by PaletteWorker.
+Imported lazily by the app so numpy stays off the startup path.
+"""
+from collections import OrderedDict
+import numpy as np
+from PyQt6.QtCore import Qt, QThread, pyqtSignal, QRectF
+from PyQt6.QtGui import QColor, QImage
+from .resample import image_view
+from . import colors
+from .constants import QUICK_MAT_COLORS
+
+PROXY_SIDE = 256
+K = 6
+ITERATIONS = 12
+CACHE_ENTRIES = 32
+
+_cache = OrderedDict()
+
+def make_proxy(pixmap):
+    """Screen-independent small copy of the source to analyze (call on the GUI thread)."""
+    small = pixmap.scaled(PROXY_SIDE, PROXY_SIDE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.FastTransformation)
+    return small.toImage().convertToFormat(QImage.Format.Format_RGB32)
+
+def crop_pixels(proxy, crop_rect):
+    """N x 3 float32 RGB samples of the proxy inside the normalized crop rect."""
+    arr = image_view(proxy, writable=False)
+    h, w = arr.shape[:2]
+    x0, y0 = int(crop_rect.x() * w), int(crop_rect.y() * h)
+    x1, y1 = max(x0 + 1, int(crop_rect.right() * w)), max(y0 + 1, int(crop_rect.bottom() * h))
+    # QImage RGB32 is BGRA in memory on little-endian machines
+    return arr[y0:y1, x0:x1, 2::-1].reshape(-1, 3).astype(np.float32)
+
+def kmeans(pixels, k=K, iterations=ITERATIONS, seed=0):
+    """Returns (centers k x 3, weights k) sorted by weight, using k-means++ seeding."""
+    rng = np.random.default_rng(seed)
+    k = min(k, len(pixels))
+    centers = [pixels[rng.integers(len(pixels))]]
+    d2 = ((pixels - centers[0]) ** 2).sum(1)
+    for _ in range(1, k):
+        if d2.sum() == 0: break # fewer distinct colors than k
+        centers.append(pixels[rng.choice(len(pixels), p=d2 / d2.sum())])
+        d2 = np.minimum(d2, ((pixels - centers[-1]) ** 2).sum(1))
+    centers = np.array(centers, np.float32)
+    for _ in range(iterations):
+        labels = ((pixels[:, None, :] - centers[None, :, :]) ** 2).sum(2).argmin(1)
+        counts = np.bincount(labels, minlength=len(centers))
+        sums = np.zeros_like(centers)
+        np.add.at(sums, labels, pixels)
+        moved = np.where(counts[:, None] > 0, sums / np.maximum(counts, 1)[:, None], centers)
+        if np.allclose(moved, centers, atol=0.5): centers = moved; break
+        centers = moved
+    labels = ((pixels[:, None, :] - centers[None, :, :]) ** 2).sum(2).argmin(1)
+    weights = np.bincount(labels, minlength=len(centers)) / len(pixels)
+    order = weights.argsort()[::-1]
+    return centers[order], weights[order]
+
+def recommend_mats(dominant, count=4):
+    """Maps dominant colors onto the mat library.
+
+    Returns [(name, QColor, weight)]: the nearest library color for each dominant
+    color (deduplicated), led by the quick mat swatch closest to the main color.
+    """
+    picks, seen = [], set()
+    if dominant:
+        main = dominant[0][0]
+        quick = min(QUICK_MAT_COLORS, key=lambda c: _dist(QColor(c), main))
+        name, _ = colors.nearest(*QColor(quick).getRgb()[:3])
+        picks.append((name, QColor(quick), dominant[0][1])); seen.add(QColor(quick).name())
+    for col, weight in dominant:
+        name, _ = colors.nearest(col.red(), col.green(), col.blue())
+        rgb = colors.COLORS[name]
+        lib = QColor(*rgb)
+        if lib.name() in seen: continue
+        seen.add(lib.name()); picks.append((name, lib, weight))
+        if len(picks) >= count: break
+    return picks
+
+def _dist(a, b):
+    return (a.red() - b.red()) ** 2 + (a.green() - b.green()) ** 2 + (a.blue() - b.blue()) ** 2
+
+def cache_key(pixmap_key, crop_rect):
+    return (pixmap_key, round(crop_rect.x(), 3), round(crop_rect.y(), 3), round(crop_rect.width(), 3), round(crop_rect.height(), 3))
+
+def cached(key):
+    if key in _cache: _cache.move_to_end(key); return _cache[key]
+    return None
+
+def remember(key, result):
+    _cache[key] = result
+    while len(_cache) > CACHE_ENTRIES: _cache.popitem(last=False)
+
+def analyze(proxy, crop_rect):
+    """Returns {'dominant': [(QColor, weight)], 'mats': [(name, QColor, weight)]}."""
+    centers, weights = kmeans(crop_pixels(proxy, crop_rect))
+    dominant = [(QColor(*[int(round(v)) for v in c]), float(w)) for c, w in zip(centers, weights) if w > 0]
+    return {'dominant': dominant, 'mats': recommend_mats(dominant)}
+
+class PaletteWorker(QThread):
+    ready = pyqtSignal(object, dict) # cache key, analyze() result
+
+    def __init__(self, key, proxy, crop_rect):
+        super().__init__()
+        self.key, self.proxy, self.crop_rect = key, proxy, QRectF(crop_rect)
+
+    def run(self):
+        try: self.ready.emit(self.key, analyze(self.proxy, self.crop_rect))
+        except Exception as e: print(f"Palette analysis failed: {e}")
@@ -0,0 +1,134 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from PyQt6.QtCore import QSettings
+from .constants import APP_DATA_DIR
+
+DEFAULT_MAX_MB = 512
+LISTING_TTL = 10 * 60 # seconds before a cached page listing is refreshed in the background
+BASE_URL_TTL = 50 * 60 # Google Photos baseUrls expire after ~60 min; re-resolve a little earlier
+
+class PhotoCache:
+    """Disk cache for Google Photos thumbnails and page listings.
+
+    A SQLite index tracks blob files (keyed by media id and requested size) and
+    evicts the least recently used ones once the cache exceeds its size cap.
+    Listings are stored per page token together with when their baseUrls were
+    resolved, so stale URLs can be refreshed before use.
+    """
+    def __init__(self, cache_dir=None, max_bytes=None):
+        self.cache_dir = cache_dir or os.path.join(APP_DATA_DIR, "photo_cache")
+        if max_bytes is None:
+            max_bytes = int(QSettings("MattG", "FrameTamer").value("photo_cache/max_mb", DEFAULT_MAX_MB)) * 1024 * 1024
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self.db = sqlite3.connect(os.path.join(self.cache_dir, "index.sqlite"), check_same_thread=False)
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS thumbs (media_id TEXT, w INTEGER, h INTEGER, file TEXT, size INTEGER, last_used REAL,
+                                               PRIMARY KEY (media_id, w, h));
+            CREATE TABLE IF NOT EXISTS listings (page_token TEXT PRIMARY KEY, data TEXT, fetched_at REAL);
+            CREATE TABLE IF NOT EXISTS items (media_id TEXT PRIMARY KEY, base_url TEXT, resolved_at REAL);
+        """)
+        self.db.commit()
+
+    def _blob_path(self, name):
+        return os.path.join(self.cache_dir, name[:2], name)
+
+    # --- Thumbnails ---
+    def get_thumbnail(self, media_id, w, h):
+        """Returns the cached encoded bytes, or None."""
+        with self._lock:
+            row = self.db.execute("SELECT file FROM thumbs WHERE media_id=? AND w=? AND h=?", (media_id, w, h)).fetchone()
+            if not row: return None
+            try:
+                with open(self._blob_path(row[0]), 'rb') as f: data = f.read()
+            except OSError:
+                self.db.execute("DELETE FROM thumbs WHERE media_id=? AND w=? AND h=?", (media_id, w, h)); self.db.commit()
+                return None
+            self.db.execute("UPDATE thumbs SET last_used=? WHERE media_id=? AND w=? AND h=?", (time.time(), media_id, w, h))
+            self.db.commit()
+            return data
+
+    def put_thumbnail(self, media_id, w, h, data):
+        name = hashlib.sha1(f"{media_id}:{w}x{h}".encode("utf-8")).hexdigest()
+        path = self._blob_path(name)
+        with self._lock:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f: f.write(data)
+            self.db.execute("INSERT OR REPLACE INTO thumbs VALUES (?, ?, ?, ?, ?, ?)", (media_id, w, h, name, len(data), time.time()))
+            self._evict()
+            self.db.commit()
+
+    def total_bytes(self):
+        with self._lock:
+            return self.db.execute("SELECT COALESCE(SUM(size), 0) FROM thumbs").fetchone()[0]
+
+    def _evict(self):
+        total = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM thumbs").fetchone()[0]
+        if total <= self.max_bytes: return
+        for media_id, w, h, name, size in self.db.execute("SELECT media_id, w, h, file, size FROM thumbs ORDER BY last_used").fetchall():
+            if total <= self.max_bytes: break
+            try: os.remove(self._blob_path(name))
+            except OSError: pass
+            self.db.execute("DELETE FROM thumbs WHERE media_id=? AND w=? AND h=?", (media_id, w, h))
+            total -= size
+
+    # --- Listings and baseUrls ---
+    def get_listing(self, page_token):
+        """Returns (data, age_seconds) for a cached page, with the freshest known baseUrls, or (None, None)."""
+        with self._lock:
+            row = self.db.execute("SELECT data, fetched_at FROM listings WHERE page_token=?", (page_token or "",)).fetchone()
+            if not row: return None, None
+            data = json.loads(row[0])
+            for item in data.get('mediaItems', []):
+                found = self.db.execute("SELECT base_url FROM items WHERE media_id=?", (item['id'],)).fetchone()
+                if found: item['baseUrl'] = found[0]
+            return data, time.time() - row[1]
+
+    def put_listing(self, page_token, data):
+        now = time.time()
+        with self._lock:
+            self.db.execute("INSERT OR REPLACE INTO listings VALUES (?, ?, ?)", (page_token or "", json.dumps(data), now))
+            self.db.executemany("INSERT OR REPLACE INTO items VALUES (?, ?, ?)",
+                                [(item['id'], item['baseUrl'], now) for item in data.get('mediaItems', [])])
+            self.db.commit()
+
+    def stale_ids(self, media_ids):
+        """Ids whose cached baseUrl is too old (or unknown) to be used for a download."""
+        cutoff = time.time() - BASE_URL_TTL
+        with self._lock:
+            fresh = {r[0] for r in self.db.execute(
+                f"SELECT media_id FROM items WHERE resolved_at >= ? AND media_id IN ({','.join('?' * len(media_ids))})",
+                (cutoff, *media_ids))} if media_ids else set()
+        return [m for m in media_ids if m not in fresh]
+
+    def base_url(self, media_id):
+        with self._lock:
+            row = self.db.execute("SELECT base_url FROM items WHERE media_id=?", (media_id,)).fetchone()
+        return row[0] if row else None
+
+    def update_base_urls(self, urls):
+        """urls: {media_id: base_url} freshly resolved from the API."""
+        now = time.time()
+        with self._lock:
+            self.db.executemany("INSERT OR REPLACE INTO items VALUES (?, ?, ?)", [(m, u, now) for m, u in urls.items()])
+            self.db.commit()
+
+    def clear(self):
+        with self._lock:
+            for (name,) in self.db.execute("SELECT file FROM thumbs").fetchall():
+                try: os.remove(self._blob_path(name))
+                except OSError: pass
+            self.db.executescript("DELETE FROM thumbs; DELETE FROM listings; DELETE FROM items;")
+            self.db.commit()
+
+_shared = None
+
+def photo_cache():
+    global _shared
+    if _shared is None: _shared = PhotoCache()
+    return _shared
@@ -0,0 +1,181 @@
+import os
+import time
+import sqlite3
+import threading
+from datetime import datetime
+from .constants import APP_DATA_DIR
+
+ORIENTATIONS = ["Any", "Landscape", "Portrait", "Square"]
+RECONCILE_DAYS = 7 # how often sync lists the whole library instead of stopping at known items
+
+def parse_time(value):
+    """RFC 3339 creationTime ('2019-06-01T12:34:56Z', optionally with fractions) -> unix seconds."""
+    if not value: return None
+    try: return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    except ValueError: return None
+
+class PhotoIndex:
+    """Local SQLite copy of Google Photos metadata so browsing filters run without the API.
+
+    Sync is usually incremental: the library is listed newest first and sync
+    stops at the first page that is already fully known. That misses items that
+    show up later with an older creation time, such as old photos uploaded now,
+    and it never sees deletions. So every RECONCILE_DAYS, or on request, a full
+    pass lists everything and drops the items it no longer finds. An interrupted
+    full pass resumes from the last page token it reached.
+    """
+    def __init__(self, db_path=None):
+        self.db_path = db_path or os.path.join(APP_DATA_DIR, "photo_index.sqlite")
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._lock = threading.Lock()
+        self.db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS media (id TEXT PRIMARY KEY, filename TEXT, width INTEGER, height INTEGER,
+                                              created REAL, mime TEXT);
+            CREATE INDEX IF NOT EXISTS media_created ON media (created);
+            CREATE TABLE IF NOT EXISTS albums (id TEXT PRIMARY KEY, title TEXT);
+            CREATE TABLE IF NOT EXISTS album_items (album_id TEXT, media_id TEXT, PRIMARY KEY (album_id, media_id));
+            CREATE TABLE IF NOT EXISTS sync_state (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS sync_seen (id TEXT PRIMARY KEY); -- ids listed by the full pass in progress
+        """)
+        self.db.commit()
+
+    # --- Sync state ---
+    def state(self, key, default=None):
+        with self._lock:
+            row = self.db.execute("SELECT value FROM sync_state WHERE key=?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_state(self, key, value):
+        with self._lock:
+            if value is None: self.db.execute("DELETE FROM sync_state WHERE key=?", (key,))
+            else: self.db.execute("INSERT OR REPLACE INTO sync_state VALUES (?, ?)", (key, str(value)))
+            self.db.commit()
+
+    def count(self):
+        with self._lock:
+            return self.db.execute("SELECT COUNT(*) FROM media").fetchone()[0]
+
+    # --- Writing ---
+    def upsert_items(self, items):
+        """Stores mediaItems from the API. Returns how many ids were new."""
+        rows = []
+        for item in items:
+            meta = item.get('mediaMetadata', {})
+            rows.append((item['id'], item.get('filename', ''), int(meta.get('width', 0) or 0), int(meta.get('height', 0) or 0),
+                         parse_time(meta.get('creationTime')), item.get('mimeType', '')))
+        with self._lock:
+            known = {r[0] for r in self.db.execute(
+                f"SELECT id FROM media WHERE id IN ({','.join('?' * len(rows))})", [r[0] for r in rows])} if rows else set()
+            self.db.executemany("INSERT OR REPLACE INTO media VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self.db.commit()
+        return len(rows) - len(known)
+
+    def set_albums(self, albums):
+        """Replaces the album list with the complete current one; deleted albums lose their membership too."""
+        with self._lock:
+            self.db.execute("DELETE FROM albums")
+            self.db.executemany("INSERT OR REPLACE INTO albums VALUES (?, ?)", [(a['id'], a.get('title', '')) for a in albums])
+            self.db.execute("DELETE FROM album_items WHERE album_id NOT IN (SELECT id FROM albums)")
+            self.db.commit()
+
+    def mark_seen(self, media_ids):
+        with self._lock:
+            self.db.executemany("INSERT OR IGNORE INTO sync_seen VALUES (?)", [(m,) for m in media_ids])
+            self.db.commit()
+
+    def remove_unseen(self):
+        """Ends a full pass: drops items it didn't list (deleted from the library). Returns how many."""
+        with self._lock:
+            removed = self.db.execute("DELETE FROM media WHERE id NOT IN (SELECT id FROM sync_seen)").rowcount
+            self.db.execute("DELETE FROM album_items WHERE media_id NOT IN (SELECT id FROM media)")
+            self.db.execute("DELETE FROM sync_seen")
+            self.db.commit()
+        return removed
+
+    def reconcile_due(self):
+        if self.state('full_sync_done') != '1' or self.state('resume_token') is not None: return True
+        return time.time() - float(self.state('last_full_sync', 0)) > RECONCILE_DAYS * 86400
+
+    def set_album_items(self, album_id, media_ids):
+        with self._lock:
+            self.db.execute("DELETE FROM album_items WHERE album_id=?", (album_id,))
+            self.db.executemany("INSERT OR IGNORE INTO album_items VALUES (?, ?)", [(album_id, m) for m in media_ids])
+            self.db.commit()
+
+    # --- Sync ---
+    def sync(self, manager, progress=None, is_cancelled=None, on_items=None, full=False):
+        """Pulls media items and album membership from the API.
+
+        Runs a full pass (see the class docstring) when full is set or one is due,
+        otherwise stops at the first already-known page.
+        on_items(items) receives every fetched page (used to refresh cached baseUrls).
+        Returns the number of new items.
+        """
+        full = full or self.reconcile_due()
+        token = self.state('resume_token') if full else None
+        if full and token is None:
+            with self._lock: self.db.execute("DELETE FROM sync_seen"); self.db.commit()
+        added = 0
+        while True:
+            if is_cancelled and is_cancelled(): return added
+            data = manager.list_media_items(token, page_size=100)
+            items = data.get('mediaItems', [])
+            if on_items: on_items(items)
+            new = self.upsert_items(items)
+            added += new
+            if full: self.mark_seen([item['id'] for item in items])
+            token = data.get('nextPageToken')
+            if progress: progress(self.count(), added)
+            if not full and new == 0: break # caught up with what we already have
+            if not token:
+                if full:
+                    self.remove_unseen()
+                    self.set_state('full_sync_done', 1); self.set_state('resume_token', None); self.set_state('last_full_sync', time.time())
+                break
+            if full: self.set_state('resume_token', token)
+
+        albums = manager.list_albums()
+        self.set_albums(albums)
+        for album in albums:
+            if is_cancelled and is_cancelled(): break
+            self.set_album_items(album['id'], manager.list_album_item_ids(album['id']))
+        self.set_state('last_sync', time.time())
+        return added
+
+    # --- Queries ---
+    def albums(self):
+        with self._lock:
+            return self.db.execute("SELECT id, title FROM albums ORDER BY title").fetchall()
+
+    def search(self, date_from=None, date_to=None, orientation="Any", aspect=None, aspect_tol=0.05,
+               min_long=0, min_short=0, album_id=None):
+        """Ids (newest first) matching every given filter.
+
+        aspect compares long/short edge ratios, since a photo can be used in either orientation;
+        min_long/min_short are the pixel dimensions needed for the chosen print size.
+        """
+        where, args = [], []
+        if date_from is not None: where.append("created >= ?"); args.append(date_from)
+        if date_to is not None: where.append("created < ?"); args.append(date_to)
+        if orientation == "Landscape": where.append("width > height")
+        elif orientation == "Portrait": where.append("height > width")
+        elif orientation == "Square": where.append("width = height")
+        if aspect:
+            target = max(aspect, 1 / aspect)
+            where.append("height > 0 AND width > 0 AND ABS(CAST(MAX(width, height) AS REAL) / MIN(width, height) - ?) <= ?")
+            args += [target, target * aspect_tol]
+        if min_long or min_short:
+            where.append("MAX(width, height) >= ? AND MIN(width, height) >= ?"); args += [min_long, min_short]
+        if album_id:
+            where.append("id IN (SELECT media_id FROM album_items WHERE album_id = ?)"); args.append(album_id)
+        sql = "SELECT id FROM media" + (" WHERE " + " AND ".join(where) if where else "") + " ORDER BY created DESC"
+        with self._lock:
+            return [r[0] for r in self.db.execute(sql, args)]
+
+_shared = None
+
+def photo_index():
+    global _shared
+    if _shared is None: _shared = PhotoIndex()
+    return _shared
@@ -0,0 +1,73 @@
+"""The .frame project file.
+
+v2 is a zip container:
+  project.json   format version, FrameApp.get_state(), the source's path and size, the texture's library path
+  proxy.jpg      the source at preview resolution, so reopening renders without decoding the original
+  texture.png    the frame texture (as normalized by texture_library)
+  thumbnail.png  the framed preview, for the recent-projects menu
+v1 files are the plain JSON written by 14.0; read() upgrades them to the v2 layout without images.
+"""
+import os
+import json
+import zipfile
+from PyQt6.QtCore import Qt, QBuffer, QIODevice
+from PyQt6.QtGui import QImage
+
+FORMAT_VERSION = 2
+PROXY_SIDE = 2048
+PROXY_QUALITY = 90
+THUMB_SIDE = 256
+IMAGES = {'proxy': "proxy.jpg", 'texture': "texture.png", 'thumbnail': "thumbnail.png"}
+
+def _encode(img, fmt, quality=-1):
+    buf = QBuffer(); buf.open(QIODevice.OpenModeFlag.WriteOnly)
+    img.save(buf, fmt, quality)
+    return bytes(buf.data())
+
+def _decode(data):
+    img = QImage.fromData(data)
+    return None if img.isNull() else img
+
+def make_proxy(img):
+    """Preview-resolution copy of the source (unchanged if it is already small enough)."""
+    if max(img.width(), img.height()) <= PROXY_SIDE: return img
+    return img.scaled(PROXY_SIDE, PROXY_SIDE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+
+def make_thumbnail(img):
+    return img.scaled(THUMB_SIDE, THUMB_SIDE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+
+def write(path, data, images):
+    """Writes data (a dict) and images ({name in IMAGES: QImage or None}) to path, replacing it atomically."""
+    tmp = path + ".tmp"
+    with zipfile.ZipFile(tmp, 'w') as z:
+        z.writestr("project.json", json.dumps(dict(data, version=FORMAT_VERSION), indent=2), compress_type=zipfile.ZIP_DEFLATED)
+        for name, img in images.items():
+            if img is None or img.isNull(): continue
+            fn = IMAGES[name]
+            # JPEG/PNG are already compressed; store them as-is
+            z.writestr(fn, _encode(img, "JPG" if fn.endswith(".jpg") else "PNG", PROXY_QUALITY if fn.endswith(".jpg") else -1))
+    os.replace(tmp, path)
+
+def read(path):
+    """Returns (data, {name: QImage}) for a v2 container or a v1 JSON file."""
+    if not zipfile.is_zipfile(path):
+        with open(path, 'r') as f: return upgrade_v1(json.load(f)), {}
+    with zipfile.ZipFile(path) as z:
+        data = json.loads(z.read("project.json"))
+        names = set(z.namelist())
+        images = {name: _decode(z.read(fn)) for name, fn in IMAGES.items() if fn in names and name != 'thumbnail'}
+    return data, {k: v for k, v in images.items() if v is not None}
+
+def read_thumbnail(path):
+    """The embedded thumbnail, or None (v1 files and unreadable containers have none)."""
+    try:
+        if not zipfile.is_zipfile(path): return None
+        with zipfile.ZipFile(path) as z: return _decode(z.read(IMAGES['thumbnail']))
+    except (OSError, KeyError, zipfile.BadZipFile): return None
+
+def upgrade_v1(v1):
+    """Maps a v1 project onto the v2 layout. v1 never stored the texture, so 'texture' is left out."""
+    # v1 "dimensions" already uses the state keys (aperture_w, face, rabbet, p_border, mat)
+    state = {'aperture_w': 16, 'aperture_h': 20, 'face': 0.75}; state.update(v1.get("dimensions", {}))
+    state.update({'unit': v1.get("unit", "in"), 'mode': v1.get("mode", "frame"), 'colors': v1.get("colors", {})})
+    return {'version': 1, 'state': state, 'source': {'path': v1.get("image_path", "")}}
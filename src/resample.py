@@ -0,0 +1,249 @@
+"""Resampling for export and previews.
+
+Besides Qt's own QImage.scaled(SmoothTransformation) this offers:
+  - "area":    multi-step area averaging (integer box reduce + exact fractional
+               box filter) for large reductions, vectorized over NumPy views
+               of the QImage bits.
+  - "lanczos": separable Lanczos-3 for print upscales.
+  - "smooth":  the plain Qt call.
+  - "auto":    area for >= 2x reductions, lanczos for upscales, smooth otherwise.
+
+Call sites pick a method explicitly (see RESAMPLE_* in constants.py).
+Run `python -m src.resample` to benchmark the methods against the Qt call.
+"""
+import os
+import math
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtGui import QImage, QPixmap
+
+class _LazyNumpy:
+    """Stands in for the numpy module until a NumPy path actually runs.
+
+    Previews use the Qt path, so importing numpy at startup would be pure cost.
+    The first attribute access imports it and rebinds the module global.
+    """
+    def __getattr__(self, name):
+        global np
+        import numpy
+        np = numpy
+        return getattr(numpy, name)
+
+np = _LazyNumpy()
+
+AREA, LANCZOS, SMOOTH, AUTO = "area", "lanczos", "smooth", "auto"
+LANCZOS_A = 3
+BAND_PIXELS = 1024 * 1024 # output pixels per band; each in-flight band needs ~3 float32 copies of this
+
+def default_workers():
+    return max(1, os.cpu_count() or 1)
+
+def _run_bands(fn, n_rows, step, workers):
+    """Runs fn(y0, y1) over row bands, on a thread pool when workers > 1.
+
+    NumPy releases the GIL inside take/multiply/add on large arrays, so bands
+    genuinely run in parallel. Each band writes its own slice of the output.
+    """
+    bands = [(y0, min(n_rows, y0 + step)) for y0 in range(0, n_rows, step)]
+    workers = min(workers or default_workers(), len(bands))
+    if workers <= 1:
+        for y0, y1 in bands: fn(y0, y1)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for f in [pool.submit(fn, y0, y1) for y0, y1 in bands]: f.result()
+
+def _working_format(img):
+    if img.hasAlphaChannel(): return QImage.Format.Format_ARGB32_Premultiplied
+    return QImage.Format.Format_RGB32
+
+def image_view(img, writable=True):
+    """H x W x 4 uint8 NumPy view over a 32-bit QImage's pixels (no copy).
+
+    The view does not keep the QImage alive; hold a reference for as long as it is used.
+    A read-only view avoids the deep copy bits() makes on an implicitly shared image.
+    """
+    h, w = img.height(), img.width()
+    ptr = img.bits() if writable else img.constBits()
+    ptr.setsize(img.sizeInBytes())
+    arr = np.frombuffer(ptr, np.uint8).reshape(h, img.bytesPerLine())
+    return arr[:, :w * 4].reshape(h, w, 4)
+
+def choose_method(src_w, src_h, dst_w, dst_h, method=AUTO):
+    if method != AUTO: return method
+    ratio = min(dst_w / src_w, dst_h / src_h)
+    if ratio > 1.0: return LANCZOS
+    if ratio <= 0.5: return AREA
+    return SMOOTH
+
+# --- Filter taps -------------------------------------------------------------
+
+def _area_taps(n_in, n_out):
+    """Exact box-filter coverage weights: output i averages source [i*s, (i+1)*s)."""
+    s = n_in / n_out
+    taps = int(math.ceil(s)) + 1
+    lo = np.arange(n_out) * s
+    hi = lo + s
+    first = np.floor(lo).astype(np.int64)
+    idx = first[:, None] + np.arange(taps)[None, :]
+    overlap = np.minimum(hi[:, None], idx + 1) - np.maximum(lo[:, None], idx)
+    wts = np.clip(overlap, 0, None)
+    idx = np.clip(idx, 0, n_in - 1)
+    return idx, (wts / wts.sum(axis=1, keepdims=True)).astype(np.float32)
+
+def _lanczos_taps(n_in, n_out, a=LANCZOS_A):
+    scale = n_out / n_in
+    stretch = max(1.0, 1.0 / scale) # widen the kernel when reducing to avoid aliasing
+    support = a * stretch
+    center = (np.arange(n_out) + 0.5) / scale - 0.5
+    first = np.floor(center - support).astype(np.int64) + 1
+    taps = int(math.ceil(2 * support)) + 1
+    idx = first[:, None] + np.arange(taps)[None, :]
+    x = (idx - center[:, None]) / stretch
+    wts = np.sinc(x) * np.sinc(x / a)
+    wts[np.abs(x) >= a] = 0
+    idx = np.clip(idx, 0, n_in - 1)
+    return idx, (wts / wts.sum(axis=1, keepdims=True)).astype(np.float32)
+
+def _apply_taps(arr, idx, wts, axis):
+    """Weighted gather along axis 0 or 1 of an H x W x C float32 array."""
+    shape = list(arr.shape); shape[axis] = idx.shape[0]
+    out = np.zeros(shape, np.float32)
+    tmp = np.empty(shape, np.float32)
+    w_shape = (1, -1, 1) if axis == 1 else (-1, 1, 1)
+    for t in range(idx.shape[1]):
+        np.take(arr, idx[:, t], axis=axis, out=tmp)
+        tmp *= wts[:, t].reshape(w_shape)
+        out += tmp
+    return out
+
+def _separable_band(src, taps_x, taps_y, y0, y1, out):
+    """Fills out rows [y0, y1) from src using separable taps."""
+    idx_y, wts_y = taps_y
+    band_idx = idx_y[y0:y1]
+    r0, r1 = int(band_idx.min()), int(band_idx.max()) + 1
+    rows = _apply_taps(src[r0:r1].astype(np.float32), taps_x[0], taps_x[1], axis=1)
+    res = _apply_taps(rows, band_idx - r0, wts_y[y0:y1], axis=0)
+    np.clip(res + 0.5, 0, 255, out=res)
+    out[y0:y1] = res.astype(np.uint8)
+
+def _band_rows(out_w, out_h):
+    return max(1, min(out_h, BAND_PIXELS // max(1, out_w)))
+
+def _separable(src, out, taps_x, taps_y, premultiplied, workers=0):
+    """Separable filter into out (H x W x 4 uint8), band-parallel over output rows.
+
+    Each band only reads the source rows its vertical taps reach, so the
+    overlap between neighbouring bands is handled by the tap indices.
+    """
+    def band(y0, y1):
+        _separable_band(src, taps_x, taps_y, y0, y1, out)
+        if premultiplied: np.minimum(out[y0:y1, :, :3], out[y0:y1, :, 3:4], out=out[y0:y1, :, :3])
+    _run_bands(band, out.shape[0], _band_rows(out.shape[1], out.shape[0]), workers)
+    return out
+
+def _box_reduce(src, kx, ky, workers=0):
+    """Integer-factor box reduction; trims < k leftover source pixels evenly from the edges."""
+    h, w = src.shape[0] // ky, src.shape[1] // kx
+    oy, ox = (src.shape[0] - h * ky) // 2, (src.shape[1] - w * kx) // 2
+    acc_type = np.uint16 if kx * ky <= 256 else np.uint32 # 256 * 255 plus the rounding term (128) still fits in 16 bits
+    out = np.empty((h, w, 4), np.uint8)
+
+    def band(y0, y1):
+        band = src[oy + y0 * ky:oy + y1 * ky, ox:ox + w * kx].reshape(y1 - y0, ky, w * kx, 4)
+        # Rows first (contiguous adds shrink the data ky times), then strided column slices
+        rows = band[:, 0].astype(acc_type)
+        for j in range(1, ky): rows += band[:, j]
+        acc = rows[:, 0::kx].copy()
+        for i in range(1, kx): acc += rows[:, i::kx]
+        acc += (kx * ky) // 2
+        acc //= kx * ky
+        out[y0:y1] = acc
+    _run_bands(band, h, max(1, BAND_PIXELS // max(1, w * ky)), workers)
+    return out
+
+# --- Public API ---------------------------------------------------------------
+
+def _to_qimage(arr, fmt):
+    h, w = arr.shape[:2]
+    img = QImage(w, h, fmt)
+    image_view(img)[:] = arr
+    return img
+
+def _filter_into_qimage(src, w, h, taps_x, taps_y, fmt, workers):
+    # Bands are written straight into the destination QImage's buffer, no reassembly copy
+    img = QImage(w, h, fmt)
+    _separable(src, image_view(img), taps_x, taps_y, fmt == QImage.Format.Format_ARGB32_Premultiplied, workers)
+    return img
+
+def area_downscale(img, w, h, workers=0):
+    """Area-average reduction to exactly w x h."""
+    fmt = _working_format(img)
+    src_img = img.convertToFormat(fmt)
+    src = image_view(src_img, writable=False)
+    # Step 1: cheap integer box reduce while we're still >= 2x the target on an axis
+    kx = max(1, src.shape[1] // w); ky = max(1, src.shape[0] // h)
+    if kx > 1 or ky > 1: src = _box_reduce(src, kx, ky, workers)
+    # Step 2: exact fractional box filter for the remaining (< 2x) reduction
+    if src.shape[1] == w and src.shape[0] == h: return _to_qimage(src, fmt)
+    taps_x = _area_taps(src.shape[1], w) if src.shape[1] > w else _lanczos_taps(src.shape[1], w)
+    taps_y = _area_taps(src.shape[0], h) if src.shape[0] > h else _lanczos_taps(src.shape[0], h)
+    return _filter_into_qimage(src, w, h, taps_x, taps_y, fmt, workers)
+
+def lanczos_resize(img, w, h, workers=0):
+    """Separable Lanczos-3 resize to exactly w x h (kernel widens automatically for reductions)."""
+    fmt = _working_format(img)
+    src_img = img.convertToFormat(fmt)
+    src = image_view(src_img, writable=False)
+    taps_x = _lanczos_taps(src.shape[1], w); taps_y = _lanczos_taps(src.shape[0], h)
+    return _filter_into_qimage(src, w, h, taps_x, taps_y, fmt, workers)
+
+def resample(img, w, h, method=AUTO, workers=0):
+    """Resizes a QImage to exactly w x h with the chosen method.
+
+    workers: thread count for the NumPy paths (0 = one per CPU core).
+    """
+    if img.isNull() or w <= 0 or h <= 0: return QImage()
+    if img.width() == w and img.height() == h: return QImage(img)
+    method = choose_method(img.width(), img.height(), w, h, method)
+    if method == AREA: return area_downscale(img, w, h, workers)
+    if method == LANCZOS: return lanczos_resize(img, w, h, workers)
+    return img.scaled(w, h, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
+
+def scaled(img, w, h, aspect_mode=Qt.AspectRatioMode.KeepAspectRatio, method=AUTO, workers=0):
+    """Drop-in for QImage.scaled(w, h, aspect_mode, SmoothTransformation) with a selectable method."""
+    size = img.size().scaled(QSize(int(w), int(h)), aspect_mode)
+    return resample(img, max(1, size.width()), max(1, size.height()), method, workers)
+
+def scaled_pixmap(pixmap, w, h, aspect_mode=Qt.AspectRatioMode.KeepAspectRatio, method=AUTO):
+    """QPixmap version of scaled(); the smooth path stays on the pixmap to avoid a round trip."""
+    size = pixmap.size().scaled(QSize(int(w), int(h)), aspect_mode)
+    tw, th = max(1, size.width()), max(1, size.height())
+    if choose_method(pixmap.width(), pixmap.height(), tw, th, method) == SMOOTH:
+        return pixmap.scaled(tw, th, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
+    return QPixmap.fromImage(resample(pixmap.toImage(), tw, th, method))
+
+def benchmark(src_w=6000, src_h=4000, targets=((800, 533), (150, 100), (12000, 8000)), repeat=3, workers=(1, 0)):
+    """Times each method against the current QImage.scaled call.
+
+    NumPy methods are timed once per entry in workers (0 = all cores).
+    Returns [(target, method, workers, seconds)].
+    """
+    import time
+    rng = np.random.default_rng(0)
+    img = QImage(src_w, src_h, QImage.Format.Format_RGB32)
+    image_view(img)[:] = rng.integers(0, 256, (src_h, src_w, 4), dtype=np.uint8)
+    rows = []
+    for tw, th in targets:
+        runs = [(SMOOTH, 1)]
+        for m in ([LANCZOS] if tw > src_w else [AREA, LANCZOS]):
+            runs += [(m, n or default_workers()) for n in workers]
+        for m, n in dict.fromkeys(runs):
+            best = float('inf')
+            for _ in range(repeat):
+                t0 = time.perf_counter(); resample(img, tw, th, m, n); best = min(best, time.perf_counter() - t0)
+            rows.append(((tw, th), m, n, best))
+    return rows
+
+if __name__ == "__main__":
+    for (tw, th), m, n, secs in benchmark():
+        print(f"{tw:>6}x{th:<6} {m:<8} x{n:<3} {secs * 1000:8.1f} ms")
@@ -0,0 +1,87 @@
+"""Startup-time report: per-module import cost and time to first paint.
+
+Enable with `python frame_app.py --startup-report` (or FRAMETAMER_STARTUP_REPORT=1).
+install() must run before the imports it should measure; the report prints
+when the main window receives its first paint event.
+"""
+import os
+import sys
+import time
+from importlib.abc import MetaPathFinder
+
+START = time.perf_counter()
+
+def enabled():
+    return "--startup-report" in sys.argv or os.environ.get("FRAMETAMER_STARTUP_REPORT") == "1"
+
+class ImportTimer(MetaPathFinder):
+    """Wraps each loader's exec_module to record cumulative import time (children included)."""
+    def __init__(self):
+        self.times = {}
+        self.order = []
+        self._busy = False
+
+    def find_spec(self, name, path=None, target=None):
+        if self._busy: return None
+        self._busy = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"): continue
+                spec = finder.find_spec(name, path, target)
+                if spec is not None: break
+            else:
+                return None
+        finally:
+            self._busy = False
+        loader = spec.loader
+        # Built-in/frozen importers are classes shared by every module; leave them alone
+        if loader is None or isinstance(loader, type) or not hasattr(loader, "exec_module"): return spec
+        exec_module = loader.exec_module
+        def timed(module, _exec=exec_module):
+            t = time.perf_counter()
+            try: _exec(module)
+            finally:
+                self.times[name] = time.perf_counter() - t
+                self.order.append(name)
+        try: loader.exec_module = timed
+        except (AttributeError, TypeError): pass # built-in loaders are shared and read-only
+        return spec
+
+_timer = None
+_marks = []
+
+def install():
+    global _timer
+    if _timer is None and enabled():
+        _timer = ImportTimer()
+        sys.meta_path.insert(0, _timer)
+
+def mark(label):
+    if _timer is not None: _marks.append((label, time.perf_counter() - START))
+
+def report(top=15):
+    if _timer is None: return
+    sys.meta_path.remove(_timer)
+    print("Startup report")
+    for label, t in _marks: print(f"  {label:<28}{t * 1000:8.1f} ms")
+    print("  Slowest imports (cumulative):")
+    # Only top-level packages and our own modules; submodules are already counted in their parent
+    shown = [(n, t) for n, t in _timer.times.items() if "." not in n or n.startswith(("src.", "PyQt6."))]
+    for name, t in sorted(shown, key=lambda x: x[1], reverse=True)[:top]:
+        print(f"    {name:<40}{t * 1000:8.1f} ms")
+
+def watch_first_paint(widget):
+    """Marks 'first paint' and prints the report on the widget's first Paint event."""
+    if _timer is None: return
+    from PyQt6.QtCore import QObject, QEvent
+
+    class _FirstPaint(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint:
+                widget.removeEventFilter(self)
+                mark("first paint")
+                report()
+            return False
+
+    widget._startup_filter = _FirstPaint(widget)
+    widget.installEventFilter(widget._startup_filter)
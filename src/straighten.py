@@ -0,0 +1,125 @@
+"""Automatic straightening and strip selection for the texture sampler.
+
+Works on a small proxy of the moulding photo: a magnitude-weighted histogram
+of edge orientations gives the tilt, and the edge-strength profile across the
+straightened image gives the two parallel edges that bound the moulding face.
+Imported lazily by the sampler so numpy stays off the startup path.
+"""
+import numpy as np
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QImage, QTransform
+from .resample import image_view
+
+ANALYSIS_SIDE = 512
+BIN_DEG = 0.25
+MAX_ANGLE = 45.0
+EDGE_PERCENTILE = 80 # only the strongest edges vote on the angle
+REFINE_DEG = 2.0 # the projection search covers the histogram peak +/- this
+REFINE_STEP = 0.1 # matches the slider's resolution
+MIN_GAP = 0.03 # minimum strip thickness, as a fraction of the image
+MIN_ASPECT = 2.0 # the sampler's selections are at least 2:1
+
+def _gray(img):
+    """H x W float32 luminance and a mask of pixels that lie inside the (possibly rotated) image."""
+    arr = image_view(img, writable=False)
+    gray = arr[:, :, 2] * 0.299 + arr[:, :, 1] * 0.587 + arr[:, :, 0] * 0.114
+    return gray.astype(np.float32), arr[:, :, 3] == 255
+
+def _blur(gray, passes=2):
+    """Separable [1 2 1] smoothing; without it pixel staircases bias gradients toward the axes."""
+    for _ in range(passes):
+        gray = gray.copy()
+        gray[:, 1:-1] = (gray[:, :-2] + 2 * gray[:, 1:-1] + gray[:, 2:]) / 4
+        gray[1:-1, :] = (gray[:-2, :] + 2 * gray[1:-1, :] + gray[2:, :]) / 4
+    return gray
+
+def _gradients(gray, valid):
+    gray = _blur(gray)
+    gx = np.zeros_like(gray); gy = np.zeros_like(gray)
+    gx[:, 1:-1] = gray[:, 2:] - gray[:, :-2]
+    gy[1:-1, :] = gray[2:, :] - gray[:-2, :]
+    # Drop gradients that straddle the transparent corners a rotation leaves behind
+    inside = valid.copy()
+    inside[:, 1:-1] &= valid[:, 2:] & valid[:, :-2]
+    inside[1:-1, :] &= valid[2:, :] & valid[:-2, :]
+    inside[[0, -1], :] = False; inside[:, [0, -1]] = False
+    return gx * inside, gy * inside
+
+def estimate_angle(gray, valid):
+    """Returns (slider angle in degrees that straightens the dominant edges, True if they run horizontally)."""
+    gx, gy = _gradients(gray, valid)
+    mag = np.hypot(gx, gy)
+    strong = mag > max(np.percentile(mag, EDGE_PERCENTILE), 1e-6)
+    if not strong.any(): return 0.0, True
+    edge = (np.degrees(np.arctan2(gy[strong], gx[strong])) + 90.0) % 180.0 # edge runs perpendicular to the gradient
+    tilt = (edge + MAX_ANGLE) % 90.0 - MAX_ANGLE # deviation from the nearest axis
+    weights = mag[strong]
+    bins = int(2 * MAX_ANGLE / BIN_DEG)
+    hist, edges = np.histogram(tilt, bins=bins, range=(-MAX_ANGLE, MAX_ANGLE), weights=weights)
+    hist = np.convolve(np.concatenate([hist[-2:], hist, hist[:2]]), np.ones(5) / 5, mode='valid') # wraps at +/-45
+    peak = edges[hist.argmax()] + BIN_DEG / 2
+    near = np.abs(tilt - peak) <= REFINE_DEG
+    # Which axis those edges lie along decides between a horizontal and a vertical strip
+    along = edge[near] if near.any() else edge
+    horizontal = np.abs(((along + 90.0) % 180.0) - 90.0).mean() < 45.0
+    if near.any(): peak = _refine(strong, mag, near, peak, horizontal)
+    return -peak, bool(horizontal)
+
+def _refine(strong, mag, near, peak, horizontal):
+    """Sharpens the histogram peak with a projection (Hough-style) search.
+
+    The voting pixels are projected across candidate line directions; the true
+    angle stacks each edge into the fewest bins, maximizing the sum of squares.
+    Pixel-level gradients alone are biased toward the axes on thin edges.
+    """
+    ys, xs = np.nonzero(strong)
+    ys, xs, w = ys[near].astype(np.float32), xs[near].astype(np.float32), mag[strong][near]
+    best, best_score = peak, -1.0
+    for a in peak + np.arange(-REFINE_DEG, REFINE_DEG + REFINE_STEP / 2, REFINE_STEP):
+        t = np.radians(a)
+        r = ys * np.cos(t) - xs * np.sin(t) if horizontal else xs * np.cos(t) + ys * np.sin(t)
+        hist = np.bincount(np.round(r - r.min()).astype(np.int64), weights=w)
+        score = float((hist * hist).sum())
+        if score > best_score: best, best_score = float(a), score
+    return best
+
+def _rotated(img, angle):
+    out = img.transformed(QTransform().rotate(angle), Qt.TransformationMode.SmoothTransformation)
+    return out.convertToFormat(QImage.Format.Format_ARGB32)
+
+def find_strip(gray, valid, horizontal):
+    """Normalized QRectF between the two strongest parallel edges of the straightened proxy."""
+    if not horizontal: gray, valid = gray.T, valid.T
+    gx, gy = _gradients(gray, valid)
+    across = np.abs(gy) * (np.abs(gy) > np.abs(gx)) # edges running along the strip
+    counts = np.maximum(valid.sum(1), 1)
+    profile = np.convolve(across.sum(1) / counts, np.ones(3) / 3, mode='same')
+    h, w = gray.shape
+    gap = max(2, int(MIN_GAP * h))
+    first = int(profile.argmax())
+    masked = profile.copy(); masked[max(0, first - gap):first + gap + 1] = 0
+    second = int(masked.argmax())
+    top, bottom = sorted((first, second))
+    rows = valid[top:bottom + 1]
+    cols = np.where(rows.all(0))[0] if rows.size else np.array([], int)
+    left, right = (int(cols[0]), int(cols[-1]) + 1) if cols.size else (0, w)
+    margin = int(0.05 * (right - left))
+    left, right = left + margin, right - margin
+    if right - left < MIN_ASPECT * (bottom - top): # keep the sampler's 2:1 minimum around the strip's centre
+        cx = (left + right) / 2; half = MIN_ASPECT * (bottom - top) / 2
+        left, right = max(0, cx - half), min(w, cx + half)
+    rect = QRectF(left / w, top / h, (right - left) / w, (bottom - top) / h)
+    return rect if horizontal else QRectF(rect.y(), rect.x(), rect.height(), rect.width())
+
+def detect(image):
+    """Proposes {'angle': slider degrees, 'selection': normalized QRectF in the straightened image, 'horizontal'}.
+
+    image is any downsampled copy of the source with the same aspect ratio; the
+    selection is normalized, so it applies to the full-resolution original.
+    """
+    small = image.scaled(ANALYSIS_SIDE, ANALYSIS_SIDE, Qt.AspectRatioMode.KeepAspectRatio,
+                         Qt.TransformationMode.SmoothTransformation).convertToFormat(QImage.Format.Format_ARGB32)
+    angle, horizontal = estimate_angle(*_gray(small))
+    angle = round(angle, 1) # the slider works in tenths of a degree
+    straight = _rotated(small, angle)
+    return {'angle': angle, 'selection': find_strip(*_gray(straight), horizontal), 'horizontal': horizontal}
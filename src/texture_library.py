@@ -0,0 +1,272 @@
+"""Texture library on disk: directory scans, cached thumbnails and the texture catalog.
+
+Thumbnails are written once to APP_DATA_DIR/texture_thumbs, keyed on the
+texture's path and mtime, so reopening a large library only reads small PNGs.
+The catalog (catalog.sqlite inside the library folder, so it travels with a
+shared library) holds per-texture metadata and derived images computed once.
+"""
+import os
+import math
+import sqlite3
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtCore import Qt, QObject, QSize, QBuffer, QByteArray, QIODevice, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader, QColor, QPainter, QTransform
+from .constants import APP_DATA_DIR, TEXTURES_DIR, TEXTURE_FACE_PX
+from .resample import np, image_view
+from .utils import ColorUtils
+
+THUMB_SIZE = 200 # large enough for the preview pane; list icons are scaled from it
+THUMB_DIR = os.path.join(APP_DATA_DIR, "texture_thumbs")
+EXTENSIONS = (".png",)
+ANALYSIS_SIDE = 256 # long edge of the copy colors and grain are measured on
+MIN_LEVEL_HEIGHT = 8 # smallest strip kept in the multi-resolution chain
+GRAIN_MIN_COHERENCE = 0.15 # below this the texture has no clear grain direction
+
+def scan(folder=TEXTURES_DIR):
+    """{path: mtime} for every texture file in folder."""
+    found = {}
+    try: entries = list(os.scandir(folder))
+    except OSError: return found
+    for entry in entries:
+        if entry.is_file() and entry.name.lower().endswith(EXTENSIONS):
+            try: found[entry.path] = entry.stat().st_mtime
+            except OSError: pass
+    return found
+
+def thumb_path(path, mtime):
+    key = f"{os.path.abspath(path)}|{mtime}|{THUMB_SIZE}".encode()
+    return os.path.join(THUMB_DIR, hashlib.sha1(key).hexdigest() + ".png")
+
+def load_thumbnail(path, mtime):
+    """Returns the cached thumbnail, decoding and storing it on a miss. Safe to call off the GUI thread."""
+    cached = thumb_path(path, mtime)
+    if os.path.exists(cached):
+        img = QImage(cached)
+        if not img.isNull(): return img
+    reader = QImageReader(path)
+    size = reader.size()
+    if size.isValid() and max(size.width(), size.height()) > THUMB_SIZE:
+        # JPEG decodes straight to the smaller size; other formats are scaled by the reader after decoding
+        reader.setScaledSize(size.scaled(QSize(THUMB_SIZE, THUMB_SIZE), Qt.AspectRatioMode.KeepAspectRatio))
+    img = reader.read()
+    if img.isNull(): return img
+    os.makedirs(THUMB_DIR, exist_ok=True)
+    if img.save(cached + ".tmp", "PNG"): os.replace(cached + ".tmp", cached)
+    return img
+
+class ThumbnailLoader(QObject):
+    """Decodes texture thumbnails on a thread pool; results arrive via ready on the GUI thread."""
+    ready = pyqtSignal(str, float, QImage) # path, mtime it was made from, thumbnail
+
+    def __init__(self, workers=4, parent=None):
+        super().__init__(parent)
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        self.pending = set()
+        self._lock = threading.Lock()
+
+    def request(self, path, mtime):
+        with self._lock:
+            if (path, mtime) in self.pending: return
+            self.pending.add((path, mtime))
+        self.pool.submit(self._load, path, mtime)
+
+    def _load(self, path, mtime):
+        try:
+            self.ready.emit(path, mtime, load_thumbnail(path, mtime))
+            texture_catalog().ensure(path) # one-time catalog entry for textures saved before the catalog existed
+        except Exception as e: print(f"Texture thumbnail failed: {e}")
+        finally:
+            with self._lock: self.pending.discard((path, mtime))
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+def normalize(img, face_px=TEXTURE_FACE_PX):
+    """Canonical texture: length running horizontally and the face at most face_px tall (never upscaled)."""
+    if img.height() > img.width(): img = img.transformed(QTransform(0, 1, 1, 0, 0, 0))
+    if img.height() > face_px:
+        img = img.scaled(max(1, round(img.width() * face_px / img.height())), face_px,
+                         Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
+    return img
+
+def decode_texture(path, face_px=TEXTURE_FACE_PX):
+    """Decodes a texture file and normalizes it.
+
+    JPEGs decode straight to the reduced size; PNG (the library format) is
+    decoded at full size and scaled afterwards, like load_thumbnail.
+    """
+    reader = QImageReader(path)
+    size = reader.size()
+    if size.isValid() and min(size.width(), size.height()) > face_px:
+        reader.setScaledSize(size.scaled(QSize(face_px, face_px), Qt.AspectRatioMode.KeepAspectRatioByExpanding))
+    img = reader.read()
+    return normalize(img, face_px) if not img.isNull() else img
+
+def load_texture(path, face_px=TEXTURE_FACE_PX):
+    """Normalized library texture, served from the catalog: only the first ingest of a file decodes it in full."""
+    if face_px == TEXTURE_FACE_PX:
+        try:
+            catalog = texture_catalog()
+            img = catalog.texture(path) if catalog.get(path) else None
+            if img is not None: return img
+            img = decode_texture(path)
+            if not img.isNull(): catalog.add(path, img) # also backfills entries made before the base was stored
+            return img
+        except (sqlite3.Error, OSError) as e: print(f"Texture catalog unavailable: {e}")
+    return decode_texture(path, face_px)
+
+# --- Catalog ---
+def _png(img):
+    data = QByteArray(); buf = QBuffer(data); buf.open(QIODevice.OpenModeFlag.WriteOnly)
+    img.save(buf, "PNG")
+    return bytes(data)
+
+def _from_png(data):
+    return QImage.fromData(data, "PNG")
+
+def analyze(img):
+    """Average/median color and grain direction of a texture (measured on a small copy).
+
+    Grain comes from the structure tensor of the luminance gradients: wood grain
+    runs perpendicular to the dominant gradient, and the coherence (0..1) says
+    how strongly one direction dominates.
+    """
+    small = img.scaled(ANALYSIS_SIDE, ANALYSIS_SIDE, Qt.AspectRatioMode.KeepAspectRatio,
+                       Qt.TransformationMode.SmoothTransformation).convertToFormat(QImage.Format.Format_RGB32)
+    rgb = image_view(small, writable=False)[:, :, 2::-1].reshape(-1, 3).astype(np.float32)
+    avg = QColor(*[int(round(v)) for v in rgb.mean(0)])
+    median = QColor(*[int(v) for v in np.median(rgb, 0)])
+
+    lum = (rgb @ np.array([0.299, 0.587, 0.114], np.float32)).reshape(small.height(), small.width())
+    gx, gy = np.diff(lum, axis=1)[:-1, :], np.diff(lum, axis=0)[:, :-1]
+    jxx, jyy, jxy = float((gx * gx).sum()), float((gy * gy).sum()), float((gx * gy).sum())
+    total = jxx + jyy
+    coherence = math.hypot(jxx - jyy, 2 * jxy) / total if total > 0 else 0.0
+    angle = (math.degrees(0.5 * math.atan2(2 * jxy, jxx - jyy)) + 90) % 180 # grain = gradient + 90 deg
+    if coherence < GRAIN_MIN_COHERENCE: grain = "none"
+    else: grain = "horizontal" if min(angle, 180 - angle) < 45 else "vertical"
+    return {'width': img.width(), 'height': img.height(), 'avg': avg.name(), 'median': median.name(),
+            'color_name': ColorUtils.get_closest_name(avg), 'grain': grain,
+            'grain_angle': round(angle, 1), 'grain_strength': round(coherence, 3)}
+
+def seamless_tile(img):
+    """The sample followed by its mirror image, so repeating it along the length has no seams."""
+    tile = QImage(img.width() * 2, img.height(), QImage.Format.Format_ARGB32_Premultiplied)
+    tile.fill(Qt.GlobalColor.transparent)
+    p = QPainter(tile)
+    p.drawImage(0, 0, img)
+    p.drawImage(img.width(), 0, img.transformed(QTransform(-1, 0, 0, 1, img.width(), 0)))
+    p.end()
+    return tile
+
+def strip_levels(img, min_height=MIN_LEVEL_HEIGHT):
+    """Successive half-size copies of a strip, largest first (the original itself is not included)."""
+    levels, cur = [], img
+    while cur.height() // 2 >= min_height and cur.width() >= 2:
+        cur = cur.scaled(cur.width() // 2, cur.height() // 2, Qt.AspectRatioMode.IgnoreAspectRatio,
+                         Qt.TransformationMode.SmoothTransformation)
+        levels.append(cur)
+    return levels
+
+class TextureCatalog:
+    """SQLite catalog of library textures: metadata plus the normalized texture, a seamless tile and strip levels.
+
+    Entries are keyed on the file name inside the library folder and are
+    recomputed when the file's mtime changes.
+    """
+    def __init__(self, folder=TEXTURES_DIR):
+        self.folder = folder
+        os.makedirs(folder, exist_ok=True)
+        self._lock = threading.Lock()
+        self.db = sqlite3.connect(os.path.join(folder, "catalog.sqlite"), check_same_thread=False)
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS textures (name TEXT PRIMARY KEY, mtime REAL, width INTEGER, height INTEGER,
+                                                 avg TEXT, avg_r INTEGER, avg_g INTEGER, avg_b INTEGER, median TEXT,
+                                                 color_name TEXT, grain TEXT, grain_angle REAL, grain_strength REAL);
+            CREATE TABLE IF NOT EXISTS assets (name TEXT, kind TEXT, level INTEGER, data BLOB,
+                                               PRIMARY KEY (name, kind, level));
+        """)
+        self.db.commit()
+
+    def key(self, path):
+        return os.path.basename(path)
+
+    def add(self, path, img=None):
+        """Analyzes a texture file (or the already decoded img) and stores its entry. Returns the record."""
+        if img is None: img = decode_texture(path)
+        if img.isNull(): return None
+        info = analyze(img)
+        assets = [('base', 0, _png(img)), ('tile', 0, _png(seamless_tile(img)))] + [('level', i + 1, _png(l)) for i, l in enumerate(strip_levels(img))]
+        name, avg = self.key(path), QColor(info['avg'])
+        with self._lock:
+            self.db.execute("INSERT OR REPLACE INTO textures VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                            (name, os.path.getmtime(path), info['width'], info['height'], info['avg'], avg.red(), avg.green(),
+                             avg.blue(), info['median'], info['color_name'], info['grain'], info['grain_angle'], info['grain_strength']))
+            self.db.execute("DELETE FROM assets WHERE name=?", (name,))
+            self.db.executemany("INSERT INTO assets VALUES (?, ?, ?, ?)", [(name, k, lv, d) for k, lv, d in assets])
+            self.db.commit()
+        return self.get(path)
+
+    def get(self, path):
+        """The stored record for a texture file, or None when missing or out of date."""
+        with self._lock:
+            cur = self.db.execute("SELECT * FROM textures WHERE name=?", (self.key(path),))
+            row = cur.fetchone()
+            cols = [c[0] for c in cur.description]
+        if row is None: return None
+        rec = dict(zip(cols, row))
+        try:
+            if rec['mtime'] != os.path.getmtime(path): return None
+        except OSError: return None
+        rec['path'] = path
+        return rec
+
+    def ensure(self, path, img=None):
+        return self.get(path) or self.add(path, img)
+
+    def texture(self, path):
+        """The normalized texture stored at ingest, or None for entries written before it was kept."""
+        with self._lock:
+            row = self.db.execute("SELECT data FROM assets WHERE name=? AND kind='base'", (self.key(path),)).fetchone()
+        return _from_png(row[0]) if row else None
+
+    def tile(self, path):
+        with self._lock:
+            row = self.db.execute("SELECT data FROM assets WHERE name=? AND kind='tile'", (self.key(path),)).fetchone()
+        return _from_png(row[0]) if row else None
+
+    def levels(self, path):
+        """Pre-scaled copies of the texture, largest first."""
+        with self._lock:
+            rows = self.db.execute("SELECT data FROM assets WHERE name=? AND kind='level' ORDER BY level",
+                                   (self.key(path),)).fetchall()
+        return [_from_png(r[0]) for r in rows]
+
+    def remove(self, path):
+        with self._lock:
+            self.db.execute("DELETE FROM textures WHERE name=?", (self.key(path),))
+            self.db.execute("DELETE FROM assets WHERE name=?", (self.key(path),))
+            self.db.commit()
+
+    def search(self, name=None, color=None, limit=None):
+        """Texture file names matching a name fragment, nearest to color (a QColor) first when given."""
+        where, args, order = [], [], "name"
+        if name: where.append("name LIKE ?"); args.append(f"%{name}%")
+        if color is not None:
+            order = "(avg_r - ?) * (avg_r - ?) + (avg_g - ?) * (avg_g - ?) + (avg_b - ?) * (avg_b - ?)"
+            args += [color.red(), color.red(), color.green(), color.green(), color.blue(), color.blue()]
+        sql = "SELECT name FROM textures" + (" WHERE " + " AND ".join(where) if where else "") + f" ORDER BY {order}"
+        if limit: sql += f" LIMIT {int(limit)}"
+        with self._lock:
+            return [r[0] for r in self.db.execute(sql, args)]
+
+_shared = None
+_shared_lock = threading.Lock()
+
+def texture_catalog():
+    global _shared
+    with _shared_lock:
+        if _shared is None: _shared = TextureCatalog()
+    return _shared
@@ -1,8 +1,7 @@
-import math
 from PyQt6.QtCore import Qt, QRectF, QPointF
 from PyQt6.QtGui import QPen, QFont, QColor
 from .constants import GRID_MAJOR_COLOR, GRID_MINOR_COLOR
-from .colors import COLORS
+from . import colors
 import colorsys
 
 def get_fit_metrics(view_w, view_h, content_w, content_h):
@@ -86,22 +85,10 @@ class ColorUtils:
     @staticmethod
     def get_closest_name(qcolor):
         r1, g1, b1 = qcolor.red(), qcolor.green(), qcolor.blue()
-        best_match = "Custom"
-        min_dist = float('inf')
         
-        # Simple weighted Euclidean distance (better than raw RGB for human perception)
-        # Weights: R: 0.3, G: 0.59, B: 0.11 (standard luminance weights, but for distance we use:
-        # Red: 2, Green: 4, Blue: 3 - a common fast approximation)
-        for name, (r2, g2, b2) in COLORS.items():
-            rmean = (r1 + r2) / 2
-            r = r1 - r2
-            g = g1 - g2
-            b = b1 - b2
-            dist = math.sqrt((((512+rmean)*r*r)/256) + 4*g*g + (((767-rmean)*b*b)/256))
-            
-            if dist < min_dist:
-                min_dist = dist
-                best_match = name
+        # Redmean-weighted RGB distance (better than raw RGB for human perception),
+        # searched through the precomputed cell index in color_table.py
+        best_match, min_dist = colors.nearest(r1, g1, b1)
         
         # Higher threshold for descriptive names (80)
         if min_dist < 80:
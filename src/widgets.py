@@ -1,8 +1,13 @@
 import math
 from PyQt6.QtWidgets import QLabel, QSizePolicy, QWidget, QVBoxLayout, QToolButton, QFrame, QGridLayout, QColorDialog, QHBoxLayout, QPushButton
-from PyQt6.QtCore import Qt, QRectF, pyqtSignal, QPointF, QSize, QPropertyAnimation, QParallelAnimationGroup, QAbstractAnimation
-from PyQt6.QtGui import QPixmap, QPainter, QColor, QPen, QRegion, QPolygonF, QBrush, QTransform, QPainterPath
+from PyQt6.QtCore import Qt, QRectF, pyqtSignal, QPointF, QPropertyAnimation, QParallelAnimationGroup, QAbstractAnimation
+from PyQt6.QtGui import QPixmap, QImage, QPainter, QColor, QPen, QRegion, QPolygonF, QBrush, QTransform, QPainterPath
 from .utils import get_fit_metrics, UnitUtils, draw_physical_grid, ColorUtils
+from .image_cache import image_cache, pixmap_key
+from .resample import scaled_pixmap
+from .constants import RESAMPLE_PREVIEW
+
+def _rect_key(r): return (r.x(), r.y(), r.width(), r.height())
 
 class SourceCropper(QLabel):
     cropChanged = pyqtSignal(QRectF) 
@@ -40,7 +45,9 @@ class SourceCropper(QLabel):
         if self.pixmap_original:
             w, h = self.width() - 4, self.height() - 4
             if w <= 0 or h <= 0: return
-            self.scaled_pixmap = self.pixmap_original.scaled(w, h, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            orig = self.pixmap_original
+            self.scaled_pixmap = image_cache.get_or_create("preview", ("cropper", pixmap_key(orig), w, h),
+                lambda: scaled_pixmap(orig, w, h, Qt.AspectRatioMode.KeepAspectRatio, RESAMPLE_PREVIEW))
             self.update()
 
     def get_image_offset(self):
@@ -185,7 +192,9 @@ class InteractiveMatEditor(QLabel):
         
         if self.pixmap_original:
             t_w, t_h = math.ceil(r_hole.width()), math.ceil(r_hole.height())
-            scaled = self.pixmap_original.scaled(QSize(t_w, t_h), Qt.AspectRatioMode.KeepAspectRatioByExpanding, Qt.TransformationMode.SmoothTransformation)
+            orig = self.pixmap_original
+            scaled = image_cache.get_or_create("preview", ("mat_editor", pixmap_key(orig), t_w, t_h),
+                lambda: scaled_pixmap(orig, t_w, t_h, Qt.AspectRatioMode.KeepAspectRatioByExpanding, RESAMPLE_PREVIEW))
             sx, sy = (scaled.width() - r_hole.width()) / 2, (scaled.height() - r_hole.height()) / 2
             painter.save(); painter.setClipRect(r_hole)
             painter.drawPixmap(int(r_hole.x() - sx), int(r_hole.y() - sy), scaled)
@@ -273,7 +282,10 @@ class FramePreviewLabel(QLabel):
         inner_rect = QRectF(face_px, face_px, render_w - 2*face_px, render_h - 2*face_px)
 
         radius_px = p.get('corner_radius', 0.0) * scale
-        if radius_px > 0:
+        frame_tex = p.get('frame_texture')
+        tiled = bool(frame_tex) and face_px > 0 and p.get('texture_mode') == 'tile' and frame_tex.width() > 0 and frame_tex.height() > 0
+        # Tiled frames bake rounding into their corner sprites; a radius wider than the face still needs the clip
+        if radius_px > 0 and not (tiled and radius_px <= face_px):
             path = QPainterPath()
             path.addRoundedRect(outer_rect, radius_px, radius_px)
             painter.setClipPath(path)
@@ -284,17 +296,18 @@ class FramePreviewLabel(QLabel):
         polys = [QPolygonF([otl, otr, itr, itl]), QPolygonF([obl, obr, ibr, ibl]), 
                  QPolygonF([otl, obl, ibl, itl]), QPolygonF([otr, obr, ibr, itr])] 
 
-        frame_tex = p.get('frame_texture')
         painter.setPen(Qt.PenStyle.NoPen)
         
-        if frame_tex:
+        if tiled:
+            self.composite_frame_ring(painter, frame_tex, render_w, render_h, face_px,
+                                      radius_px if radius_px <= face_px else 0, p.get('frame_texture_tile'),
+                                      p.get('frame_texture_levels'))
+        elif frame_tex:
             tex_h = frame_tex.height()
             tex_w = frame_tex.width()
             if tex_h > 0 and tex_w > 0 and face_px > 0:
-                strip_h = frame_tex.scaled(render_w, face_px, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                strip_h_flip_v = strip_h.transformed(QTransform(1, 0, 0, -1, 0, strip_h.height()))
-                strip_v = frame_tex.transformed(QTransform(0, 1, 1, 0, 0, 0)).scaled(face_px, render_h, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                strip_v_flip_h = strip_v.transformed(QTransform(-1, 0, 0, 1, strip_v.width(), 0))
+                strip_h, strip_h_flip_v, strip_v, strip_v_flip_h = self.get_frame_strips(frame_tex, render_w, render_h, face_px,
+                                                                                        p.get('frame_texture_levels'))
 
                 path = QPainterPath()
                 path.addPolygon(polys[0])
@@ -336,7 +349,8 @@ class FramePreviewLabel(QLabel):
         
         if crop_px.isValid():
             t_w, t_h = math.ceil(paper_rect.width()), math.ceil(paper_rect.height())
-            scaled = orig.copy(crop_px).scaled(QSize(t_w, t_h), Qt.AspectRatioMode.KeepAspectRatioByExpanding, Qt.TransformationMode.SmoothTransformation)
+            scaled = image_cache.get_or_create("preview", ("frame_preview", pixmap_key(orig), _rect_key(crop_px), t_w, t_h),
+                lambda: scaled_pixmap(orig.copy(crop_px), t_w, t_h, Qt.AspectRatioMode.KeepAspectRatioByExpanding, RESAMPLE_PREVIEW))
             
             painter.save()
             img_clip_rect = QRectF(inner_rect.x() + p['mat_left']*scale, inner_rect.y() + p['mat_top']*scale, 
@@ -355,6 +369,109 @@ class FramePreviewLabel(QLabel):
         painter.end()
         self.setPixmap(final)
 
+    def get_frame_strips(self, frame_tex, render_w, render_h, face_px, levels=None):
+        """Returns the four side strips (top, bottom, left, right), cached per texture and size.
+
+        levels are pre-scaled copies of the texture (largest first, from the texture catalog);
+        strips are scaled from the smallest one that is still at least face_px tall.
+        """
+        base = (pixmap_key(frame_tex), render_w, render_h, face_px)
+        for level in levels or []:
+            if level.height() < face_px: break
+            frame_tex = level
+        strip_h = image_cache.get_or_create("texture", base + ("top",),
+            lambda: frame_tex.scaled(render_w, face_px, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation))
+        strip_h_flip_v = image_cache.get_or_create("texture", base + ("bottom",),
+            lambda: strip_h.transformed(QTransform(1, 0, 0, -1, 0, strip_h.height())))
+        strip_v = image_cache.get_or_create("texture", base + ("left",),
+            lambda: frame_tex.transformed(QTransform(0, 1, 1, 0, 0, 0)).scaled(face_px, render_h, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation))
+        strip_v_flip_h = image_cache.get_or_create("texture", base + ("right",),
+            lambda: strip_v.transformed(QTransform(-1, 0, 0, 1, strip_v.width(), 0)))
+        return strip_h, strip_h_flip_v, strip_v, strip_v_flip_h
+
+    def get_frame_tile(self, frame_tex, face_px, tile=None, levels=None):
+        """Seamless (mirrored) tile of the texture scaled to face_px tall, cached per texture and face width.
+
+        Built from the smallest of levels (the catalog's mip chain, largest first) that is still
+        face_px tall; tile is the catalog's precomputed full-resolution tile, used when no level is.
+        """
+        def build():
+            from .texture_library import seamless_tile
+            level = None
+            for l in levels or []:
+                if l.height() < face_px: break
+                level = l
+            if level is not None: src = seamless_tile(level.toImage())
+            else: src = tile if tile is not None else seamless_tile(frame_tex.toImage())
+            w = max(1, round(src.width() * face_px / src.height()))
+            return QPixmap.fromImage(src.scaled(w, face_px, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation))
+        return image_cache.get_or_create("texture", (pixmap_key(frame_tex), "tile", face_px), build)
+
+    def paint_tiled_frame(self, painter, tile, polys, render_w, render_h):
+        """Fills side regions (top, bottom, left, right) of a render_w x render_h frame with the tiled texture.
+
+        The sample's height spans the face and its length repeats along the side at true
+        scale. Each half of a side is anchored at its own corner (the far half mirrored, which
+        is seamless for a mirrored tile), so what is painted near a corner does not depend on
+        the frame's size.
+        """
+        brush = QBrush(tile)
+        w2, h2 = render_w / 2, render_h / 2
+        # (anchored at the first corner, mirrored from the second) tile -> frame mappings per side,
+        # keeping the sample's outer edge on the outside of the frame
+        sides = [((QTransform(), QTransform(-1, 0, 0, 1, render_w, 0)), (QRectF(0, 0, w2, render_h), QRectF(w2, 0, w2, render_h))),
+                 ((QTransform(1, 0, 0, -1, 0, render_h), QTransform(-1, 0, 0, -1, render_w, render_h)),
+                  (QRectF(0, 0, w2, render_h), QRectF(w2, 0, w2, render_h))),
+                 ((QTransform(0, 1, 1, 0, 0, 0), QTransform(0, -1, 1, 0, 0, render_h)),
+                  (QRectF(0, 0, render_w, h2), QRectF(0, h2, render_w, h2))),
+                 ((QTransform(0, 1, -1, 0, render_w, 0), QTransform(0, -1, -1, 0, render_w, render_h)),
+                  (QRectF(0, 0, render_w, h2), QRectF(0, h2, render_w, h2)))]
+        painter.setPen(Qt.PenStyle.NoPen)
+        for poly, (transforms, halves) in zip(polys, sides):
+            for t, half in zip(transforms, halves):
+                part = poly.intersected(QPolygonF(half))
+                if part.isEmpty(): continue
+                brush.setTransform(t)
+                painter.setBrush(brush); painter.drawPolygon(part)
+
+    def get_frame_corners(self, frame_tex, face_px, radius_px, tile=None, levels=None):
+        """9-slice corner sprite: a 2*face_px square frame ring whose quadrants are the four mitered corners.
+
+        Built once per (texture, face width, corner radius) and reused for every frame size.
+        """
+        def build():
+            f = face_px; size = 2 * f
+            img = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+            img.fill(Qt.GlobalColor.transparent)
+            p = QPainter(img)
+            p.setRenderHint(QPainter.RenderHint.Antialiasing)
+            if radius_px > 0:
+                clip = QPainterPath(); clip.addRoundedRect(QRectF(0, 0, size, size), radius_px, radius_px); p.setClipPath(clip)
+            c = QPointF(f, f)
+            polys = [QPolygonF([QPointF(0, 0), QPointF(size, 0), c]), QPolygonF([QPointF(0, size), QPointF(size, size), c]),
+                     QPolygonF([QPointF(0, 0), QPointF(0, size), c]), QPolygonF([QPointF(size, 0), QPointF(size, size), c])]
+            self.paint_tiled_frame(p, self.get_frame_tile(frame_tex, f, tile, levels), polys, size, size)
+            p.setPen(QPen(QColor(0,0,0,50), 1))
+            p.drawLine(QPointF(0, 0), QPointF(size, size)); p.drawLine(QPointF(size, 0), QPointF(0, size))
+            p.end()
+            return QPixmap.fromImage(img)
+        return image_cache.get_or_create("texture", (pixmap_key(frame_tex), "corners", face_px, round(radius_px, 2)), build)
+
+    def composite_frame_ring(self, painter, frame_tex, render_w, render_h, face_px, radius_px=0, tile=None, levels=None):
+        """Draws a tiled frame ring from the cached corner sprite plus brush-filled straight edges."""
+        f = face_px
+        corners = self.get_frame_corners(frame_tex, f, radius_px, tile, levels)
+        painter.drawPixmap(0, 0, corners, 0, 0, f, f)
+        painter.drawPixmap(render_w - f, 0, corners, f, 0, f, f)
+        painter.drawPixmap(0, render_h - f, corners, 0, f, f, f)
+        painter.drawPixmap(render_w - f, render_h - f, corners, f, f, f, f)
+        edges = [QPolygonF(QRectF(f, 0, render_w - 2 * f, f)), QPolygonF(QRectF(f, render_h - f, render_w - 2 * f, f)),
+                 QPolygonF(QRectF(0, f, f, render_h - 2 * f)), QPolygonF(QRectF(render_w - f, f, f, render_h - 2 * f))]
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False) # edges are pixel-aligned rects
+        self.paint_tiled_frame(painter, self.get_frame_tile(frame_tex, f, tile, levels), edges, render_w, render_h)
+        painter.restore()
+
     def resizeEvent(self, event): self.refresh_render(); super().resizeEvent(event)
 
 class CollapsibleBox(QWidget):
@@ -0,0 +1,89 @@
+"""Shared fixtures: a local HTTP stand-in for the Google Photos endpoints.
+
+The app's data directory is pointed at a temporary folder before src is
+imported, and Qt runs offscreen, so the tests never touch the user's caches.
+"""
+import os
+import sys
+import json
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+os.environ['LOCALAPPDATA'] = tempfile.mkdtemp(prefix="frametamer-tests-")
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+PAGES = 3 # listing pages served by the default route
+PAGE_SIZE = 5
+
+def _png():
+    from PyQt6.QtCore import QBuffer, QIODevice
+    from PyQt6.QtGui import QImage, QColor
+    img = QImage(8, 8, QImage.Format.Format_RGB32); img.fill(QColor("#3a6ea5"))
+    buf = QBuffer(); buf.open(QIODevice.OpenModeFlag.WriteOnly); img.save(buf, "PNG")
+    return bytes(buf.data())
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1" # keep-alive, so connection reuse is observable
+
+    def setup(self):
+        super().setup()
+        with self.server.lock: self.server.connections += 1
+
+    def log_message(self, *args): pass
+
+    def _serve(self):
+        length = int(self.headers.get('Content-Length', 0))
+        if length: self.rfile.read(length)
+        with self.server.lock:
+            self.server.requests.append((self.command, self.path))
+            scripted = self.server.script.pop(0) if self.server.script else None
+        status, headers, body = scripted or self.server.route(self)
+        self.send_response(status)
+        for k, v in headers.items(): self.send_header(k, v)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _serve
+
+class StandIn(ThreadingHTTPServer):
+    """Serves paged mediaItems listings and image bytes; counts requests and TCP connections.
+
+    Tests can queue (status, headers, body) tuples in `script` to be answered
+    before falling back to the default route.
+    """
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), _Handler)
+        self.lock = threading.Lock()
+        self.requests = []
+        self.connections = 0
+        self.script = []
+        self.image = _png()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def route(self, handler):
+        parsed = urlparse(handler.path)
+        if parsed.path.endswith("/mediaItems"):
+            page = int(parse_qs(parsed.query).get('pageToken', ['0'])[0])
+            items = [{'id': f"m{page}-{i}", 'baseUrl': f"{self.url}/img/m{page}-{i}"} for i in range(PAGE_SIZE)]
+            data = {'mediaItems': items}
+            if page + 1 < PAGES: data['nextPageToken'] = str(page + 1)
+            return 200, {'Content-Type': "application/json"}, json.dumps(data).encode()
+        return 200, {'Content-Type': "image/png"}, self.image
+
+@pytest.fixture
+def stand_in():
+    server = StandIn()
+    thread = threading.Thread(target=server.serve_forever, daemon=True); thread.start()
+    yield server
+    server.shutdown(); server.server_close()
@@ -0,0 +1,40 @@
+"""Export Set cache keys (user-030): chained resamples must not collide with direct renders."""
+from PyQt6.QtCore import QRectF
+from PyQt6.QtGui import QImage, QColor
+from src.export import export_variants, export_key_fields, output_key, plan_variants
+from src.export_cache import ExportCache
+
+def make_source(tmp_path):
+    img = QImage(1600, 1200, QImage.Format.Format_RGB32) # larger than every target, so each variant is a real resample
+    for y in range(img.height()): # a gradient, so differently resampled outputs really differ
+        for x in range(0, img.width(), 8): img.setPixelColor(x, y, QColor((x * 7) % 256, (y * 5) % 256, (x + y) % 256))
+    path = str(tmp_path / "src.png"); img.save(path)
+    return img, path
+
+def test_chained_variant_key_differs_from_direct_render(tmp_path):
+    img, src = make_source(tmp_path)
+    fields = export_key_fields(src, QRectF(0, 0, 1, 1), 4.0, 3.0)
+    cache = ExportCache(cache_dir=str(tmp_path / "cache"), max_bytes=1 << 26)
+    targets = plan_variants(4.0, 3.0, [300, 150])
+    written = export_variants(lambda: img.copy(), targets, ["PNG"], str(tmp_path), "set", cache=cache, key_fields=fields)
+    assert all(ok for _, ok in written)
+
+    # export_jpg-style direct render of the 150 DPI size must miss the cache: its pixels differ
+    direct = output_key(fields, 600, 450, 150, "PNG", 95)
+    assert not cache.fetch(direct, str(tmp_path / "direct.png"))
+    # The largest variant is a direct render and does share export_jpg's key
+    assert cache.fetch(output_key(fields, 1200, 900, 300, "PNG", 95), str(tmp_path / "hit.png"))
+
+def test_cached_parent_does_not_change_the_chain(tmp_path):
+    img, src = make_source(tmp_path)
+    fields = export_key_fields(src, QRectF(0, 0, 1, 1), 4.0, 3.0)
+    targets = plan_variants(4.0, 3.0, [300, 150])
+    for d in ("fresh", "warm", "warm2"): (tmp_path / d).mkdir()
+    export_variants(lambda: img.copy(), targets, ["PNG"], str(tmp_path / "fresh"), "set",
+                    cache=ExportCache(cache_dir=str(tmp_path / "c1"), max_bytes=1 << 26), key_fields=fields)
+
+    # Only the 300 DPI parent is cached; the 150 DPI output must still be resampled through it
+    warm = ExportCache(cache_dir=str(tmp_path / "c2"), max_bytes=1 << 26)
+    export_variants(lambda: img.copy(), targets[:1], ["PNG"], str(tmp_path / "warm"), "set", cache=warm, key_fields=fields)
+    export_variants(lambda: img.copy(), targets, ["PNG"], str(tmp_path / "warm2"), "set", cache=warm, key_fields=fields)
+    assert QImage(str(tmp_path / "warm2" / "set_150dpi.png")) == QImage(str(tmp_path / "fresh" / "set_150dpi.png"))
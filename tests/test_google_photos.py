@@ -0,0 +1,51 @@
+"""The pooled Session paths (user-031) against the local stand-in server."""
+import types
+from PyQt6.QtCore import Qt
+from src import google_photos
+from src.google_photos import GooglePhotosManager
+from src.photo_cache import PhotoCache
+from src.constants import THUMBNAIL_WORKERS
+
+def make_manager(stand_in, monkeypatch):
+    monkeypatch.setattr(google_photos, 'API_ROOT', stand_in.url)
+    manager = GooglePhotosManager()
+    manager.creds = types.SimpleNamespace(token="test-token", valid=True)
+    return manager
+
+def test_get_image_data_reuses_one_connection(stand_in, monkeypatch):
+    manager = make_manager(stand_in, monkeypatch)
+    for i in range(10):
+        assert manager.get_image_data(f"{stand_in.url}/img/m{i}", width=150, height=150) == stand_in.image
+    assert len(stand_in.requests) == 10
+    assert stand_in.connections == 1
+
+def test_photo_loader_pages_share_a_connection(stand_in, monkeypatch, tmp_path):
+    from src.dialogs import PhotoLoader
+    manager = make_manager(stand_in, monkeypatch)
+    token, pages = "", []
+    for _ in range(3):
+        loader = PhotoLoader(manager, token or None)
+        loader.cache = PhotoCache(cache_dir=str(tmp_path), max_bytes=1 << 20)
+        loader.listed.connect(lambda ids, tok: pages.append((ids, tok)))
+        loader.error.connect(lambda msg: pages.append(msg))
+        loader.run() # synchronously, on the test thread
+        token = pages[-1][1]
+    assert [len(ids) for ids, _ in pages] == [5, 5, 5] and token == ""
+    assert stand_in.connections == 1
+
+def test_thumbnail_fetcher_pool_is_bounded_by_workers(stand_in, monkeypatch, tmp_path):
+    from src.dialogs import ThumbnailFetcher
+    manager = make_manager(stand_in, monkeypatch)
+    ids = [f"m{i}" for i in range(40)]
+    fetcher = ThumbnailFetcher(manager)
+    fetcher.cache = PhotoCache(cache_dir=str(tmp_path), max_bytes=1 << 20)
+    fetcher.cache.update_base_urls({m: f"{stand_in.url}/img/{m}" for m in ids}) # fresh, so no batchGet
+    done = []
+    # Emitted from pool threads; a direct connection collects results without an event loop
+    fetcher.ready.connect(lambda pid, img: done.append((pid, img.isNull())), Qt.ConnectionType.DirectConnection)
+    fetcher.request(ids)
+    fetcher.pool.shutdown(wait=True)
+    assert sorted(done) == sorted((m, False) for m in ids)
+    assert len(stand_in.requests) == len(ids)
+    # Every worker keeps its connection alive: at most one per worker, never one per thumbnail
+    assert stand_in.connections <= THUMBNAIL_WORKERS
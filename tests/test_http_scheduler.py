@@ -0,0 +1,85 @@
+"""RequestScheduler (user-035) against the local stand-in server, which injects throttling."""
+import threading
+import pytest
+from src.http_scheduler import RequestScheduler, TokenBucket
+
+class FakeClock:
+    """Time that only moves when something sleeps, so pacing is measured exactly."""
+    def __init__(self): self.now, self.slept = 0.0, []
+    def __call__(self): return self.now
+    def sleep(self, seconds): self.slept.append(seconds); self.now += seconds
+
+def scheduler(**kwargs):
+    clock = FakeClock()
+    kwargs.setdefault('sleep', clock.sleep)
+    return RequestScheduler(**kwargs), clock
+
+def test_429_honors_retry_after(stand_in):
+    sched, clock = scheduler()
+    stand_in.script = [(429, {'Retry-After': "3"}, b""), (429, {'Retry-After': "1.5"}, b"")]
+    response = sched.get(f"{stand_in.url}/img/a")
+    assert response.status_code == 200 and response.content == stand_in.image
+    assert len(stand_in.requests) == 3
+    assert clock.slept == [3.0, 1.5]
+
+def test_retry_after_is_capped_by_max_delay(stand_in):
+    sched, clock = scheduler(max_delay=10.0)
+    stand_in.script = [(429, {'Retry-After': "3600"}, b"")]
+    assert sched.get(f"{stand_in.url}/img/a").status_code == 200
+    assert clock.slept == [10.0]
+
+def test_exhausted_5xx_retries_return_the_last_response(stand_in):
+    sched, clock = scheduler(max_retries=3, base_delay=0.5)
+    stand_in.script = [(503, {}, b"busy")] * 4
+    response = sched.get(f"{stand_in.url}/img/a")
+    assert response.status_code == 503 # returned, not raised: callers use raise_for_status()
+    assert len(stand_in.requests) == 4
+    # Full-jitter backoff: attempt n waits somewhere in [0, base * 2**n]
+    assert len(clock.slept) == 3
+    assert all(0 <= d <= 0.5 * 2 ** n for n, d in enumerate(clock.slept))
+
+def test_client_errors_are_not_retried(stand_in):
+    sched, clock = scheduler()
+    stand_in.script = [(404, {}, b"")]
+    assert sched.get(f"{stand_in.url}/img/a").status_code == 404
+    assert len(stand_in.requests) == 1 and clock.slept == []
+
+def test_token_bucket_paces_after_the_burst():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10.0, capacity=5, clock=clock, sleep=clock.sleep)
+    for _ in range(25): bucket.acquire()
+    # 5 go out in the burst, the other 20 at 10 per second
+    assert clock.now == pytest.approx(2.0)
+
+def test_scheduler_paces_requests(stand_in):
+    clock = FakeClock()
+    sched = RequestScheduler(rate=20.0, burst=2, sleep=clock.sleep)
+    sched.bucket = TokenBucket(20.0, 2, clock=clock, sleep=clock.sleep)
+    for i in range(12): assert sched.get(f"{stand_in.url}/img/{i}").status_code == 200
+    assert clock.now == pytest.approx(0.5)
+
+def test_streamed_response_holds_its_host_slot_until_closed(stand_in):
+    sched, _ = scheduler(per_host=1)
+    url = f"{stand_in.url}/img/a"
+    response = sched.get(url, stream=True)
+    slot = sched._host_slot(url)
+    assert not slot.acquire(blocking=False) # still held while the body is unread
+    # A second request waits for the slot instead of exceeding the per-host cap
+    second = []
+    t = threading.Thread(target=lambda: second.append(sched.get(url).status_code)); t.start()
+    t.join(0.3)
+    assert t.is_alive() and len(stand_in.requests) == 1
+    response.close()
+    t.join(5)
+    assert second == [200]
+    assert slot.acquire(blocking=False); slot.release()
+
+def test_streamed_response_releases_its_slot_once_read(stand_in):
+    sched, _ = scheduler(per_host=1)
+    url = f"{stand_in.url}/img/a"
+    response = sched.get(url, stream=True)
+    assert b"".join(response.iter_content(64)) == stand_in.image
+    slot = sched._host_slot(url)
+    assert slot.acquire(blocking=False); slot.release()
+    response.close() # closing afterwards must not release the slot a second time
+    assert slot.acquire(blocking=False); slot.release()
@@ -0,0 +1,280 @@
+"""Build-time generator for src/color_table.py (the mat color name table).
+
+The curated names and the generated shade variations used to be built with
+colorsys loops every time src/colors.py was imported. This script runs that
+same generation once and writes the result as packed data, together with a
+nearest-name index, so the app only unpacks a table on first lookup.
+
+    python tools/gen_colors.py          # regenerate src/color_table.py
+    python tools/gen_colors.py --check  # fail if the committed table is stale or the index disagrees with brute force
+"""
+import os
+import sys
+import math
+import colorsys
+from array import array
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OUT_PATH = os.path.join(ROOT, "src", "color_table.py")
+CELL_BITS = 3 # index cells per channel = 2**CELL_BITS
+CELL_SIZE = 256 >> CELL_BITS
+
+def build_colors():
+    """Returns the ordered {name: (r, g, b)} table."""
+    # Standard Curated Colors
+    COLORS = {
+        # Whites & Neutrals
+        "Cotton White": (251, 251, 249),
+        "Bright White": (255, 255, 255),
+        "Paper White": (245, 245, 248),
+        "Snow": (255, 250, 250),
+        "Ivory": (255, 255, 240),
+        "Floral White": (255, 250, 240),
+        "Antique White": (250, 235, 215),
+        "Ghost White": (248, 248, 255),
+        "White Smoke": (245, 245, 245),
+        "Seashell": (255, 245, 238),
+        "Old Lace": (253, 245, 230),
+        "Linen": (250, 240, 230),
+        "Bone": (227, 218, 201),
+        "Parchment": (241, 233, 210),
+        "Eggshell": (240, 234, 214),
+
+        # Grays & Blacks
+        "Ash Gray": (178, 190, 181),
+        "Cool Gray": (144, 164, 174),
+        "Silver": (192, 192, 192),
+        "Pewter": (142, 142, 142),
+        "Slate Gray": (112, 128, 144),
+        "Charcoal": (54, 69, 79),
+        "Steel Gray": (113, 121, 126),
+        "Black": (0, 0, 0),
+        "Jet Black": (52, 52, 52),
+        "Midnight": (44, 62, 80),
+
+        # Earth Tones
+        "Tan": (210, 180, 140),
+        "Sand": (194, 178, 128),
+        "Beige": (245, 245, 220),
+        "Taupe": (72, 60, 50),
+        "Camel": (193, 154, 107),
+        "Oatmeal": (233, 224, 210),
+        "Terracotta": (226, 114, 91),
+        "Umber": (99, 81, 71),
+        "Sienna": (160, 82, 45),
+        "Chocolate": (105, 75, 55),
+        "Walnut": (127, 99, 80),
+        "Dark Walnut": (93, 67, 44),
+        "Mahogany": (192, 64, 0),
+        "Oak": (188, 158, 130),
+        "Cherry Wood": (144, 56, 32),
+        "Wenge": (100, 84, 82),
+        "Birch": (245, 245, 220),
+        "Ebony": (40, 40, 40),
+        "Rosewood": (101, 0, 11),
+        "Charcoal Black": (44, 44, 44),
+        "Painted Black": (26, 26, 26),
+
+        # Blues & Teals
+        "Navy Blue": (0, 0, 128),
+        "Royal Blue": (65, 105, 225),
+        "Sky Blue": (135, 206, 235),
+        "Steel Blue": (70, 130, 180),
+        "Denim": (21, 96, 189),
+        "Oxford Blue": (0, 33, 71),
+        "Teal": (0, 128, 128),
+        "Cyan": (0, 255, 255),
+        "Powder Blue": (176, 224, 230),
+        "Prussian Blue": (0, 49, 83),
+        "Celeste": (178, 255, 255),
+
+        # Greens
+        "Forest Green": (34, 139, 34),
+        "Sage Green": (156, 175, 136),
+        "Olive": (128, 128, 0),
+        "Emerald": (80, 200, 120),
+        "Mint": (189, 252, 201),
+        "Seafoam": (159, 226, 191),
+        "Hunter Green": (53, 94, 59),
+        "Lime": (50, 205, 50),
+        "Kelly Green": (76, 187, 23),
+        "Moss": (138, 154, 91),
+        "Jade": (0, 168, 107),
+
+        # Reds & Pinks
+        "Deep Red": (139, 0, 0),
+        "Burgundy": (128, 0, 32),
+        "Crimson": (220, 20, 60),
+        "Brick": (178, 34, 34),
+        "Wine": (114, 47, 55),
+        "Rose": (255, 0, 127),
+        "Dusty Rose": (194, 115, 127),
+        "Salmon": (250, 128, 114),
+        "Coral": (255, 127, 80),
+
+        # Purples & Pinks
+        "Plum": (142, 69, 133),
+        "Lavender": (230, 230, 250),
+        "Mauve": (224, 176, 255),
+        "Aubergine": (61, 12, 21),
+        "Violet": (143, 0, 255),
+        "Indigo": (75, 0, 130),
+        "Magenta": (255, 0, 255),
+
+        # Oranges & Yellows
+        "Gold": (212, 175, 55),
+        "Sunflower": (255, 196, 0),
+        "Ochre": (204, 119, 34),
+        "Burnt Orange": (204, 85, 0),
+        "Peach": (255, 218, 185),
+        "Amber": (255, 191, 0),
+        "Mustard": (255, 219, 88),
+    }
+
+    # Descriptive Names Generation (Standard Mat Shades)
+
+    BASES = {
+        "Red": (255, 0, 0), "Green": (0, 255, 0), "Blue": (0, 0, 255),
+        "Yellow": (255, 255, 0), "Cyan": (0, 255, 255), "Magenta": (255, 0, 255),
+        "Orange": (255, 165, 0), "Purple": (128, 0, 128), "Pink": (255, 192, 203),
+        "Brown": (165, 42, 42), "Gray": (128, 128, 128), "Tan": (210, 180, 140),
+        "Olive": (128, 128, 0), "Teal": (0, 128, 128), "Cream": (255, 253, 208)
+    }
+
+    # Generate 1000+ variations
+    for b_name, (br, bg, bb) in BASES.items():
+        h, l, s = colorsys.rgb_to_hls(br/255.0, bg/255.0, bb/255.0)
+
+        for s_step in [0.2, 0.4, 0.6, 0.8, 1.0]:
+            for l_step in [0.2, 0.4, 0.6, 0.8, 1.0]:
+                r_v, g_v, b_v = colorsys.hls_to_rgb(h, l_step, s_step)
+                rgb = (int(r_v*255), int(g_v*255), int(b_v*255))
+
+                prefix = ""
+                if l_step < 0.35: prefix = "Dark "
+                elif l_step > 0.65: prefix = "Light "
+
+                if s_step < 0.4: prefix = "Muted " + prefix
+                elif s_step > 0.85: prefix = "Vibrant " + prefix
+
+                name = f"{prefix}{b_name}".strip()
+                if rgb not in COLORS.values() and name not in COLORS:
+                    COLORS[name] = rgb
+
+    # Fine-grained grid
+    for r in range(0, 256, 32):
+        for g in range(0, 256, 32):
+            for b in range(0, 256, 32):
+                rgb = (r, g, b)
+                if rgb not in COLORS.values():
+                    h, l, s = colorsys.rgb_to_hls(r/255.0, g/255.0, b/255.0)
+
+                    hue_name = "Red"
+                    if h < 0.05: hue_name = "Red"
+                    elif h < 0.15: hue_name = "Orange"
+                    elif h < 0.20: hue_name = "Yellow"
+                    elif h < 0.45: hue_name = "Green"
+                    elif h < 0.55: hue_name = "Cyan"
+                    elif h < 0.75: hue_name = "Blue"
+                    elif h < 0.85: hue_name = "Purple"
+                    elif h < 0.95: hue_name = "Magenta"
+                    else: hue_name = "Red"
+
+                    lum = ""
+                    if l < 0.15: lum = "Deep "
+                    elif l < 0.35: lum = "Dark "
+                    elif l > 0.85: lum = "Pale "
+                    elif l > 0.65: lum = "Light "
+
+                    sat = ""
+                    if s < 0.15: 
+                        if l < 0.2: name = "Blackish Shade"
+                        elif l > 0.8: name = "Whitish Shade"
+                        else: name = f"{lum}Gray-ish Shade".strip()
+                    else:
+                        if s < 0.4: sat = "Muted "
+                        elif s > 0.85: sat = "Vibrant "
+                        name = f"{sat}{lum}{hue_name} Shade".strip()
+
+                    if name not in COLORS:
+                        COLORS[name] = rgb
+
+    return COLORS
+
+def distance(c1, c2):
+    """Redmean-weighted RGB distance (same formula as ColorUtils.get_closest_name)."""
+    rmean = (c1[0] + c2[0]) / 2
+    r, g, b = c1[0] - c2[0], c1[1] - c2[1], c1[2] - c2[2]
+    return math.sqrt((((512 + rmean) * r * r) / 256) + 4 * g * g + (((767 - rmean) * b * b) / 256))
+
+def _axis_gap(v, lo, hi):
+    """(min, max) absolute difference between v and any value in [lo, hi]."""
+    near = 0 if lo <= v <= hi else min(abs(v - lo), abs(v - hi))
+    return near, max(abs(v - lo), abs(v - hi))
+
+def build_index(rgbs):
+    """Per cell of the RGB cube, the entries that can be nearest to some color in that cell.
+
+    The redmean weights for red and blue lie in [2, 3], green is 4, so each entry's
+    distance to a cell is bounded below with weights (2, 4, 2) and above with (3, 4, 3).
+    An entry is a candidate when its lower bound does not exceed the smallest upper bound.
+    """
+    n = 1 << CELL_BITS
+    offsets, cands = array('H', [0]), array('H')
+    for ci in range(n):
+        for cj in range(n):
+            for ck in range(n):
+                box = [(c * CELL_SIZE, c * CELL_SIZE + CELL_SIZE - 1) for c in (ci, cj, ck)]
+                bounds = []
+                for rgb in rgbs:
+                    (r0, r1), (g0, g1), (b0, b1) = (_axis_gap(v, lo, hi) for v, (lo, hi) in zip(rgb, box))
+                    bounds.append((math.sqrt(2 * r0 * r0 + 4 * g0 * g0 + 2 * b0 * b0), math.sqrt(3 * r1 * r1 + 4 * g1 * g1 + 3 * b1 * b1)))
+                best_upper = min(u for _, u in bounds)
+                cands.extend(i for i, (lo, _) in enumerate(bounds) if lo <= best_upper)
+                offsets.append(len(cands))
+    return offsets, cands
+
+def render(colors):
+    names = list(colors)
+    rgbs = [colors[n] for n in names]
+    offsets, cands = build_index(rgbs)
+    rgb_bytes = bytes(v for rgb in rgbs for v in rgb)
+    if sys.byteorder == "big": offsets.byteswap(); cands.byteswap()
+    wrap = lambda text: "\n".join(f"    {text[i:i + 96]!r}" for i in range(0, len(text), 96))
+    packed = lambda b: f"bytes.fromhex(\n{wrap(b.hex())}\n)"
+    return (
+        "# Generated by tools/gen_colors.py -- do not edit by hand.\n"
+        f"# {len(names)} colors; index cells: {1 << CELL_BITS} per channel.\n"
+        f"CELL_BITS = {CELL_BITS}\n"
+        f"NAMES = (\n{wrap(chr(10).join(names))}\n)\n"
+        f"RGB = {packed(rgb_bytes)}\n"
+        "# uint16 little-endian: candidate entry indices per cell, and per-cell start offsets into them\n"
+        f"CELL_OFFSETS = {packed(offsets.tobytes())}\n"
+        f"CELL_CANDIDATES = {packed(cands.tobytes())}\n"
+    )
+
+def check(colors):
+    """Committed table matches a fresh build, and indexed lookups match a brute-force scan."""
+    sys.path.insert(0, ROOT)
+    from src import colors as table
+    ok = True
+    if open(OUT_PATH).read() != render(colors):
+        print(f"{OUT_PATH} is out of date; run python tools/gen_colors.py"); ok = False
+    if list(table.COLORS.items()) != list(colors.items()):
+        print("Color names/values differ from the generator"); ok = False
+    items = list(colors.items())
+    for r in range(0, 256, 5):
+        for g in range(0, 256, 5):
+            for b in range(0, 256, 5):
+                exact = min(distance((r, g, b), rgb) for _, rgb in items)
+                got_name, got_dist = table.nearest(r, g, b)
+                if abs(got_dist - exact) > 1e-9 or distance((r, g, b), colors[got_name]) != got_dist:
+                    print(f"Index lookup mismatch at {(r, g, b)}: {got_name} {got_dist} vs {exact}"); return False
+    if ok: print(f"Color table OK ({len(colors)} colors)")
+    return ok
+
+if __name__ == "__main__":
+    colors = build_colors()
+    if "--check" in sys.argv: sys.exit(0 if check(colors) else 1)
+    with open(OUT_PATH, "w") as f: f.write(render(colors))
+    print(f"Wrote {OUT_PATH} ({len(colors)} colors)")